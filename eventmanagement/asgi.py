@@ -9,8 +9,14 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
-
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "eventmanagement.settings")
 
-application = get_asgi_application()
+# Sets up Django and starts the revoked token sync for this server process
+from eventmanagement.wsgi import application as wsgi_application  # noqa: E402
+
+# Imported after Django is set up; the stream needs settings and models
+from events.stream import EventStreamRouter  # noqa: E402
+
+# Only the event stream is served natively over ASGI; the rest of the API
+# runs as WSGI so streamed responses are not buffered
+application = EventStreamRouter(wsgi_application)
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework', # Make sure rest_framework is included
     'rest_framework_simplejwt', # Add simplejwt
     # {{ edit_1 }}
@@ -140,10 +141,20 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Build request.user from access token claims instead of loading it on
+# every request (events.authentication.StatelessJWTAuthentication)
+JWT_STATELESS_AUTHENTICATION = env.bool('JWT_STATELESS_AUTHENTICATION', default=False)
+# Seconds a user loaded on demand for a stateless request stays cached
+AUTH_USER_CACHE_TIMEOUT = env.int('AUTH_USER_CACHE_TIMEOUT', default=60)
+# Seconds before revocations made by other workers are enforced here
+# (events.revocation); 0 disables the background sync thread
+REVOKED_TOKEN_SYNC_INTERVAL = env.int('REVOKED_TOKEN_SYNC_INTERVAL', default=5)
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'events.authentication.StatelessJWTAuthentication' if JWT_STATELESS_AUTHENTICATION
+        else 'events.authentication.RevocableJWTAuthentication',
         # 'rest_framework.authentication.SessionAuthentication', # Keep if you also use session auth
         # 'rest_framework.authentication.BasicAuthentication', # Keep if you also use basic auth
     ),
@@ -156,19 +167,48 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'events.pagination.StandardPagination',
     'PAGE_SIZE': 10,
 }
 
+# Upper bound for the ?page_size= query parameter
+API_MAX_PAGE_SIZE = env.int('API_MAX_PAGE_SIZE', default=100)
+
+# Typeahead suggestions per category returned by /api/autocomplete/
+AUTOCOMPLETE_LIMIT = env.int('AUTOCOMPLETE_LIMIT', default=5)
+AUTOCOMPLETE_MAX_LIMIT = env.int('AUTOCOMPLETE_MAX_LIMIT', default=20)
+# Browsers may reuse a suggestion response for this many seconds
+AUTOCOMPLETE_MAX_AGE = env.int('AUTOCOMPLETE_MAX_AGE', default=60)
+
+# Cache backend, e.g. locmemcache:// or filecache:///var/tmp/eventmanagement
+# The response cache needs a backend shared by every worker and management
+# command; locmemcache:// is private to each process and only suits tests
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+# Versioned response cache for event, track and session reads
+API_RESPONSE_CACHE_ENABLED = env.bool('API_RESPONSE_CACHE_ENABLED', default=True)
+API_RESPONSE_CACHE_TIMEOUT = env.int('API_RESPONSE_CACHE_TIMEOUT', default=300)
+
+# Server-Sent Events change stream served by eventmanagement.asgi
+# Enable the Postgres LISTEN/NOTIFY bridge when running more than one worker
+EVENT_STREAM_PG_NOTIFY = env.bool('EVENT_STREAM_PG_NOTIFY', default=False)
+EVENT_STREAM_HEARTBEAT = env.int('EVENT_STREAM_HEARTBEAT', default=15)
+EVENT_STREAM_QUEUE_SIZE = env.int('EVENT_STREAM_QUEUE_SIZE', default=100)
+
 # JWT settings
 # {{ edit_1 }}
 from datetime import timedelta
 
 SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=5),
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=env.int('JWT_ACCESS_TOKEN_MINUTES', default=5)),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
-    'ROTATE_REFRESH_TOKENS': False,
-    'BLACKLIST_AFTER_ROTATION': False,
+    # Each refresh returns a new refresh token, so active clients never
+    # have to log in again
+    'ROTATE_REFRESH_TOKENS': True,
+    # Rotated refresh tokens are revoked (events.revocation)
+    'BLACKLIST_AFTER_ROTATION': True,
     'UPDATE_LAST_LOGIN': False,
 
     'ALGORITHM': 'HS256',
@@ -185,6 +225,10 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'USER_AUTHENTICATION_RULE': 'rest_framework_simplejwt.authentication.default_user_authentication_rule',
 
+    # Tokens carry the claims StatelessJWTAuthentication builds users from
+    'TOKEN_OBTAIN_SERIALIZER': 'events.authentication.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'events.authentication.ClaimsTokenRefreshSerializer',
+    'TOKEN_VERIFY_SERIALIZER': 'events.authentication.ClaimsTokenVerifySerializer',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
     'TOKEN_USER_CLASS': 'rest_framework_simplejwt.models.TokenUser',
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "eventmanagement.settings")
 
 application = get_wsgi_application()
+
+# Load revoked tokens and keep them synced for this server process
+from events.revocation import revocation_index  # noqa: E402
+
+revocation_index.start()
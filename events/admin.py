@@ -1,10 +1,12 @@
 from django.contrib import admin
-from .models import Event, Track, Session, Registration, SessionRegistration
+from guardian.admin import GuardedModelAdmin
+from .models import Event, Track, Session, Registration, SessionRegistration, WaitlistEntry
 
 # Register your models here.
+# Object permissions tab for granting manage_event to co-organizers and groups
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
-    list_display = ('title', 'start_date', 'end_date', 'venue', 'organizer')
+class EventAdmin(GuardedModelAdmin):
+    list_display = ('title', 'start_date', 'end_date', 'venue', 'organizer', 'capacity', 'confirmed_count')
     list_filter = ('start_date', 'venue')
     search_fields = ('title', 'description', 'venue')
     date_hierarchy = 'start_date'
@@ -17,7 +19,7 @@ class TrackAdmin(admin.ModelAdmin):
 
 @admin.register(Session)
 class SessionAdmin(admin.ModelAdmin):
-    list_display = ('title', 'track', 'speaker', 'start_time', 'end_time')
+    list_display = ('title', 'track', 'speaker', 'start_time', 'end_time', 'capacity', 'attendee_count')
     list_filter = ('track__event', 'track', 'speaker')
     search_fields = ('title', 'description')
 
@@ -31,4 +33,10 @@ class RegistrationAdmin(admin.ModelAdmin):
 class SessionRegistrationAdmin(admin.ModelAdmin):
     list_display = ('session', 'attendee', 'registration_date')
     list_filter = ('session__track__event', 'session')
-    search_fields = ('session__title', 'attendee__username')
\ No newline at end of file
+    search_fields = ('session__title', 'attendee__username')
+
+@admin.register(WaitlistEntry)
+class WaitlistEntryAdmin(admin.ModelAdmin):
+    list_display = ('event', 'session', 'attendee', 'position', 'created_at')
+    list_filter = ('event',)
+    search_fields = ('event__title', 'session__title', 'attendee__username')
\ No newline at end of file
@@ -0,0 +1,71 @@
+from collections import defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from .models import Event, Session, Registration, SessionRegistration
+from .schedule import find_overlaps
+
+AGENDA_EVENTS_KEY = 'events:agenda-events:{}:{}'
+
+
+def agenda_event_ids(user, version):
+    """
+    Return the ids of the events on the user's agenda.
+
+    The ids are cached under the version of the user's scope, which is bumped
+    whenever their registrations change, so they are read with one query per
+    change rather than per request.
+    """
+    key = AGENDA_EVENTS_KEY.format(user.pk, version)
+    event_ids = cache.get(key)
+    if event_ids is None:
+        confirmed = Registration.objects.filter(attendee=user, status='confirmed').values_list('event_id')
+        attending = SessionRegistration.objects.filter(attendee=user).values_list('session__track__event_id')
+        event_ids = sorted(event_id for event_id, in confirmed.union(attending))
+        cache.set(key, event_ids, settings.API_RESPONSE_CACHE_TIMEOUT)
+    return event_ids
+
+
+def build_agenda(user):
+    """
+    Return the user's confirmed events and registered sessions in two queries.
+
+    Each session lists the ids of the other sessions on the agenda it
+    overlaps, found with a sort-and-sweep over all of the user's sessions.
+    """
+    events = list(
+        Event.objects.filter(registrations__attendee=user, registrations__status='confirmed')
+        .order_by('start_date', 'pk')
+        .values('id', 'title', 'start_date', 'end_date', 'venue')
+    )
+    sessions = list(
+        Session.objects.filter(attendees__attendee=user)
+        .order_by('start_time', 'end_time', 'pk')
+        .values(
+            'id', 'title', 'start_time', 'end_time', 'capacity',
+            'track_id', 'track__name', 'track__event_id', 'speaker__username',
+        )
+    )
+
+    conflicts = defaultdict(set)
+    for interval, other in find_overlaps([(s['start_time'], s['end_time'], s['id']) for s in sessions]):
+        conflicts[interval[2]].add(other[2])
+        conflicts[other[2]].add(interval[2])
+
+    return {
+        'events': events,
+        'sessions': [
+            {
+                'id': session['id'],
+                'title': session['title'],
+                'start_time': session['start_time'],
+                'end_time': session['end_time'],
+                'capacity': session['capacity'],
+                'event': session['track__event_id'],
+                'track': {'id': session['track_id'], 'name': session['track__name']},
+                'speaker': session['speaker__username'],
+                'conflicts_with': sorted(conflicts[session['id']]),
+            }
+            for session in sessions
+        ],
+        'has_conflicts': bool(conflicts),
+    }
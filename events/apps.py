@@ -2,4 +2,8 @@ from django.apps import AppConfig
 
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'events'
\ No newline at end of file
+    name = 'events'
+
+    def ready(self):
+        # Register the signal handlers
+        from . import signals, cache, stream  # noqa: F401
@@ -0,0 +1,127 @@
+from django.contrib.auth.models import User
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer, TokenRefreshSerializer, TokenVerifySerializer
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken, UntypedToken
+from .models import CLAIMED_USER_FIELDS, ClaimsUser
+from .revocation import is_token_revoked, revoke_token
+
+
+def add_user_claims(token, user):
+    for name in CLAIMED_USER_FIELDS:
+        token[name] = getattr(user, name)
+    return token
+
+
+def check_not_revoked(token):
+    if is_token_revoked(token):
+        raise TokenError(_('Token is blacklisted'))
+    return token
+
+
+def access_expires_in():
+    # Lets clients refresh shortly before expiry instead of after a 401
+    return int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Issue token pairs carrying the user claims and the access token lifetime."""
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        data['expires_in'] = access_expires_in()
+        return data
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh with one query that re-reads the user claims.
+
+    Role changes reach the next access token, and deactivated users cannot
+    refresh. With ROTATE_REFRESH_TOKENS a new refresh token is returned too,
+    and with BLACKLIST_AFTER_ROTATION the old one is revoked.
+    """
+
+    def validate(self, attrs):
+        refresh = check_not_revoked(self.token_class(attrs['refresh']))
+        user = User.objects.filter(pk=refresh[api_settings.USER_ID_CLAIM], is_active=True).first()
+        if user is None:
+            raise exceptions.AuthenticationFailed(_('User not found or inactive.'), code='user_inactive')
+        add_user_claims(refresh, user)
+        data = {'access': str(refresh.access_token), 'expires_in': access_expires_in()}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                revoke_token(refresh)
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+        return data
+
+
+class ClaimsTokenVerifySerializer(TokenVerifySerializer):
+    """Verify tokens, treating revoked tokens as invalid."""
+
+    def validate(self, attrs):
+        check_not_revoked(UntypedToken(attrs['token']))
+        return {}
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    """Revoke a refresh token and, optionally, the access token issued with it."""
+    refresh = serializers.CharField(write_only=True)
+    access = serializers.CharField(write_only=True, required=False)
+
+    def validate(self, attrs):
+        tokens = [RefreshToken(attrs['refresh'])]
+        if 'access' in attrs:
+            tokens.append(AccessToken(attrs['access']))
+        for token in tokens:
+            revoke_token(token)
+        return {}
+
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that rejects revoked access tokens.
+
+    Revocation is checked against the in-process index in events.revocation,
+    so unrevoked tokens cost no query.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if is_token_revoked(validated_token):
+            raise InvalidToken(_('Token is blacklisted'))
+        return validated_token
+
+
+class StatelessJWTAuthentication(RevocableJWTAuthentication):
+    """
+    Authenticate access tokens without loading the user.
+
+    request.user is a ClaimsUser built from the token's claims, so requests
+    that only need the user's id, username or roles run no user query.
+    Deactivated or deleted users keep access until their token expires.
+    Enabled with the JWT_STATELESS_AUTHENTICATION setting.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+        if not all(name in validated_token for name in CLAIMED_USER_FIELDS):
+            # Issued before tokens carried user claims
+            return super().get_user(validated_token)
+        return ClaimsUser.from_claims(user_id, validated_token)
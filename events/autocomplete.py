@@ -0,0 +1,50 @@
+from django.contrib.auth.models import User
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Collate, Upper
+from .models import Event, Session
+
+
+def _prefix_first(queryset, key, field, query, limit):
+    """
+    Return up to ``limit`` ``{'id', 'label'}`` suggestions, prefix matches first.
+
+    Prefix matches compare ``UPPER(field) COLLATE "C"``, the expression of the
+    prefix indexes, so they are read in index order and the scan stops at the
+    limit. Only when they do not fill the limit are other substring matches
+    added; their ``UPPER(field) LIKE '%Q%'`` uses the ``UPPER(field)
+    gin_trgm_ops`` indexes where pg_trgm exists.
+    """
+    rows = list(
+        queryset.annotate(sort_key=Collate(Upper(field), 'C'))
+        .filter(sort_key__startswith=query.upper())
+        .order_by('sort_key')[:limit]
+    )
+    if len(rows) < limit:
+        rows += list(
+            queryset.filter(**{f'{field}__icontains': query})
+            .exclude(**{f'{field}__istartswith': query})
+            .order_by()[:limit - len(rows)]
+        )
+    return [{'id': row[key], 'label': row[field]} for row in rows]
+
+
+def suggest_events(query, limit):
+    return _prefix_first(Event.objects.values('id', 'title'), 'id', 'title', query, limit)
+
+
+def suggest_venues(query, limit):
+    # Venues are plain strings; the label doubles as the ?venue= filter value
+    return _prefix_first(Event.objects.values('venue').distinct(), 'venue', 'venue', query, limit)
+
+
+def suggest_speakers(query, limit):
+    speakers = User.objects.filter(Exists(Session.objects.filter(speaker=OuterRef('pk'))))
+    return _prefix_first(speakers.values('id', 'username'), 'id', 'username', query, limit)
+
+
+def autocomplete(query, limit):
+    return {
+        'events': suggest_events(query, limit),
+        'venues': suggest_venues(query, limit),
+        'speakers': suggest_speakers(query, limit),
+    }
@@ -0,0 +1,189 @@
+from collections import defaultdict
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from guardian.core import ObjectPermissionChecker
+from .signals import notify_event_changed
+from .models import Event, Registration, adjust_counter
+from .permissions import manages_event, prefetch_event_permissions
+
+# Number of rows written per statement by the bulk registration operations
+BULK_CHUNK_SIZE = 500
+
+
+def chunked(items, size=BULK_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _unique(ids):
+    return list(dict.fromkeys(ids))
+
+
+def _group_by_event(ids, results, allowed, checker):
+    """
+    Load the requested registrations once and group the actionable ones by event.
+
+    ``allowed`` receives each registration and returns None if it can be
+    processed, or a result code to report for it instead. The checker's
+    permissions on all the events are prefetched first, so ``allowed`` can
+    test them without a query per event.
+    """
+    registrations = Registration.objects.select_related('event').in_bulk(ids)
+    prefetch_event_permissions(checker, {r.event_id: r.event for r in registrations.values()}.values())
+    events = {}
+    grouped = defaultdict(list)
+    for pk in ids:
+        registration = registrations.get(pk)
+        if registration is None:
+            results[pk] = 'not_found'
+            continue
+        code = allowed(registration)
+        if code:
+            results[pk] = code
+            continue
+        events[registration.event_id] = registration.event
+        grouped[registration.event_id].append(registration)
+    return events, grouped
+
+
+def bulk_approve(ids, user, checker=None):
+    """
+    Confirm many registrations, validating each event's capacity once.
+
+    Registrations beyond the free seats of their event are reported as ``full``.
+    """
+    ids = _unique(ids)
+    results = {}
+    checker = checker or ObjectPermissionChecker(user)
+
+    def allowed(registration):
+        if not manages_event(checker, registration.event):
+            return 'forbidden'
+        if registration.status == 'confirmed':
+            return 'already_confirmed'
+        return None
+
+    with transaction.atomic():
+        events, grouped = _group_by_event(ids, results, allowed, checker)
+        for event_id, registrations in grouped.items():
+            # Lock the event row so concurrent approvals cannot take the same seats
+            event = Event.objects.select_for_update().only('capacity', 'confirmed_count').get(pk=event_id)
+            free = max(event.capacity - event.confirmed_count, 0)
+            admitted = [registration.pk for registration in registrations[:free]]
+            attendee_ids = [registration.attendee_id for registration in registrations[:free]]
+            for registration in registrations[free:]:
+                results[registration.pk] = 'full'
+            confirmed = 0
+            for chunk in chunked(admitted):
+                confirmed += Registration.objects.filter(pk__in=chunk).exclude(
+                    status='confirmed'
+                ).update(status='confirmed')
+                results.update((pk, 'approved') for pk in chunk)
+            if confirmed:
+                Event.objects.filter(pk=event_id).update(confirmed_count=F('confirmed_count') + confirmed)
+                notify_event_changed(event_id, 'capacity', attendee_ids)
+    return [{'id': pk, 'result': results[pk]} for pk in ids]
+
+
+def bulk_cancel(ids, user, checker=None):
+    """
+    Cancel many registrations as their attendee or an event organizer.
+
+    Seats freed by confirmed registrations are handed to the event waitlist.
+    """
+    ids = _unique(ids)
+    results = {}
+    checker = checker or ObjectPermissionChecker(user)
+
+    def allowed(registration):
+        if registration.attendee_id != user.pk and not manages_event(checker, registration.event):
+            return 'forbidden'
+        if registration.status == 'cancelled':
+            return 'already_cancelled'
+        return None
+
+    with transaction.atomic():
+        events, grouped = _group_by_event(ids, results, allowed, checker)
+        for event_id, registrations in grouped.items():
+            freed = 0
+            for chunk in chunked([registration.pk for registration in registrations]):
+                freed += Registration.objects.filter(pk__in=chunk, status='confirmed').update(status='cancelled')
+                Registration.objects.filter(pk__in=chunk).exclude(status='cancelled').update(status='cancelled')
+                results.update((pk, 'cancelled') for pk in chunk)
+            if freed:
+                adjust_counter(Event, event_id, 'confirmed_count', -freed)
+                events[event_id].promote_waitlist()
+            notify_event_changed(event_id, 'capacity', [registration.attendee_id for registration in registrations])
+    return [{'id': pk, 'result': results[pk]} for pk in ids]
+
+
+def _registered_attendees(event, user_ids):
+    return set(
+        Registration.objects.filter(event=event, attendee_id__in=user_ids).values_list('attendee_id', flat=True)
+    )
+
+
+def bulk_register(event, user_ids, status='pending'):
+    """
+    Register many users for an event on the organizer's behalf.
+
+    As with single registrations, nobody is registered once the event is
+    full. Confirmed registrations are admitted up to the event's free
+    seats; the remaining users are reported as ``full``. Users registered
+    concurrently are reported as ``already_registered``.
+    """
+    user_ids = _unique(user_ids)
+    results = {}
+    registration_ids = {}
+
+    with transaction.atomic():
+        existing_users = set(User.objects.filter(pk__in=user_ids).values_list('pk', flat=True))
+        already_registered = _registered_attendees(event, user_ids)
+        candidates = []
+        for user_id in user_ids:
+            if user_id not in existing_users:
+                results[user_id] = 'not_found'
+            elif user_id in already_registered:
+                results[user_id] = 'already_registered'
+            else:
+                candidates.append(user_id)
+
+        created = []
+        if candidates:
+            locked = Event.objects.select_for_update().only('capacity', 'confirmed_count').get(pk=event.pk)
+            free = max(locked.capacity - locked.confirmed_count, 0)
+            if status != 'confirmed' and free:
+                free = len(candidates)
+            while True:
+                admitted = candidates[:free]
+                try:
+                    with transaction.atomic():
+                        created = Registration.objects.bulk_create(
+                            [Registration(event=event, attendee_id=user_id, status=status) for user_id in admitted],
+                            batch_size=BULK_CHUNK_SIZE
+                        )
+                    break
+                except IntegrityError:
+                    # Some users registered themselves since they were checked
+                    taken = _registered_attendees(event, admitted)
+                    if not taken:
+                        raise
+                    for user_id in taken:
+                        results[user_id] = 'already_registered'
+                    candidates = [user_id for user_id in candidates if user_id not in taken]
+            for user_id in candidates[free:]:
+                results[user_id] = 'full'
+
+        for registration in created:
+            results[registration.attendee_id] = 'registered'
+            registration_ids[registration.attendee_id] = registration.pk
+        if status == 'confirmed' and created:
+            Event.objects.filter(pk=event.pk).update(confirmed_count=F('confirmed_count') + len(created))
+        if created:
+            notify_event_changed(event.pk, 'capacity', [registration.attendee_id for registration in created])
+
+    return [
+        {'user_id': user_id, 'result': results[user_id], 'id': registration_ids.get(user_id)}
+        for user_id in user_ids
+    ]
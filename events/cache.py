@@ -0,0 +1,235 @@
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache, caches, DEFAULT_CACHE_ALIAS
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+from .signals import event_changed
+from .streaming import wants_stream
+
+KEY_PREFIX = 'events:response'
+VERSION_KEY = 'events:version:{}'
+MODIFIED_KEY = 'events:modified:{}'
+STATS_KEY = 'events:stats:{}'
+# Version scope shared by every collection (list) response
+ALL_EVENTS = 'all'
+
+
+def user_scope(user_id):
+    """Version scope bumped when the user's own registrations change."""
+    return f'user:{user_id}'
+
+
+def _version_key(scope):
+    return VERSION_KEY.format(scope)
+
+
+def get_version(scope):
+    key = _version_key(scope)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so an evicted counter never reuses an old version
+        cache.add(key, int(time.time() * 1000), None)
+        version = cache.get(key)
+    return version
+
+
+def get_last_modified(scope):
+    """Return the time the scope's version last changed, as a Unix timestamp."""
+    key = MODIFIED_KEY.format(scope)
+    modified = cache.get(key)
+    if modified is None:
+        cache.add(key, int(time.time()), None)
+        modified = cache.get(key)
+    return modified
+
+
+def bump_version(scope):
+    try:
+        cache.incr(_version_key(scope))
+    except ValueError:
+        get_version(scope)
+    cache.set(MODIFIED_KEY.format(scope), int(time.time()), None)
+
+
+def invalidate_event(event_id):
+    """Invalidate cached responses for one event and for every collection."""
+    bump_version(ALL_EVENTS)
+    if event_id is not None:
+        bump_version(event_id)
+
+
+def _record(outcome):
+    try:
+        cache.incr(STATS_KEY.format(outcome))
+    except ValueError:
+        cache.add(STATS_KEY.format(outcome), 0, None)
+        cache.incr(STATS_KEY.format(outcome))
+
+
+def cache_stats():
+    """Return the response cache hit and miss counters."""
+    hits = cache.get(STATS_KEY.format('hit')) or 0
+    misses = cache.get(STATS_KEY.format('miss')) or 0
+    return {'hits': hits, 'misses': misses}
+
+
+def reset_cache_stats():
+    cache.delete_many([STATS_KEY.format('hit'), STATS_KEY.format('miss')])
+
+
+def cache_is_shared():
+    """
+    Return whether other processes see this process's cache entries.
+
+    Versions and counters bumped by one worker or management command reach
+    the others only through a shared backend.
+    """
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+class ConditionalResponseMixin:
+    """
+    Answer GET requests with strong ``ETag`` and ``Last-Modified`` validators
+    derived from the version of the event (or collection) being read.
+
+    The validators come from the cache alone. Before a matching
+    ``If-None-Match`` or ``If-Modified-Since`` returns ``304`` on a detail
+    route, the object is resolved so that missing or forbidden objects still
+    answer ``404`` or ``403``; collections return ``304`` without a query.
+    """
+    # Responses that depend on the requesting user must be validated per user
+    cache_vary_on_user = False
+    # URL kwarg holding the event id the response belongs to
+    cache_event_kwarg = 'event_pk'
+
+    def get_cache_event_id(self):
+        return self.kwargs.get(self.cache_event_kwarg)
+
+    def get_cache_scope(self):
+        event_id = self.get_cache_event_id()
+        return event_id if event_id is not None else ALL_EVENTS
+
+    def get_cache_scopes(self):
+        """Return every scope whose version the response depends on."""
+        return [self.get_cache_scope()]
+
+    def get_request_fingerprint(self):
+        params = sorted(self.request.query_params.lists())
+        user = self.request.user.pk if self.cache_vary_on_user else None
+        raw = repr((self.basename, self.action, sorted(self.kwargs.items()), params, user))
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def get_validators(self):
+        """Return ``(version, etag, last_modified)`` for the current request."""
+        if not hasattr(self, '_validators'):
+            scopes = self.get_cache_scopes()
+            # Read the version before building the response so concurrent
+            # writes can only make the validators stale, never too new.
+            version = '.'.join(str(get_version(scope)) for scope in scopes)
+            etag = '"%s"' % hashlib.md5(f'{self.get_request_fingerprint()}:{version}'.encode()).hexdigest()
+            self._validators = (version, etag, max(get_last_modified(scope) for scope in scopes))
+        return self._validators
+
+    def is_not_modified(self, etag, last_modified):
+        if_none_match = self.request.headers.get('If-None-Match')
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            return '*' in etags or etag in etags or f'W/{etag}' in etags
+        if_modified_since = parse_http_date_safe(self.request.headers.get('If-Modified-Since', ''))
+        return if_modified_since is not None and last_modified <= if_modified_since
+
+    def check_resource(self):
+        """Raise unless the requested object exists and may be read."""
+        if getattr(self, 'detail', False):
+            self.get_object()
+
+    def conditional_response(self, build):
+        if self.request.method not in ('GET', 'HEAD') or wants_stream(self.request):
+            return build()
+        version, etag, last_modified = self.get_validators()
+        headers = {'ETag': etag, 'Last-Modified': http_date(last_modified)}
+        if self.is_not_modified(etag, last_modified):
+            self.check_resource()
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response = build()
+        if response.status_code == status.HTTP_200_OK:
+            for header, value in headers.items():
+                response[header] = value
+        return response
+
+
+class ConditionalGetMixin(ConditionalResponseMixin):
+    """Answer the list and retrieve actions conditionally."""
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs))
+
+
+class ResponseCacheMixin(ConditionalResponseMixin):
+    """
+    Cache the data of successful GET responses, keyed by the view, the
+    query parameters and the version of the event the response belongs to.
+
+    Versions are bumped on every ``event_changed`` signal, so stale entries
+    are never served and simply age out of the cache backend. Viewsets
+    without list and retrieve actions use this mixin directly.
+    """
+    cache_timeout = settings.API_RESPONSE_CACHE_TIMEOUT
+
+    def get_response_cache_key(self):
+        version = self.get_validators()[0]
+        return f'{KEY_PREFIX}:{self.get_cache_scope()}:{version}:{self.get_request_fingerprint()}'
+
+    def check_resource(self):
+        # Entries are only cached from 200 responses to this same request
+        if settings.API_RESPONSE_CACHE_ENABLED and cache.get(self.get_response_cache_key()) is not None:
+            return
+        super().check_resource()
+
+    def conditional_response(self, build):
+        if not settings.API_RESPONSE_CACHE_ENABLED:
+            return super().conditional_response(build)
+        return super().conditional_response(lambda: self.cached_build(build))
+
+    def cached_build(self, build):
+        key = self.get_response_cache_key()
+        data = cache.get(key)
+        if data is not None:
+            _record('hit')
+            return Response(data, headers={'X-Cache': 'HIT'})
+        response = build()
+        # Streamed responses, such as calendar feeds, have no data to store
+        if response.status_code == status.HTTP_200_OK and hasattr(response, 'data'):
+            _record('miss')
+            cache.set(key, response.data, self.cache_timeout)
+            response['X-Cache'] = 'MISS'
+        return response
+
+
+class CachedResponseMixin(ResponseCacheMixin, ConditionalGetMixin):
+    """Cache the list and retrieve actions of a viewset."""
+
+
+@receiver(event_changed)
+def invalidate_changed_event(sender, event_id, attendee_ids=(), **kwargs):
+    def invalidate():
+        invalidate_event(event_id)
+        for user_id in set(attendee_ids):
+            bump_version(user_scope(user_id))
+
+    # A read between a bump and the commit caches pre-commit data under the
+    # new version, so versions are bumped again once the write is visible.
+    # Bumping inside the transaction as well keeps the writer's own reads
+    # from hitting entries it has just made stale.
+    if transaction.get_connection().in_atomic_block:
+        invalidate()
+    transaction.on_commit(invalidate)
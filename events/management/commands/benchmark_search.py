@@ -0,0 +1,120 @@
+import statistics
+import time
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchRank
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import F, Q
+from events.autocomplete import autocomplete
+from events.models import Event
+from events.search import prefix_query, SEARCH_CONFIG
+
+WORDS = [
+    'python', 'django', 'postgres', 'cloud', 'security', 'design', 'data', 'music',
+    'startup', 'robotics', 'health', 'finance', 'climate', 'gaming', 'mobile', 'web',
+    'summit', 'meetup', 'workshop', 'conference', 'festival', 'hackathon', 'forum', 'expo',
+]
+
+INSERT_SQL = """
+INSERT INTO events_event (
+    title, description, start_date, end_date, venue, capacity,
+    confirmed_count, prevent_double_booking, created_at, updated_at, organizer_id
+)
+SELECT
+    initcap(w.a) || ' ' || initcap(w.b) || ' ' || i,
+    'A ' || w.a || ' ' || w.b || ' gathering about ' || w.c || ' and ' || w.a || ' number ' || i,
+    now() + i * interval '1 minute',
+    now() + i * interval '1 minute' + interval '1 day',
+    'Venue ' || (i %% 5000),
+    100, 0, false, now(), now(), %(organizer)s
+FROM generate_series(1, %(rows)s) AS i,
+LATERAL (SELECT
+    (%(words)s::text[])[1 + (i * 7) %% %(count)s] AS a,
+    (%(words)s::text[])[1 + (i * 13) %% %(count)s] AS b,
+    (%(words)s::text[])[1 + (i * 31) %% %(count)s] AS c
+) AS w
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares ILIKE search with the tsvector full-text search, and times the '
+        'autocomplete queries, over a synthetic events table. Rows are rolled back '
+        'afterwards unless --keep is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000, help='Synthetic events to insert')
+        parser.add_argument('--runs', type=int, default=5, help='Timed runs per query')
+        parser.add_argument(
+            '--term', action='append', dest='terms',
+            help='Search term to benchmark; may be repeated (default: a few sample terms)',
+        )
+        parser.add_argument('--keep', action='store_true', help='Keep the synthetic rows')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The search benchmark requires PostgreSQL')
+        terms = options['terms'] or ['robotics', 'clim', 'python summit', 'venue 42']
+
+        with transaction.atomic():
+            organizer, _ = User.objects.get_or_create(username='search_benchmark')
+            started = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute(INSERT_SQL, {
+                    'organizer': organizer.pk,
+                    'rows': options['rows'],
+                    'words': WORDS,
+                    'count': len(WORDS),
+                })
+                cursor.execute('ANALYZE events_event')
+            self.stdout.write(
+                f"Inserted {options['rows']} events in {time.perf_counter() - started:.1f}s "
+                f"(text search configuration: {SEARCH_CONFIG})"
+            )
+
+            for term in terms:
+                ilike = Event.objects.filter(
+                    Q(title__icontains=term) | Q(description__icontains=term) | Q(venue__icontains=term)
+                )
+                query = prefix_query([term])
+                # Same ordering the API uses for each backend
+                full_text = Event.objects.filter(search_vector=query).annotate(
+                    search_rank=SearchRank(F('search_vector'), query)
+                ).order_by('-search_rank', '-start_date')
+                for label, queryset in (('ilike', ilike.order_by('-start_date')), ('tsvector', full_text)):
+                    page = queryset.values_list('pk', flat=True)[:10]
+                    timings = []
+                    for _ in range(options['runs']):
+                        # A paginated API response runs a COUNT and fetches one page
+                        run_started = time.perf_counter()
+                        queryset.count()
+                        list(page.all())
+                        timings.append((time.perf_counter() - run_started) * 1000)
+                    plan = page.explain().splitlines()
+                    self.stdout.write(
+                        f'{term!r:>16} {label:>12}: median {statistics.median(timings):8.1f} ms'
+                        f'  [{_scan(plan)}]'
+                    )
+                if len(term) >= 2:
+                    timings = []
+                    for _ in range(options['runs']):
+                        run_started = time.perf_counter()
+                        autocomplete(term, settings.AUTOCOMPLETE_LIMIT)
+                        timings.append((time.perf_counter() - run_started) * 1000)
+                    self.stdout.write(
+                        f'{term!r:>16} {"autocomplete":>12}: median {statistics.median(timings):8.1f} ms'
+                    )
+
+            if not options['keep']:
+                transaction.set_rollback(True)
+                self.stdout.write(self.style.SUCCESS('Synthetic events rolled back'))
+
+
+def _scan(plan):
+    # Report the access path Postgres picked for the events table
+    for line in plan:
+        if 'events_event' in line:
+            return line.strip().lstrip('-> ').split('  ')[0]
+    return plan[0].strip()
@@ -0,0 +1,114 @@
+import statistics
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+from events.models import Session
+
+INSERT_SQL = """
+INSERT INTO events_event (
+    title, description, start_date, end_date, venue, capacity,
+    confirmed_count, prevent_double_booking, created_at, updated_at, organizer_id
+)
+SELECT 'Visibility Event ' || i, 'Synthetic event', now(), now() + interval '30 days',
+       'Venue', 1000000, 0, false, now(), now(), %(organizer)s
+FROM generate_series(1, %(events)s) AS i;
+
+INSERT INTO events_track (event_id, name, description)
+SELECT id, 'Main', '' FROM events_event WHERE organizer_id = %(organizer)s;
+
+INSERT INTO events_session (track_id, title, description, start_time, end_time, attendee_count)
+SELECT t.id, 'Session ' || s, '', now() + s * interval '1 hour', now() + s * interval '1 hour' + interval '45 minutes', 0
+FROM events_track t
+JOIN events_event e ON e.id = t.event_id AND e.organizer_id = %(organizer)s
+CROSS JOIN generate_series(1, %(sessions)s) AS s;
+
+INSERT INTO auth_user (
+    username, password, is_superuser, first_name, last_name, email, is_staff, is_active, date_joined
+)
+SELECT 'visibility_attendee_' || a, '', false, '', '', '', false, true, now()
+FROM generate_series(1, %(attendees)s) AS a;
+
+-- Every synthetic attendee is confirmed for every event
+INSERT INTO events_registration (event_id, attendee_id, status, registration_date, notes)
+SELECT e.id, u.id, 'confirmed', now(), ''
+FROM events_event e
+JOIN auth_user u ON u.username LIKE 'visibility_attendee_%%'
+WHERE e.organizer_id = %(organizer)s;
+
+-- The benchmarked user is confirmed for the first events only
+INSERT INTO events_registration (event_id, attendee_id, status, registration_date, notes)
+SELECT id, %(user)s, 'confirmed', now(), ''
+FROM events_event WHERE organizer_id = %(organizer)s
+ORDER BY id LIMIT %(registrations)s;
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the old OR-join + DISTINCT session visibility filter with '
+        'Session.objects.visible_to() over synthetic data. Rows are rolled back '
+        'afterwards unless --keep is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=2000, help='Synthetic events to insert')
+        parser.add_argument('--sessions', type=int, default=10, help='Sessions per event')
+        parser.add_argument('--attendees', type=int, default=100, help='Other attendees confirmed for every event')
+        parser.add_argument(
+            '--registrations', type=int, default=1000,
+            help='Events the benchmarked user is confirmed for',
+        )
+        parser.add_argument('--runs', type=int, default=5, help='Timed runs per query')
+        parser.add_argument('--keep', action='store_true', help='Keep the synthetic rows')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The visibility benchmark requires PostgreSQL')
+
+        with transaction.atomic():
+            organizer, _ = User.objects.get_or_create(username='visibility_benchmark')
+            user, _ = User.objects.get_or_create(username='visibility_benchmark_user')
+            started = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute(INSERT_SQL, {
+                    'organizer': organizer.pk,
+                    'user': user.pk,
+                    'events': options['events'],
+                    'sessions': options['sessions'],
+                    'attendees': options['attendees'],
+                    'registrations': options['registrations'],
+                })
+                for table in ('auth_user', 'events_event', 'events_track', 'events_session', 'events_registration'):
+                    cursor.execute(f'ANALYZE {table}')
+            self.stdout.write(
+                f"Inserted {options['events']} events with {options['sessions']} sessions and "
+                f"{options['attendees'] + 1} attendees each in {time.perf_counter() - started:.1f}s"
+            )
+
+            # The filter SessionViewSet used before visible_to()
+            or_distinct = Session.objects.filter(
+                Q(track__event__organizer=user) |
+                Q(track__event__registrations__attendee=user, track__event__registrations__status='confirmed')
+            ).distinct()
+            strategies = (('or+distinct', or_distinct), ('exists', Session.objects.visible_to(user)))
+            counts = set()
+            for label, queryset in strategies:
+                queryset = queryset.order_by('start_time', 'pk')
+                page = queryset.values_list('pk', flat=True)[:10]
+                timings = []
+                for _ in range(options['runs']):
+                    # A paginated API response runs a COUNT and fetches one page
+                    run_started = time.perf_counter()
+                    counts.add(queryset.count())
+                    list(page.all())
+                    timings.append((time.perf_counter() - run_started) * 1000)
+                self.stdout.write(f'{label:>12}: median {statistics.median(timings):8.1f} ms')
+            if len(counts) != 1:
+                raise CommandError(f'Strategies disagree on the visible sessions: {sorted(counts)}')
+            self.stdout.write(f'Both strategies see {counts.pop()} sessions')
+
+            if not options['keep']:
+                transaction.set_rollback(True)
+                self.stdout.write(self.style.SUCCESS('Synthetic rows rolled back'))
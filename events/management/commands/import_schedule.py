@@ -0,0 +1,48 @@
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from events.models import Event
+from events.schedule import ScheduleImportError, import_schedule, parse_schedule
+
+
+class Command(BaseCommand):
+    help = 'Imports a whole event schedule from a CSV or JSON file in one transaction'
+
+    def add_arguments(self, parser):
+        parser.add_argument('event_id', type=int, help='Event to import the sessions into')
+        parser.add_argument('path', help='CSV or JSON file with track, title, start_time and end_time columns')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'json'],
+            help='File format (default: taken from the file extension)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate the schedule without importing it',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            event = Event.objects.get(pk=options['event_id'])
+        except Event.DoesNotExist:
+            raise CommandError(f"Event {options['event_id']} does not exist")
+        path = Path(options['path'])
+        fmt = options['format'] or ('json' if path.suffix.lower() == '.json' else 'csv')
+        try:
+            rows = parse_schedule(path.read_text(encoding='utf-8-sig'), fmt)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'Could not read schedule: {exc}')
+
+        try:
+            summary = import_schedule(event, rows, dry_run=options['dry_run'])
+        except ScheduleImportError as exc:
+            for error in exc.errors:
+                row = f"row {error['row']}" if error['row'] else 'schedule'
+                self.stderr.write(f"{row}: {error['errors']}")
+            raise CommandError(f'Schedule not imported: {exc}')
+
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        tracks = ', '.join(summary['tracks_created']) or 'none'
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {summary['sessions_created']} session(s) into {event}; new tracks: {tracks}"
+        ))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from events.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = 'Deletes revoked tokens that have expired and no longer need to be rejected'
+
+    def handle(self, *args, **options):
+        deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} expired revoked token(s)'))
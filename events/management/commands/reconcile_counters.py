@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from events.models import Event, Session, Registration, SessionRegistration
+
+
+def confirmed_count_subquery():
+    return Coalesce(Subquery(
+        Registration.objects.filter(event=OuterRef('pk'), status='confirmed')
+        .order_by().values('event').annotate(total=Count('pk')).values('total')
+    ), 0)
+
+
+def attendee_count_subquery():
+    return Coalesce(Subquery(
+        SessionRegistration.objects.filter(session=OuterRef('pk'))
+        .order_by().values('session').annotate(total=Count('pk')).values('total')
+    ), 0)
+
+
+class Command(BaseCommand):
+    help = 'Recomputes denormalized registration counters that have drifted from the registration tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted rows without updating them',
+        )
+
+    def handle(self, *args, **options):
+        targets = [
+            (Event, 'confirmed_count', confirmed_count_subquery),
+            (Session, 'attendee_count', attendee_count_subquery),
+        ]
+        with transaction.atomic():
+            for model, field, subquery in targets:
+                drifted = model.objects.annotate(actual=subquery()).exclude(**{field: F('actual')})
+                if options['dry_run']:
+                    fixed = drifted.count()
+                else:
+                    # One UPDATE per table, restricted to the rows that drifted
+                    fixed = model.objects.filter(pk__in=drifted.values('pk')).update(**{field: subquery()})
+                verb = 'Found' if options['dry_run'] else 'Reconciled'
+                self.stdout.write(self.style.SUCCESS(
+                    f'{verb} {fixed} drifted {model._meta.verbose_name} {field} value(s)'
+                ))
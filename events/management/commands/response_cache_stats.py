@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from events.cache import cache_is_shared, cache_stats, reset_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Reports hit and miss counters of the API response cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Reset the counters after reporting them',
+        )
+
+    def handle(self, *args, **options):
+        if not cache_is_shared():
+            raise CommandError(
+                'The cache backend is private to each process, so the server\'s counters '
+                'cannot be read from here. Set CACHE_URL to a shared backend such as '
+                'filecache:///var/tmp/eventmanagement.'
+            )
+        stats = cache_stats()
+        total = stats['hits'] + stats['misses']
+        ratio = stats['hits'] / total if total else 0
+        self.stdout.write(f"hits: {stats['hits']}  misses: {stats['misses']}  hit ratio: {ratio:.1%}")
+        if options['reset']:
+            reset_cache_stats()
+            self.stdout.write(self.style.SUCCESS('Response cache counters reset'))
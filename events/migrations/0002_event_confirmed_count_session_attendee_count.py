@@ -0,0 +1,41 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    Session = apps.get_model('events', 'Session')
+    Registration = apps.get_model('events', 'Registration')
+    SessionRegistration = apps.get_model('events', 'SessionRegistration')
+
+    confirmed = Registration.objects.filter(
+        event=OuterRef('pk'), status='confirmed'
+    ).order_by().values('event').annotate(total=Count('pk')).values('total')
+    Event.objects.update(confirmed_count=Coalesce(Subquery(confirmed), 0))
+
+    attendees = SessionRegistration.objects.filter(
+        session=OuterRef('pk')
+    ).order_by().values('session').annotate(total=Count('pk')).values('total')
+    Session.objects.update(attendee_count=Coalesce(Subquery(attendees), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='confirmed_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='session',
+            name='attendee_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.20 on 2026-10-17 06:04
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('events', '0002_event_confirmed_count_session_attendee_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('attendee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_entries', to=settings.AUTH_USER_MODEL)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist', to='events.event')),
+                ('session', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='waitlist', to='events.session')),
+            ],
+            options={
+                'ordering': ['position', 'id'],
+                'indexes': [models.Index(condition=models.Q(('session__isnull', True)), fields=['event', 'position'], name='waitlist_event_position_idx'), models.Index(condition=models.Q(('session__isnull', False)), fields=['session', 'position'], name='waitlist_session_position_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='waitlistentry',
+            constraint=models.UniqueConstraint(condition=models.Q(('session__isnull', True)), fields=('event', 'attendee'), name='unique_event_waitlist_entry'),
+        ),
+        migrations.AddConstraint(
+            model_name='waitlistentry',
+            constraint=models.UniqueConstraint(fields=('session', 'attendee'), name='unique_session_waitlist_entry'),
+        ),
+    ]
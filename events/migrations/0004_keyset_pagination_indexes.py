@@ -0,0 +1,25 @@
+# Generated by Django 4.2.20 on 2026-10-17 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_waitlistentry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_date', 'id'], name='event_start_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['registration_date', 'id'], name='registration_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sessionregistration',
+            index=models.Index(fields=['registration_date', 'id'], name='session_reg_date_id_idx'),
+        ),
+    ]
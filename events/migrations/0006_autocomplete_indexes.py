@@ -0,0 +1,85 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+TRIGRAM_INDEXES = [
+    ('event_title_trgm_idx', 'events_event', 'title'),
+    ('event_venue_trgm_idx', 'events_event', 'venue'),
+    ('auth_user_username_trgm_idx', 'auth_user', 'username'),
+]
+
+
+def pg_trgm_available(schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return False
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def create_username_prefix_index(apps, schema_editor):
+    # auth_user belongs to another app, so this index is not part of any model state
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS auth_user_username_prefix_idx '
+            'ON auth_user ((UPPER(username) COLLATE "C"))'
+        )
+
+
+def drop_username_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS auth_user_username_prefix_idx')
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # Without the extension substring suggestions fall back to sequential scans
+    if not pg_trgm_available(schema_editor):
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('events', '0005_event_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(django.db.models.functions.comparison.Collate(django.db.models.functions.text.Upper('title'), 'C'), name='event_title_prefix_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(django.db.models.functions.comparison.Collate(django.db.models.functions.text.Upper('venue'), 'C'), name='event_venue_prefix_idx'),
+        ),
+        migrations.RunPython(create_username_prefix_index, drop_username_prefix_index),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='event',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='event_title_trgm_idx', opclasses=['gin_trgm_ops']),
+                ),
+                migrations.AddIndex(
+                    model_name='event',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['venue'], name='event_venue_trgm_idx', opclasses=['gin_trgm_ops']),
+                ),
+            ],
+        ),
+    ]
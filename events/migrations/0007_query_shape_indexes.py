@@ -0,0 +1,45 @@
+# Generated by Django 4.2.20 on 2026-10-17 06:32
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('events', '0006_autocomplete_indexes'),
+    ]
+
+    operations = [
+        # Build the composite indexes before dropping the single-column FK
+        # indexes they replace
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(condition=models.Q(('status', 'confirmed')), fields=['event', 'attendee'], name='registration_confirmed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['attendee', 'registration_date'], name='registration_attendee_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['track', 'start_time', 'end_time'], name='session_track_time_idx'),
+        ),
+        migrations.AlterField(
+            model_name='registration',
+            name='attendee',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='event_registrations', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='registration',
+            name='event',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='registrations', to='events.event'),
+        ),
+        migrations.AlterField(
+            model_name='session',
+            name='track',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to='events.track'),
+        ),
+    ]
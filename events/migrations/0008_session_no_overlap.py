@@ -0,0 +1,21 @@
+# Generated by Django 4.2.20 on 2026-10-17 06:33
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.db import migrations, models
+import django.db.models.expressions
+import events.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_query_shape_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='session',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(expressions=[(models.Func(models.F('track'), django.db.models.expressions.CombinedExpression(models.F('track'), '+', models.Value(1)), function='int8range', output_field=django.contrib.postgres.fields.ranges.BigIntegerRangeField()), '&&'), (events.models.TsTzRange('start_time', 'end_time'), '&&')], name='session_no_overlap', violation_error_message='Session time conflicts with another session in the same track'),
+        ),
+    ]
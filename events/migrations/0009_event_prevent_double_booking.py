@@ -0,0 +1,18 @@
+# Generated by Django 4.2.20 on 2026-10-17 06:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_session_no_overlap'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='prevent_double_booking',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.20 on 2026-10-17 06:46
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('events', '0009_event_prevent_double_booking'),
+    ]
+
+    operations = [
+        # Build the composite index before dropping the FK index it replaces
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['speaker', 'start_time', 'end_time'], name='session_speaker_time_idx'),
+        ),
+        migrations.AlterField(
+            model_name='session',
+            name='speaker',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='speaking_sessions', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
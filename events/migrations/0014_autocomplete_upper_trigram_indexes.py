@@ -0,0 +1,71 @@
+from django.db import migrations
+
+# Substring suggestions filter with __icontains, which compiles to
+# UPPER(col::text) LIKE UPPER('%q%'); only trigram indexes over the same
+# expression can serve it
+OLD_TRIGRAM_INDEXES = [
+    ('event_title_trgm_idx', 'events_event', 'title'),
+    ('event_venue_trgm_idx', 'events_event', 'venue'),
+    ('auth_user_username_trgm_idx', 'auth_user', 'username'),
+]
+TRIGRAM_INDEXES = [
+    ('event_title_upper_trgm_idx', 'events_event', 'title'),
+    ('event_venue_upper_trgm_idx', 'events_event', 'venue'),
+    ('auth_user_username_upper_trgm_idx', 'auth_user', 'username'),
+]
+
+
+def pg_trgm_available(schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return False
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def create_trigram_indexes(apps, schema_editor, indexes, expression):
+    if not pg_trgm_available(schema_editor):
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in indexes:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (({expression.format(column)}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor, indexes):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in indexes:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def forwards(apps, schema_editor):
+    drop_trigram_indexes(apps, schema_editor, OLD_TRIGRAM_INDEXES)
+    create_trigram_indexes(apps, schema_editor, TRIGRAM_INDEXES, 'UPPER({})')
+
+
+def backwards(apps, schema_editor):
+    drop_trigram_indexes(apps, schema_editor, TRIGRAM_INDEXES)
+    create_trigram_indexes(apps, schema_editor, OLD_TRIGRAM_INDEXES, '{}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0013_revokedtoken'),
+    ]
+
+    operations = [
+        # The trigram indexes only exist where pg_trgm is available, so like
+        # the username indexes they are kept out of the model state
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(forwards, backwards),
+            ],
+            state_operations=[
+                migrations.RemoveIndex(model_name='event', name='event_title_trgm_idx'),
+                migrations.RemoveIndex(model_name='event', name='event_venue_trgm_idx'),
+            ],
+        ),
+    ]
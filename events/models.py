@@ -1,7 +1,58 @@
-from django.db import models
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connection, models, transaction
+from django.db.models import F, Func, Max, Exists, OuterRef
+from django.db.models.functions import Collate, Upper
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import BigIntegerRangeField, DateTimeRangeField, RangeOperators
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from guardian.models import GroupObjectPermissionBase, UserObjectPermissionBase
 from django.core.exceptions import ValidationError
 from django.utils import timezone
+from .signals import notify_event_changed
+
+# Object permission that makes a user a co-organizer of an event
+MANAGE_EVENT = 'manage_event'
+
+
+def managed_by_filter(user, event_ref='pk'):
+    """
+    Return a Q matching events ``user`` organizes or was granted
+    manage_event on, directly or through one of their groups.
+
+    ``event_ref`` is the path from the filtered model to the event.
+    """
+    organizer = 'organizer' if event_ref == 'pk' else f'{event_ref}__organizer'
+    granted = EventUserObjectPermission.objects.filter(
+        content_object=OuterRef(event_ref), user=user, permission__codename=MANAGE_EVENT
+    )
+    group_granted = EventGroupObjectPermission.objects.filter(
+        content_object=OuterRef(event_ref), group__user=user, permission__codename=MANAGE_EVENT
+    )
+    return models.Q(**{organizer: user}) | Exists(granted) | Exists(group_granted)
+
+
+class EventQuerySet(models.QuerySet):
+    def managed_by(self, user):
+        return self.filter(managed_by_filter(user))
+
+    def with_details(self):
+        # Load the organizer and the full track/session/speaker tree in a
+        # fixed number of queries, independent of page size. The search
+        # vector is only needed for filtering, so it is not loaded.
+        return self.select_related('organizer').defer('search_vector').prefetch_related(
+            models.Prefetch(
+                'tracks',
+                queryset=Track.objects.prefetch_related(
+                    models.Prefetch('sessions', queryset=Session.objects.select_related('speaker'))
+                )
+            )
+        )
+
 
 class Event(models.Model):
     title = models.CharField(max_length=200)
@@ -10,9 +61,20 @@ class Event(models.Model):
     end_date = models.DateTimeField()
     venue = models.CharField(max_length=200)
     capacity = models.PositiveIntegerField()
+    # Denormalized number of confirmed registrations, kept in sync by the
+    # Registration signal handlers below.
+    confirmed_count = models.PositiveIntegerField(default=0, editable=False)
+    # Weighted title/venue/description lexemes, maintained by a database
+    # trigger on PostgreSQL (see migration 0005) and used by FullTextSearchFilter.
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     organizer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='organized_events')
+    # Reject session registrations that overlap another session the attendee
+    # holds in this event
+    prevent_double_booking = models.BooleanField(default=False)
+
+    objects = EventQuerySet.as_manager()
 
     def clean(self):
         if self.start_date and self.end_date and self.start_date > self.end_date:
@@ -23,11 +85,58 @@ class Event(models.Model):
     def __str__(self):
         return self.title
 
+    def promote_waitlist(self):
+        """
+        Fill free seats from the event waitlist in FIFO order.
+
+        The whole batch is promoted with a constant number of queries while the
+        event row is locked. Returns the promoted waitlist entries.
+        """
+        with transaction.atomic():
+            event = Event.objects.select_for_update().only('capacity', 'confirmed_count').get(pk=self.pk)
+            free = event.capacity - event.confirmed_count
+            if free <= 0:
+                return []
+            already_confirmed = Registration.objects.filter(
+                event=OuterRef('event'), attendee=OuterRef('attendee'), status='confirmed'
+            )
+            waitlist = self.waitlist.filter(session__isnull=True)
+            # Deletes the promoted entries together with those of attendees
+            # confirmed by another route, which would stay at the head of the queue
+            settled = waitlist.filter(Exists(already_confirmed))
+            entries = list(waitlist.filter(~Exists(already_confirmed)).order_by('position', 'pk')[:free])
+            if not entries:
+                settled.delete()
+                return []
+            attendee_ids = [entry.attendee_id for entry in entries]
+            existing = Registration.objects.filter(event=self, attendee_id__in=attendee_ids)
+            existing_ids = set(existing.values_list('attendee_id', flat=True))
+            existing.update(status='confirmed')
+            Registration.objects.bulk_create([
+                Registration(event=self, attendee_id=attendee_id, status='confirmed')
+                for attendee_id in attendee_ids if attendee_id not in existing_ids
+            ])
+            Event.objects.filter(pk=self.pk).update(confirmed_count=F('confirmed_count') + len(entries))
+            settled.delete()
+        self.confirmed_count = event.confirmed_count + len(entries)
+        notify_event_changed(self.pk, 'capacity', attendee_ids)
+        return entries
+
     class Meta:
         ordering = ['-start_date']
         permissions = [
             ('view_event_details', 'Can view event details'),
-            ('manage_event', 'Can manage event'),
+            (MANAGE_EVENT, 'Can manage event'),
+        ]
+        indexes = [
+            # Keyset pagination over (start_date, id)
+            models.Index(fields=['start_date', 'id'], name='event_start_date_id_idx'),
+            GinIndex(fields=['search_vector'], name='event_search_vector_idx'),
+            # Typeahead prefix matches, read in order (events.autocomplete)
+            models.Index(Collate(Upper('title'), 'C'), name='event_title_prefix_idx'),
+            models.Index(Collate(Upper('venue'), 'C'), name='event_venue_prefix_idx'),
+            # Typeahead substring matches use UPPER(title) and UPPER(venue)
+            # trigram indexes, created by migration 0014 where pg_trgm exists
         ]
 
 class Track(models.Model):
@@ -41,14 +150,77 @@ class Track(models.Model):
     class Meta:
         unique_together = ['event', 'name']
 
+SESSION_OVERLAP_CONSTRAINT = 'session_no_overlap'
+SESSION_OVERLAP_MESSAGE = 'Session time conflicts with another session in the same track'
+
+
+def constraint_name(exc):
+    """Return the name of the constraint an IntegrityError violated, if known."""
+    diag = getattr(exc.__cause__, 'diag', None)
+    return getattr(diag, 'constraint_name', None)
+
+
+SPEAKER_CONFLICT_MESSAGE = 'Speaker is already presenting another session at that time'
+DOUBLE_BOOKING_MESSAGE = 'You are already registered for an overlapping session'
+
+
+class TsTzRange(Func):
+    function = 'TSTZRANGE'
+    output_field = DateTimeRangeField()
+
+
+class SessionQuerySet(models.QuerySet):
+    def overlapping(self, start_time, end_time):
+        # Sessions that share any time with [start_time, end_time); sessions
+        # that touch end to start do not overlap
+        return self.filter(start_time__lt=end_time, end_time__gt=start_time)
+
+    def visible_to(self, user):
+        # Sessions of events the user manages or is confirmed for. Each test
+        # is a semi-join (the registration one on registration_confirmed_idx),
+        # so each session appears once and no DISTINCT is needed.
+        confirmed = Registration.objects.filter(
+            event=OuterRef('track__event'), attendee=user, status='confirmed'
+        )
+        return self.filter(managed_by_filter(user, 'track__event') | Exists(confirmed))
+
+
 class Session(models.Model):
-    track = models.ForeignKey(Track, on_delete=models.CASCADE, related_name='sessions')
+    # Indexed by session_track_time_idx
+    track = models.ForeignKey(Track, on_delete=models.CASCADE, related_name='sessions', db_index=False)
     title = models.CharField(max_length=200)
     description = models.TextField()
-    speaker = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='speaking_sessions')
+    # Indexed by session_speaker_time_idx
+    speaker = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, related_name='speaking_sessions', db_index=False
+    )
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
     capacity = models.PositiveIntegerField(null=True, blank=True)
+    # Denormalized number of session registrations
+    attendee_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = SessionQuerySet.as_manager()
+
+    def double_booking_for(self, attendee, lock=True):
+        """
+        Return the attendee's session of the same event that overlaps this
+        one, or None. Always None unless the event prevents double booking.
+
+        With ``lock`` the attendee's registration for the event is locked
+        first, so concurrent sign-ups of the same attendee are checked one at
+        a time; call it inside the transaction that creates the registration.
+        """
+        event = self.track.event
+        if not event.prevent_double_booking:
+            return None
+        if lock:
+            list(Registration.objects.select_for_update().filter(event=event, attendee=attendee).values_list('pk'))
+        # Either a range scan of session_track_time_idx over the event's
+        # tracks, or the attendee's registrations by their attendee index
+        return Session.objects.filter(track__event=event, attendees__attendee=attendee).overlapping(
+            self.start_time, self.end_time
+        ).exclude(pk=self.pk).first()
 
     def clean(self):
         if self.start_time and self.end_time and self.start_time > self.end_time:
@@ -56,21 +228,124 @@ class Session(models.Model):
         if self.start_time < self.track.event.start_date or self.end_time > self.track.event.end_date:
             raise ValidationError('Session must be within event duration')
         
-        # Check for scheduling conflicts within the same track
-        overlapping_sessions = Session.objects.filter(
-            track=self.track,
-            start_time__lt=self.end_time,
-            end_time__gt=self.start_time
-        ).exclude(pk=self.pk)
-        
-        if overlapping_sessions.exists():
-            raise ValidationError('Session time conflicts with another session in the same track')
+        # On PostgreSQL the session_no_overlap constraint enforces this, and
+        # full_clean() checks it through validate_constraints().
+        if connection.vendor != 'postgresql':
+            overlapping_sessions = Session.objects.filter(
+                track=self.track,
+                start_time__lt=self.end_time,
+                end_time__gt=self.start_time
+            ).exclude(pk=self.pk)
+
+            if overlapping_sessions.exists():
+                raise ValidationError(SESSION_OVERLAP_MESSAGE)
+
+        clash = self.speaker_conflict()
+        if clash is not None:
+            raise ValidationError(f'{SPEAKER_CONFLICT_MESSAGE}: "{clash.title}"')
+
+    def speaker_conflict(self):
+        """Return another session of this session's speaker that overlaps it, or None."""
+        if self.speaker_id is None or not (self.start_time and self.end_time):
+            return None
+        return Session.objects.filter(speaker_id=self.speaker_id).overlapping(
+            self.start_time, self.end_time
+        ).exclude(pk=self.pk).first()
 
     def __str__(self):
         return f'{self.title} - {self.track.event.title}'
 
+    def double_booked(self, attendee_ids):
+        """
+        Return those of ``attendee_ids`` holding a session of the same event
+        that overlaps this one, like double_booking_for() does for one
+        attendee. Their event registrations are locked first.
+        """
+        event = self.track.event
+        if not event.prevent_double_booking or not attendee_ids:
+            return set()
+        list(Registration.objects.select_for_update().filter(event=event, attendee_id__in=attendee_ids).values_list('pk'))
+        overlapping = Session.objects.filter(track__event=event).overlapping(
+            self.start_time, self.end_time
+        ).exclude(pk=self.pk)
+        return set(
+            SessionRegistration.objects.filter(session__in=overlapping, attendee_id__in=attendee_ids)
+            .values_list('attendee_id', flat=True)
+        )
+
+    def promote_waitlist(self):
+        """
+        Fill free seats from the session waitlist in FIFO order.
+
+        Only attendees holding a confirmed event registration are promoted.
+        When the event prevents double booking, attendees who hold an
+        overlapping session are dropped from the waitlist instead. Returns
+        the promoted waitlist entries.
+        """
+        with transaction.atomic():
+            session = (
+                Session.objects.select_for_update(of=('self',)).select_related('track__event')
+                .only('capacity', 'attendee_count', 'start_time', 'end_time', 'track__event__prevent_double_booking')
+                .get(pk=self.pk)
+            )
+            already_registered = SessionRegistration.objects.filter(
+                session=OuterRef('session'), attendee=OuterRef('attendee')
+            )
+            # Deletes the promoted entries together with those of attendees
+            # registered by another route, which would stay at the head of the queue
+            settled = self.waitlist.filter(Exists(already_registered))
+            waiting = self.waitlist.filter(
+                Exists(Registration.objects.filter(
+                    event=OuterRef('event'), attendee=OuterRef('attendee'), status='confirmed'
+                )),
+                ~Exists(already_registered)
+            ).order_by('position', 'pk')
+            free = None
+            if session.capacity is not None:
+                free = session.capacity - session.attendee_count
+                if free <= 0:
+                    return []
+            while True:
+                entries = list(waiting[:free])
+                clashes = session.double_booked([entry.attendee_id for entry in entries])
+                if not clashes:
+                    break
+                self.waitlist.filter(attendee_id__in=clashes).delete()
+            if not entries:
+                settled.delete()
+                return []
+            SessionRegistration.objects.bulk_create([
+                SessionRegistration(session=self, attendee_id=entry.attendee_id) for entry in entries
+            ])
+            Session.objects.filter(pk=self.pk).update(attendee_count=F('attendee_count') + len(entries))
+            settled.delete()
+        self.attendee_count = session.attendee_count + len(entries)
+        notify_event_changed(entries[0].event_id, 'capacity', [entry.attendee_id for entry in entries])
+        return entries
+
     class Meta:
         ordering = ['start_time']
+        indexes = [
+            # Per-track listings and the overlap check on other databases
+            models.Index(fields=['track', 'start_time', 'end_time'], name='session_track_time_idx'),
+            # Speaker conflict checks and the per-speaker schedule sweep
+            models.Index(fields=['speaker', 'start_time', 'end_time'], name='session_speaker_time_idx'),
+        ]
+        constraints = [
+            # No two sessions of a track may overlap. The track is compared as
+            # the range [track, track + 1) so the GiST index needs no btree_gist.
+            ExclusionConstraint(
+                name=SESSION_OVERLAP_CONSTRAINT,
+                expressions=[
+                    (
+                        Func(F('track'), F('track') + 1, function='int8range', output_field=BigIntegerRangeField()),
+                        RangeOperators.OVERLAPS,
+                    ),
+                    (TsTzRange('start_time', 'end_time'), RangeOperators.OVERLAPS),
+                ],
+                violation_error_message=SESSION_OVERLAP_MESSAGE,
+            ),
+        ]
 
 class Registration(models.Model):
     STATUS_CHOICES = [
@@ -79,21 +354,57 @@ class Registration(models.Model):
         ('cancelled', 'Cancelled'),
     ]
 
-    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='registrations')
-    attendee = models.ForeignKey(User, on_delete=models.CASCADE, related_name='event_registrations')
+    # Indexed by unique_together and registration_confirmed_idx
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='registrations', db_index=False)
+    # Indexed by registration_attendee_date_idx
+    attendee = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='event_registrations', db_index=False
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     registration_date = models.DateTimeField(auto_now_add=True)
     notes = models.TextField(blank=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status and event so counter updates can compute deltas
+        instance._loaded_status = instance.__dict__.get('status')
+        instance._loaded_event_id = instance.__dict__.get('event_id')
+        return instance
+
     def clean(self):
         # Check if event is full
-        if self.status == 'confirmed' and self.event.registrations.filter(status='confirmed').count() >= self.event.capacity:
+        if self.status == 'confirmed' and self.event.confirmed_count >= self.event.capacity:
             raise ValidationError('Event has reached maximum capacity')
         
         # Check for duplicate registrations
         if Registration.objects.filter(event=self.event, attendee=self.attendee).exclude(pk=self.pk).exists():
             raise ValidationError('Attendee is already registered for this event')
 
+    def confirm(self):
+        """
+        Claim a seat and confirm this registration without a read-then-write race.
+
+        The seat is taken with a conditional ``UPDATE ... WHERE confirmed_count < capacity``
+        so concurrent approvals serialize on the event row only for the length of
+        this short transaction. Returns False if the event is full.
+        """
+        with transaction.atomic():
+            if not Registration.objects.filter(pk=self.pk).exclude(status='confirmed').update(status='confirmed'):
+                # Already confirmed, the seat has been counted
+                self.status = self._loaded_status = 'confirmed'
+                return True
+            claimed = Event.objects.filter(
+                pk=self.event_id, confirmed_count__lt=F('capacity')
+            ).update(confirmed_count=F('confirmed_count') + 1)
+            if not claimed:
+                transaction.set_rollback(True)
+                return False
+        self.status = self._loaded_status = 'confirmed'
+        _sync_cached(self, 'event', 'confirmed_count', 1)
+        notify_event_changed(self.event_id, 'capacity', [self.attendee_id])
+        return True
+
     def __str__(self):
         return f'{self.attendee.username} - {self.event.title}'
 
@@ -103,12 +414,31 @@ class Registration(models.Model):
             ('approve_registration', 'Can approve registration'),
             ('cancel_registration', 'Can cancel registration'),
         ]
+        indexes = [
+            # Keyset pagination over (registration_date, id)
+            models.Index(fields=['registration_date', 'id'], name='registration_date_id_idx'),
+            # Capacity counts and "already confirmed" checks only touch confirmed rows
+            models.Index(
+                fields=['event', 'attendee'],
+                condition=models.Q(status='confirmed'),
+                name='registration_confirmed_idx'
+            ),
+            # An attendee's registrations, newest first
+            models.Index(fields=['attendee', 'registration_date'], name='registration_attendee_date_idx'),
+        ]
 
 class SessionRegistration(models.Model):
     session = models.ForeignKey(Session, on_delete=models.CASCADE, related_name='attendees')
     attendee = models.ForeignKey(User, on_delete=models.CASCADE, related_name='session_registrations')
     registration_date = models.DateTimeField(auto_now_add=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored session so a move updates both attendee counts
+        instance._loaded_session_id = instance.__dict__.get('session_id')
+        return instance
+
     def clean(self):
         # Check if attendee is registered for the event
         if not Registration.objects.filter(
@@ -118,12 +448,204 @@ class SessionRegistration(models.Model):
         ).exists():
             raise ValidationError('Attendee must be registered for the event first')
 
+        clash = self.session.double_booking_for(self.attendee, lock=False)
+        if clash is not None:
+            raise ValidationError(f'{DOUBLE_BOOKING_MESSAGE}: "{clash.title}"')
+
         # Check session capacity
-        if self.session.capacity and self.session.attendees.count() >= self.session.capacity:
+        if self.session.capacity and self.session.attendee_count >= self.session.capacity:
             raise ValidationError('Session has reached maximum capacity')
 
     def __str__(self):
         return f'{self.attendee.username} - {self.session.title}'
 
     class Meta:
-        unique_together = ['session', 'attendee']
\ No newline at end of file
+        unique_together = ['session', 'attendee']
+        indexes = [
+            # Keyset pagination over (registration_date, id)
+            models.Index(fields=['registration_date', 'id'], name='session_reg_date_id_idx'),
+        ]
+
+
+class WaitlistEntry(models.Model):
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='waitlist')
+    # Set for session waitlists, null for the event-level waitlist
+    session = models.ForeignKey(Session, on_delete=models.CASCADE, null=True, blank=True, related_name='waitlist')
+    attendee = models.ForeignKey(User, on_delete=models.CASCADE, related_name='waitlist_entries')
+    position = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    @classmethod
+    def enqueue(cls, event, attendee, session=None):
+        """Append an attendee to the end of the event or session waitlist."""
+        with transaction.atomic():
+            # Lock the queue owner so concurrent joins get distinct positions
+            owner = session if session is not None else event
+            list(type(owner).objects.select_for_update().filter(pk=owner.pk).values_list('pk', flat=True))
+            last = cls.objects.filter(event=event, session=session).aggregate(last=Max('position'))['last']
+            return cls.objects.create(
+                event=event, session=session, attendee=attendee, position=(last or 0) + 1
+            )
+
+    def __str__(self):
+        target = self.session.title if self.session_id else self.event.title
+        return f'{self.attendee.username} - {target} (#{self.position})'
+
+    class Meta:
+        ordering = ['position', 'id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['event', 'attendee'],
+                condition=models.Q(session__isnull=True),
+                name='unique_event_waitlist_entry'
+            ),
+            models.UniqueConstraint(fields=['session', 'attendee'], name='unique_session_waitlist_entry'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['event', 'position'],
+                condition=models.Q(session__isnull=True),
+                name='waitlist_event_position_idx'
+            ),
+            models.Index(
+                fields=['session', 'position'],
+                condition=models.Q(session__isnull=False),
+                name='waitlist_session_position_idx'
+            ),
+        ]
+
+
+# Direct foreign keys instead of guardian's generic tables, so permission
+# lookups and managed_by_filter() join on an integer key
+class EventUserObjectPermission(UserObjectPermissionBase):
+    content_object = models.ForeignKey(Event, on_delete=models.CASCADE)
+
+
+class EventGroupObjectPermission(GroupObjectPermissionBase):
+    content_object = models.ForeignKey(Event, on_delete=models.CASCADE)
+
+
+AUTH_USER_CACHE_KEY = 'events:auth-user:{}'
+# User fields carried in access token claims
+CLAIMED_USER_FIELDS = ('username', 'is_staff', 'is_superuser')
+
+
+class ClaimsUser(User):
+    """
+    A user built from access token claims without a database query.
+
+    Only the claimed fields are set. The first read of any other field loads
+    all of them at once, from a short-lived cache or with one query.
+    """
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id, claims):
+        # Tokens are only issued to active users
+        known = {'id': user_id, 'is_active': True, **{name: claims[name] for name in CLAIMED_USER_FIELDS}}
+        names = [field.attname for field in cls._meta.concrete_fields if field.attname in known]
+        return cls.from_db(DEFAULT_DB_ALIAS, names, [known[name] for name in names])
+
+    def refresh_from_db(self, using=None, fields=None):
+        deferred = self.get_deferred_fields()
+        if fields is None or 'password' in fields or not deferred.issuperset(fields):
+            # Explicit reloads, and password hashes, which are never cached
+            return super().refresh_from_db(using=using, fields=fields)
+        key = AUTH_USER_CACHE_KEY.format(self.pk)
+        values = cache.get(key)
+        if values is None:
+            names = [field.attname for field in User._meta.concrete_fields if field.attname != 'password']
+            values = User.objects.filter(pk=self.pk).values(*names).first()
+            if values is None:
+                raise User.DoesNotExist('User matching the token claims does not exist.')
+            cache.set(key, values, settings.AUTH_USER_CACHE_TIMEOUT)
+        for name, value in values.items():
+            if name in deferred:
+                self.__dict__[name] = value
+
+
+class RevokedToken(models.Model):
+    """A revoked JWT, kept until the token would have expired anyway."""
+    jti = models.CharField(max_length=255, unique=True)
+    # Rows past their expiry are skipped by the revocation index and pruned
+    expires_at = models.DateTimeField(db_index=True)
+    # Incremental syncs of the revocation index read rows by revoked_at
+    revoked_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return self.jti
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=ClaimsUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    cache.delete(AUTH_USER_CACHE_KEY.format(instance.pk))
+
+
+def adjust_counter(model, pk, field, delta):
+    """Apply a single-statement F() increment/decrement to a counter column."""
+    queryset = model.objects.filter(pk=pk)
+    if delta < 0:
+        # Never drive the counter below zero, even if it has drifted
+        queryset = queryset.filter(**{f'{field}__gte': -delta})
+    return queryset.update(**{field: F(field) + delta})
+
+
+def _sync_cached(instance, field_name, counter, delta):
+    # Keep an already loaded related object consistent with the database
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        related = field.get_cached_value(instance)
+        if related is not None:
+            setattr(related, counter, max(getattr(related, counter) + delta, 0))
+
+
+@receiver(post_save, sender=Registration)
+def update_confirmed_count_on_save(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_loaded_status', None)
+    previous_event_id = getattr(instance, '_loaded_event_id', None) or instance.event_id
+    instance._loaded_status, instance._loaded_event_id = instance.status, instance.event_id
+    if previous_event_id != instance.event_id:
+        # Moved to another event: release the seat held on the old one
+        if previous == 'confirmed':
+            adjust_counter(Event, previous_event_id, 'confirmed_count', -1)
+        notify_event_changed(previous_event_id, 'capacity', [instance.attendee_id])
+        previous = None
+    delta = int(instance.status == 'confirmed') - int(previous == 'confirmed')
+    if delta and adjust_counter(Event, instance.event_id, 'confirmed_count', delta):
+        _sync_cached(instance, 'event', 'confirmed_count', delta)
+
+
+@receiver(post_delete, sender=Registration)
+def update_confirmed_count_on_delete(sender, instance, **kwargs):
+    event_id = getattr(instance, '_loaded_event_id', None) or instance.event_id
+    if getattr(instance, '_loaded_status', instance.status) == 'confirmed':
+        if adjust_counter(Event, event_id, 'confirmed_count', -1) and event_id == instance.event_id:
+            _sync_cached(instance, 'event', 'confirmed_count', -1)
+    instance._loaded_status = None
+
+
+@receiver(post_save, sender=SessionRegistration)
+def update_attendee_count_on_save(sender, instance, created, **kwargs):
+    previous_session_id = getattr(instance, '_loaded_session_id', None) or instance.session_id
+    instance._loaded_session_id = instance.session_id
+    if previous_session_id != instance.session_id:
+        # Moved to another session: free the seat taken on the old one
+        adjust_counter(Session, previous_session_id, 'attendee_count', -1)
+        notify_event_changed(
+            Session.objects.filter(pk=previous_session_id).values_list('track__event_id', flat=True).first(),
+            'capacity', [instance.attendee_id]
+        )
+    elif not created:
+        return
+    if adjust_counter(Session, instance.session_id, 'attendee_count', 1):
+        _sync_cached(instance, 'session', 'attendee_count', 1)
+
+
+@receiver(post_delete, sender=SessionRegistration)
+def update_attendee_count_on_delete(sender, instance, **kwargs):
+    session_id = getattr(instance, '_loaded_session_id', None) or instance.session_id
+    if adjust_counter(Session, session_id, 'attendee_count', -1) and session_id == instance.session_id:
+        _sync_cached(instance, 'session', 'attendee_count', -1)
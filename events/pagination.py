@@ -0,0 +1,138 @@
+from base64 import b64decode
+from urllib import parse
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination, CursorPagination, Cursor
+
+
+class StandardPagination(PageNumberPagination):
+    page_size_query_param = 'page_size'
+    max_page_size = settings.API_MAX_PAGE_SIZE
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination that seeks on an indexed ``(column, id)`` ordering.
+
+    Pages are fetched with ``WHERE (column, id) < (last_column, last_id)
+    ORDER BY column, id``, so latency stays flat at any depth, no
+    ``COUNT(*)`` is issued, and rows sharing a column value are neither
+    skipped nor repeated. Cursors carry both values and never an offset.
+    Orderings chosen with ``?ordering=`` keep their first column and are
+    tie-broken by ``id`` the same way. Keyset columns must not be nullable.
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = settings.API_MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        column = super().get_ordering(request, queryset, view)[0]
+        return (column, '-id' if column.startswith('-') else 'id')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            tokens = parse.parse_qs(b64decode(encoded.encode('ascii')).decode('ascii'), keep_blank_values=True)
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+            value, pk = tokens['p']
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=reverse, position=(value, pk))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+        queryset = queryset.order_by(*ordering)
+        if self.cursor is not None:
+            queryset = queryset.filter(self.seek(queryset.model, self.cursor.position, reverse))
+        results = list(queryset[:self.page_size + 1])
+        has_following = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            # The cursor came from a page after this one
+            self.has_next, self.has_previous = True, has_following
+        else:
+            self.has_next, self.has_previous = has_following, self.cursor is not None
+        if self.template is not None:
+            self.display_page_controls = self.has_next or self.has_previous
+        return self.page
+
+    def seek(self, model, position, reverse):
+        """Return the filter for rows after ``position`` in the page direction."""
+        column = self.ordering[0].lstrip('-')
+        descending = self.ordering[0].startswith('-') != reverse
+        try:
+            value = model._meta.get_field(column).to_python(position[0])
+            pk = model._meta.pk.to_python(position[1])
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+        if value is None or pk is None:
+            raise NotFound(self.invalid_cursor_message)
+        lookup = 'lt' if descending else 'gt'
+        return Q(**{f'{column}__{lookup}': value}) | Q(**{column: value, f'pk__{lookup}': pk})
+
+    def position(self, instance):
+        return (str(getattr(instance, self.ordering[0].lstrip('-'))), str(instance.pk))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.page:
+            position = self.position(self.page[-1])
+        else:
+            # An empty page reached backwards; resume after its cursor
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.page:
+            position = self.position(self.page[0])
+        else:
+            # An empty page reached forwards; go back from its cursor
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+
+class EventKeysetPagination(KeysetPagination):
+    ordering = ('-start_date', '-id')
+
+
+class RegistrationKeysetPagination(KeysetPagination):
+    ordering = ('-registration_date', '-id')
+
+
+class KeysetPaginationMixin:
+    """
+    Let clients opt in to keyset pagination with ``?pagination=cursor``.
+
+    Follow-up pages carry a ``cursor`` parameter, which keeps them on the
+    keyset paginator. Without either parameter, and for extra actions, the
+    default page-number pagination is used.
+    """
+    keyset_pagination_class = None
+
+    @property
+    def paginator(self):
+        if (not hasattr(self, '_paginator') and self.keyset_pagination_class is not None
+                and self.action == 'list'):
+            params = self.request.query_params
+            if params.get('pagination') == 'cursor' or 'cursor' in params:
+                self._paginator = self.keyset_pagination_class()
+        return super().paginator
@@ -1,8 +1,84 @@
+from guardian.core import ObjectPermissionChecker
 from rest_framework import permissions
+from .models import Event, Track, MANAGE_EVENT
+
+
+def get_permission_checker(request):
+    """
+    Return the ObjectPermissionChecker of the request's user.
+
+    One checker is kept per request and user, so an object's permissions are
+    read at most once per request, and not at all after prefetch_event_permissions().
+    """
+    checkers = request.__dict__.setdefault('_permission_checkers', {})
+    user = request.user
+    if user.pk not in checkers:
+        checkers[user.pk] = ObjectPermissionChecker(user)
+    return checkers[user.pk]
+
+
+def manages_event(checker, event):
+    """Return whether the checker's user organizes ``event`` or holds manage_event on it."""
+    if event is None:
+        return False
+    # Compare keys so the organizer row is never loaded
+    return event.organizer_id == checker.user.pk or checker.has_perm(MANAGE_EVENT, event)
+
+
+def can_manage_event(request, event):
+    return manages_event(get_permission_checker(request), event)
+
+
+def prefetch_event_permissions(checker, events):
+    """
+    Load the checker user's permissions on many events with two queries.
+
+    Events the user organizes need no lookup and are skipped.
+    """
+    events = [event for event in events if event.organizer_id != checker.user.pk]
+    if events:
+        checker.prefetch_perms(events)
+
+
+class NestedParentMixin:
+    """
+    Resolve the track and event a nested route points at once per request.
+
+    The track is read together with its event in one query and kept on the
+    view, which lives for a single request, so IsEventOrganizerOrReadOnly and
+    the viewset hooks share it instead of each loading the chain again.
+    """
+    # URL keyword holding the pk of the track that new objects belong to
+    parent_track_kwarg = 'track_pk'
+
+    def get_parent_track(self):
+        if not hasattr(self, '_parent_track'):
+            track_pk = self.kwargs.get(self.parent_track_kwarg)
+            tracks = Track.objects.select_related('event').filter(pk=track_pk)
+            if 'event_pk' in self.kwargs:
+                tracks = tracks.filter(event_id=self.kwargs['event_pk'])
+            self._parent_track = tracks.first() if track_pk is not None else None
+        return self._parent_track
+
+    def get_parent_event(self):
+        if not hasattr(self, '_parent_event'):
+            track = self.get_parent_track()
+            event_pk = self.kwargs.get('event_pk')
+            if track is not None:
+                self._parent_event = track.event
+            elif event_pk is not None:
+                self._parent_event = Event.objects.filter(pk=event_pk).first()
+            else:
+                self._parent_event = None
+        return self._parent_event
+
 
 class IsOrganizerOrReadOnly(permissions.BasePermission):
     """
     Custom permission to only allow organizers of an event to edit it.
+
+    Co-organizers holding manage_event may edit the event; only its
+    organizer may delete it.
     """
     def has_permission(self, request, view):
         # Allow any authenticated user to create events
@@ -16,12 +92,18 @@ class IsOrganizerOrReadOnly(permissions.BasePermission):
             return True
             
         # Write permissions are only allowed to the organizer
-        return obj.organizer == request.user
+        if request.method == 'DELETE':
+            return obj.organizer_id == request.user.pk
+        return can_manage_event(request, obj)
 
 
 class IsEventOrganizerOrReadOnly(permissions.BasePermission):
     """
-    Custom permission to only allow organizers of an event to edit its related objects.
+    Custom permission to only allow organizers and co-organizers of an event
+    to edit its related objects.
+
+    Views using NestedParentMixin resolve the event once per request;
+    other views fall back to walking the object's relations.
     """
     def has_permission(self, request, view):
         # Read permissions are allowed to any request
@@ -29,16 +111,12 @@ class IsEventOrganizerOrReadOnly(permissions.BasePermission):
             return True
             
         # For POST requests to create objects in nested routes
-        if request.method == 'POST':
-            # Check if this is a nested view with an event_pk
-            event_pk = view.kwargs.get('event_pk')
-            if event_pk:
-                from .models import Event
-                try:
-                    event = Event.objects.get(pk=event_pk)
-                    return event.organizer == request.user
-                except Event.DoesNotExist:
-                    return False
+        if request.method == 'POST' and view.kwargs.get('event_pk'):
+            if isinstance(view, NestedParentMixin):
+                event = view.get_parent_event()
+            else:
+                event = Event.objects.filter(pk=view.kwargs['event_pk']).first()
+            return can_manage_event(request, event)
         return True
     
     def has_object_permission(self, request, view, obj):
@@ -46,9 +124,19 @@ class IsEventOrganizerOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
             
-        # Write permissions are only allowed to the event organizer
-        if hasattr(obj, 'event'):
-            return obj.event.organizer == request.user
-        elif hasattr(obj, 'track'):
-            return obj.track.event.organizer == request.user
-        return False
\ No newline at end of file
+        # Write permissions are only allowed to the event organizers
+        return can_manage_event(request, self.get_event(view, obj))
+
+    def get_event(self, view, obj):
+        # Nested querysets are filtered by the route's parents, so the
+        # resolved parents normally are the object's own
+        nested = isinstance(view, NestedParentMixin)
+        if hasattr(obj, 'track_id'):
+            track = view.get_parent_track() if nested else None
+            if track is None or track.pk != obj.track_id:
+                track = obj.track
+            return track.event
+        if hasattr(obj, 'event_id'):
+            event = view.get_parent_event() if nested else None
+            return event if event is not None and event.pk == obj.event_id else obj.event
+        return None
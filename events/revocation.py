@@ -0,0 +1,105 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from .models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+# Syncs re-read revocations this far back, so rows committed late or
+# stamped by a slightly slow clock are not missed
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class RevocationIndex:
+    """
+    In-process index of revoked token ids, synced from RevokedToken.
+
+    Checks are a dict lookup and never query the database. Server processes
+    call start() once, which loads the index and then syncs it on a
+    background thread every REVOKED_TOKEN_SYNC_INTERVAL seconds. Each sync
+    reads the revocations made since the previous one and drops tokens that
+    have expired.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._syncer = None
+        self.reset()
+
+    def reset(self):
+        # jti -> expiry of the revoked token
+        self._revoked = {}
+        self._synced_at = None
+
+    def __len__(self):
+        return len(self._revoked)
+
+    def add(self, jti, expires_at):
+        self._revoked[jti] = expires_at
+
+    def is_revoked(self, jti):
+        return jti in self._revoked
+
+    def sync(self):
+        with self._lock:
+            now = timezone.now()
+            rows = RevokedToken.objects.filter(expires_at__gt=now)
+            if self._synced_at is not None:
+                rows = rows.filter(revoked_at__gte=self._synced_at - SYNC_OVERLAP)
+            for jti, expires_at in rows.values_list('jti', 'expires_at'):
+                self.add(jti, expires_at)
+            # Readers and revoke_token() use the dict concurrently, so it is
+            # updated in place rather than replaced
+            for jti, expires_at in list(self._revoked.items()):
+                if expires_at <= now:
+                    self._revoked.pop(jti, None)
+            self._synced_at = now
+
+    def start(self):
+        """Load the index and keep it synced; called once per server process."""
+        with self._lock:
+            if self._syncer is not None and self._syncer.is_alive():
+                return
+        self.sync()
+        if settings.REVOKED_TOKEN_SYNC_INTERVAL > 0:
+            self._syncer = RevocationSyncThread(self)
+            self._syncer.start()
+
+
+class RevocationSyncThread(threading.Thread):
+    """Sync a revocation index every REVOKED_TOKEN_SYNC_INTERVAL seconds."""
+
+    def __init__(self, index):
+        super().__init__(name='revocation-sync', daemon=True)
+        self.index = index
+
+    def run(self):
+        while True:
+            time.sleep(settings.REVOKED_TOKEN_SYNC_INTERVAL)
+            try:
+                self.index.sync()
+            except Exception:
+                logger.exception('Revoked token sync failed, retrying')
+            finally:
+                # Nothing else closes this thread's connection
+                connection.close()
+
+
+revocation_index = RevocationIndex()
+
+
+def revoke_token(token):
+    """Revoke a validated simplejwt token until it expires."""
+    jti = token[settings.SIMPLE_JWT['JTI_CLAIM']]
+    expires_at = datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+    RevokedToken.objects.bulk_create([RevokedToken(jti=jti, expires_at=expires_at)], ignore_conflicts=True)
+    revocation_index.add(jti, expires_at)
+
+
+def is_token_revoked(token):
+    jti = token.get(settings.SIMPLE_JWT['JTI_CLAIM'])
+    return jti is not None and revocation_index.is_revoked(jti)
@@ -0,0 +1,237 @@
+import csv
+import heapq
+import io
+import json
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+from .bulk import BULK_CHUNK_SIZE
+from .models import (
+    Track, Session, SESSION_OVERLAP_CONSTRAINT, SESSION_OVERLAP_MESSAGE, SPEAKER_CONFLICT_MESSAGE, constraint_name
+)
+from .signals import notify_event_changed
+
+# Upper bound on the number of sessions accepted in one import
+MAX_SCHEDULE_ROWS = 5000
+
+
+class ScheduleImportError(Exception):
+    """Raised with per-row errors when a schedule cannot be imported as a whole."""
+
+    def __init__(self, errors):
+        super().__init__(f'{len(errors)} invalid row(s)')
+        self.errors = errors
+
+
+class ScheduleRowSerializer(serializers.Serializer):
+    track = serializers.CharField(max_length=100)
+    title = serializers.CharField(max_length=200)
+    description = serializers.CharField(allow_blank=True, required=False, default='')
+    speaker = serializers.CharField(allow_blank=True, allow_null=True, required=False, default=None)
+    start_time = serializers.DateTimeField()
+    end_time = serializers.DateTimeField()
+    capacity = serializers.IntegerField(min_value=1, allow_null=True, required=False, default=None)
+
+    def to_internal_value(self, data):
+        # CSV has no nulls; treat empty optional cells as missing
+        if isinstance(data, dict):
+            data = {
+                key: value for key, value in data.items()
+                if not (value == '' and key in ('description', 'speaker', 'capacity'))
+            }
+        return super().to_internal_value(data)
+
+
+def parse_schedule(content, fmt):
+    """
+    Parse CSV or JSON schedule text into a list of row dicts.
+
+    Raises ValueError for unparseable text or JSON of any other shape.
+    """
+    if fmt == 'csv':
+        return list(csv.DictReader(io.StringIO(content)))
+    if fmt == 'json':
+        data = json.loads(content)
+        rows = data.get('sessions', []) if isinstance(data, dict) else data
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError('Expected a list of session objects or an object with a "sessions" list')
+        return rows
+    raise ValueError(f'Unsupported schedule format: {fmt}')
+
+
+def find_overlaps(intervals):
+    """
+    Sweep intervals sorted by start time and return every overlapping pair.
+
+    ``intervals`` holds ``(start, end, key)`` tuples of a single timeline.
+    Intervals that are still running are kept in a heap ordered by end time,
+    so each interval is only compared with those it overlaps: O(n log n + k)
+    for k overlapping pairs. Intervals that touch end to start do not overlap.
+    """
+    overlaps = []
+    active = []
+    for number, interval in enumerate(sorted(intervals, key=lambda item: (item[0], item[1]))):
+        while active and active[0][0] <= interval[0]:
+            heapq.heappop(active)
+        overlaps.extend((interval, other) for _, _, other in active)
+        heapq.heappush(active, (interval[1], number, interval))
+    return overlaps
+
+
+def _row_conflicts(timelines):
+    # Map each imported row to the first interval it overlaps; overlaps
+    # between existing sessions are not this import's concern
+    conflicts = {}
+    for timeline in timelines.values():
+        for interval, other in find_overlaps(timeline):
+            if interval[2][0] != 'row' and other[2][0] != 'row':
+                continue
+            row_interval, conflict = (interval, other) if interval[2][0] == 'row' else (other, interval)
+            conflicts.setdefault(row_interval[2][1], conflict[2])
+    return conflicts
+
+
+def _describe(key, rows):
+    if key[0] == 'row':
+        return f'row {key[1]} ("{rows[key[1] - 1]["title"]}")'
+    return f'existing session {key[1]}'
+
+
+def import_schedule(event, rows, dry_run=False):
+    """
+    Validate a whole event schedule and insert it in one transaction.
+
+    Existing tracks, sessions and speakers are loaded once; overlaps and event
+    bounds are checked in memory. Missing tracks are created. Raises
+    ScheduleImportError listing every invalid row, in which case nothing is
+    written.
+    """
+    if len(rows) > MAX_SCHEDULE_ROWS:
+        raise ScheduleImportError([{'row': None, 'errors': {
+            'detail': f'A schedule may contain at most {MAX_SCHEDULE_ROWS} sessions.'
+        }}])
+
+    serializer = ScheduleRowSerializer(data=rows, many=True)
+    errors = []
+    if not serializer.is_valid():
+        errors = [
+            {'row': number, 'errors': row_errors}
+            for number, row_errors in enumerate(serializer.errors, start=1) if row_errors
+        ]
+        raise ScheduleImportError(errors)
+    rows = serializer.validated_data
+
+    usernames = {row['speaker'] for row in rows if row['speaker']}
+    speakers = dict(User.objects.filter(username__in=usernames).values_list('username', 'pk'))
+    tracks = {track.name: track for track in Track.objects.filter(event=event)}
+
+    intervals = defaultdict(list)
+    for session in Session.objects.filter(track__event=event).values('pk', 'track__name', 'start_time', 'end_time'):
+        intervals[session['track__name']].append((session['start_time'], session['end_time'], ('session', session['pk'])))
+    # Speakers may not be booked twice at once, in this event or any other
+    speaker_intervals = defaultdict(list)
+    for session in Session.objects.filter(speaker_id__in=speakers.values()).values('pk', 'speaker_id', 'start_time', 'end_time'):
+        speaker_intervals[session['speaker_id']].append((session['start_time'], session['end_time'], ('session', session['pk'])))
+
+    for number, row in enumerate(rows, start=1):
+        row_errors = {}
+        if row['start_time'] > row['end_time']:
+            row_errors['end_time'] = 'End time must be after start time.'
+        elif row['start_time'] < event.start_date or row['end_time'] > event.end_date:
+            row_errors['detail'] = 'Session must be within event duration.'
+        if row['speaker'] and row['speaker'] not in speakers:
+            row_errors['speaker'] = f'Unknown user "{row["speaker"]}".'
+        if row_errors:
+            errors.append({'row': number, 'errors': row_errors})
+        else:
+            intervals[row['track']].append((row['start_time'], row['end_time'], ('row', number)))
+            if row['speaker']:
+                speaker_intervals[speakers[row['speaker']]].append((row['start_time'], row['end_time'], ('row', number)))
+
+    conflicts = defaultdict(dict)
+    for field, message, timelines in (
+        ('detail', SESSION_OVERLAP_MESSAGE, intervals),
+        ('speaker', SPEAKER_CONFLICT_MESSAGE, speaker_intervals),
+    ):
+        for number, conflict in _row_conflicts(timelines).items():
+            conflicts[number][field] = f'{message}: {_describe(conflict, rows)}.'
+    errors += [{'row': number, 'errors': row_errors} for number, row_errors in conflicts.items()]
+    if errors:
+        raise ScheduleImportError(sorted(errors, key=lambda error: error['row']))
+
+    new_tracks = sorted({row['track'] for row in rows} - set(tracks))
+    summary = {'sessions_created': len(rows), 'tracks_created': new_tracks, 'dry_run': dry_run}
+    if dry_run:
+        return summary
+
+    try:
+        with transaction.atomic():
+            for track in Track.objects.bulk_create([Track(event=event, name=name) for name in new_tracks]):
+                tracks[track.name] = track
+            Session.objects.bulk_create([
+                Session(
+                    track=tracks[row['track']],
+                    title=row['title'],
+                    description=row['description'],
+                    speaker_id=speakers.get(row['speaker']),
+                    start_time=row['start_time'],
+                    end_time=row['end_time'],
+                    capacity=row['capacity'],
+                )
+                for row in rows
+            ], batch_size=BULK_CHUNK_SIZE)
+    except IntegrityError as exc:
+        # A concurrent write slipped in between validation and insert
+        if constraint_name(exc) == SESSION_OVERLAP_CONSTRAINT:
+            raise ScheduleImportError([{'row': None, 'errors': {'detail': f'{SESSION_OVERLAP_MESSAGE}.'}}])
+        raise
+    # bulk_create sends no post_save signals
+    notify_event_changed(event.pk, 'session')
+    return summary
+
+
+def _session_summary(session):
+    return {
+        'id': session['pk'],
+        'title': session['title'],
+        'start_time': session['start_time'],
+        'end_time': session['end_time'],
+        'event': session['track__event_id'],
+        'track': {'id': session['track_id'], 'name': session['track__name']},
+    }
+
+
+def speaker_conflicts(event):
+    """
+    Return the overlapping session pairs of the event's speakers.
+
+    The sessions of every speaker of the event, in this event or any other,
+    are read in one pass ordered by ``(speaker, start_time)``, which
+    session_speaker_time_idx returns presorted, and swept per speaker. Only
+    pairs involving a session of ``event`` are reported.
+    """
+    speaker_ids = Session.objects.filter(track__event=event, speaker__isnull=False).values('speaker_id')
+    sessions = (
+        Session.objects.filter(speaker_id__in=speaker_ids)
+        .order_by('speaker_id', 'start_time', 'end_time', 'pk')
+        .values(
+            'pk', 'title', 'start_time', 'end_time', 'speaker_id', 'speaker__username',
+            'track_id', 'track__name', 'track__event_id',
+        )
+    )
+    conflicts = []
+    for _, speaker_sessions in groupby(sessions.iterator(), key=itemgetter('speaker_id')):
+        speaker_sessions = list(speaker_sessions)
+        pairs = find_overlaps([(session['start_time'], session['end_time'], session) for session in speaker_sessions])
+        for later, earlier in pairs:
+            first, second = earlier[2], later[2]
+            if event.pk not in (first['track__event_id'], second['track__event_id']):
+                continue
+            conflicts.append({
+                'speaker': {'id': first['speaker_id'], 'username': first['speaker__username']},
+                'sessions': [_session_summary(first), _session_summary(second)],
+            })
+    return conflicts
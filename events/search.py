@@ -0,0 +1,50 @@
+import re
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F
+from rest_framework import filters
+
+# Must match the configuration used by the search_vector trigger (migration 0005)
+SEARCH_CONFIG = 'english'
+
+_LEXEME_RE = re.compile(r'\w+')
+
+
+def prefix_query(terms):
+    """
+    Build a tsquery that ANDs every word of the search terms as a prefix match.
+
+    Prefix matching keeps search-as-you-type working on partial words, the way
+    the ILIKE search did, while only allowing plain words into the raw query.
+    """
+    words = [word for term in terms for word in _LEXEME_RE.findall(term)]
+    if not words:
+        return None
+    return SearchQuery(
+        ' & '.join(f'{word}:*' for word in words), search_type='raw', config=SEARCH_CONFIG
+    )
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter backed by a stored, GIN-indexed ``tsvector`` column.
+
+    Matching rows are ranked by ``ts_rank`` unless the client asks for an
+    explicit ``ordering``. Views opt in with ``search_vector_field``; without
+    it, or on databases other than PostgreSQL, this behaves exactly like
+    DRF's ``SearchFilter`` over ``search_fields``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        vector_field = getattr(view, 'search_vector_field', None)
+        if vector_field is None or connections[queryset.db].vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view)
+
+        query = prefix_query(self.get_search_terms(request))
+        if query is None:
+            return queryset
+        # Best matches first; the model ordering breaks ties
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.filter(**{vector_field: query}).annotate(
+            search_rank=SearchRank(F(vector_field), query)
+        ).order_by('-search_rank', *ordering)
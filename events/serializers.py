@@ -1,6 +1,12 @@
 from rest_framework import serializers
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.contrib.auth.models import User
-from .models import Event, Track, Session, Registration, SessionRegistration
+from .models import (
+    Event, Track, Session, Registration, SessionRegistration, WaitlistEntry,
+    SESSION_OVERLAP_CONSTRAINT, SESSION_OVERLAP_MESSAGE, SPEAKER_CONFLICT_MESSAGE, constraint_name
+)
+from .permissions import get_permission_checker
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -22,8 +28,33 @@ class SessionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Session
         fields = ['id', 'title', 'description', 'speaker', 'speaker_id', 
-                  'start_time', 'end_time', 'capacity', 'track']
-        read_only_fields = ['track']
+                  'start_time', 'end_time', 'capacity', 'attendee_count', 'track']
+        read_only_fields = ['track', 'attendee_count']
+
+    def validate(self, attrs):
+        start_time = attrs.get('start_time', getattr(self.instance, 'start_time', None))
+        end_time = attrs.get('end_time', getattr(self.instance, 'end_time', None))
+        if start_time and end_time and start_time > end_time:
+            raise serializers.ValidationError({'end_time': 'End time must be after start time.'})
+        speaker = attrs.get('speaker', getattr(self.instance, 'speaker', None))
+        if speaker is not None and start_time and end_time:
+            clash = Session.objects.filter(speaker=speaker).overlapping(start_time, end_time).exclude(
+                pk=getattr(self.instance, 'pk', None)
+            ).first()
+            if clash is not None:
+                raise serializers.ValidationError({'speaker_id': f'{SPEAKER_CONFLICT_MESSAGE}: "{clash.title}".'})
+        return attrs
+
+    def save(self, **kwargs):
+        # Overlaps are rejected by the session_no_overlap constraint in the
+        # same INSERT/UPDATE instead of a separate pre-check query.
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError as exc:
+            if constraint_name(exc) == SESSION_OVERLAP_CONSTRAINT:
+                raise serializers.ValidationError({'detail': f'{SESSION_OVERLAP_MESSAGE}.'})
+            raise
 
 
 class TrackSerializer(serializers.ModelSerializer):
@@ -38,17 +69,37 @@ class TrackSerializer(serializers.ModelSerializer):
 class EventSerializer(serializers.ModelSerializer):
     organizer = UserSerializer(read_only=True)
     tracks = TrackSerializer(many=True, read_only=True)
-    registration_count = serializers.SerializerMethodField()
+    registration_count = serializers.IntegerField(source='confirmed_count', read_only=True)
     
     class Meta:
         model = Event
         fields = ['id', 'title', 'description', 'start_date', 'end_date', 
                   'venue', 'capacity', 'organizer', 'tracks', 'registration_count',
-                  'created_at', 'updated_at']
+                  'prevent_double_booking', 'created_at', 'updated_at']
         read_only_fields = ['created_at', 'updated_at']
-    
-    def get_registration_count(self, obj):
-        return obj.registrations.filter(status='confirmed').count()
+
+
+class ManagedEventSerializer(serializers.ModelSerializer):
+    """An event the requesting user manages, with their role and object permissions."""
+    role = serializers.SerializerMethodField()
+    permissions = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Event
+        fields = ['id', 'title', 'start_date', 'end_date', 'venue', 'role', 'permissions']
+
+    def get_role(self, event):
+        return 'organizer' if event.organizer_id == self.context['request'].user.pk else 'co_organizer'
+
+    def get_permissions(self, event):
+        # Organizers implicitly hold every event permission
+        if event.organizer_id == self.context['request'].user.pk:
+            return sorted(codename for codename, _ in Event._meta.permissions)
+        return sorted(get_permission_checker(self.context['request']).get_perms(event))
+
+
+class CoOrganizerSerializer(serializers.Serializer):
+    user_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='user')
 
 
 class RegistrationSerializer(serializers.ModelSerializer):
@@ -79,4 +130,55 @@ class SessionRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = SessionRegistration
         fields = ['id', 'session', 'session_id', 'attendee', 'registration_date']
-        read_only_fields = ['registration_date']
\ No newline at end of file
+        read_only_fields = ['registration_date']
+
+
+class WaitlistEntrySerializer(serializers.ModelSerializer):
+    attendee = UserSerializer(read_only=True)
+
+    class Meta:
+        model = WaitlistEntry
+        fields = ['id', 'event', 'session', 'attendee', 'position', 'created_at']
+        read_only_fields = fields
+
+
+class BulkRegistrationActionSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=5000
+    )
+
+
+class BulkRegistrationCreateSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=5000
+    )
+    status = serializers.ChoiceField(choices=['pending', 'confirmed'], default='pending')
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2, max_length=100, trim_whitespace=True)
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.AUTOCOMPLETE_MAX_LIMIT,
+        default=settings.AUTOCOMPLETE_LIMIT
+    )
+
+
+class ScheduleImportSerializer(serializers.Serializer):
+    sessions = serializers.ListField(child=serializers.DictField(), required=False)
+    file = serializers.FileField(required=False)
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if ('sessions' in attrs) == ('file' in attrs):
+            raise serializers.ValidationError('Provide either a sessions list or a CSV/JSON file.')
+        return attrs
+
+
+class RegistrationExportQuerySerializer(serializers.Serializer):
+    format = serializers.ChoiceField(choices=['csv', 'jsonl'], default='csv')
+    status = serializers.ChoiceField(choices=Registration.STATUS_CHOICES, required=False)
@@ -0,0 +1,65 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
+
+# Sent whenever data belonging to an event changes.
+# Arguments: event_id (None when unknown), kind, one of
+# 'event', 'track', 'session' or 'capacity', and attendee_ids, the users
+# whose registrations, session registrations or event permissions changed.
+event_changed = Signal()
+
+
+def notify_event_changed(event_id, kind, attendee_ids=()):
+    event_changed.send(sender=None, event_id=event_id, kind=kind, attendee_ids=attendee_ids)
+
+
+def _session_event_id(session_id, session=None):
+    # Use the loaded track when available; otherwise resolve with one query
+    # that tolerates the track already being gone during cascade deletes.
+    if session is not None and type(session).track.is_cached(session):
+        return session.track.event_id
+    from .models import Session
+    return Session.objects.filter(pk=session_id).values_list('track__event_id', flat=True).first()
+
+
+@receiver([post_save, post_delete], sender='events.Event')
+def event_saved(sender, instance, **kwargs):
+    notify_event_changed(instance.pk, 'event')
+
+
+@receiver([post_save, post_delete], sender='events.Track')
+def track_saved(sender, instance, **kwargs):
+    notify_event_changed(instance.event_id, 'track')
+
+
+@receiver([post_save, post_delete], sender='events.Registration')
+def registration_saved(sender, instance, **kwargs):
+    notify_event_changed(instance.event_id, 'capacity', [instance.attendee_id])
+
+
+@receiver([post_save, post_delete], sender='events.Session')
+def session_saved(sender, instance, **kwargs):
+    if type(instance).track.is_cached(instance):
+        event_id = instance.track.event_id
+    else:
+        from .models import Track
+        event_id = Track.objects.filter(pk=instance.track_id).values_list('event_id', flat=True).first()
+    notify_event_changed(event_id, 'session')
+
+
+@receiver([post_save, post_delete], sender='events.SessionRegistration')
+def session_registration_saved(sender, instance, **kwargs):
+    session = instance.session if type(instance).session.is_cached(instance) else None
+    notify_event_changed(_session_event_id(instance.session_id, session), 'capacity', [instance.attendee_id])
+
+
+@receiver([post_save, post_delete], sender='events.EventUserObjectPermission')
+def event_permission_saved(sender, instance, **kwargs):
+    # Managers see more sessions and registrations than attendees
+    notify_event_changed(instance.content_object_id, 'event', [instance.user_id])
+
+
+@receiver([post_save, post_delete], sender='events.EventGroupObjectPermission')
+def event_group_permission_saved(sender, instance, **kwargs):
+    from django.contrib.auth.models import User
+    members = User.groups.through.objects.filter(group_id=instance.group_id).values_list('user_id', flat=True)
+    notify_event_changed(instance.content_object_id, 'event', list(members))
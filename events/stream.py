@@ -0,0 +1,252 @@
+"""
+Server-Sent Events change stream served directly over ASGI.
+
+Changes reported through the ``event_changed`` signal are fanned out in
+process to every connected client. With ``EVENT_STREAM_PG_NOTIFY`` enabled,
+changes are published with Postgres ``NOTIFY`` instead and each worker
+relays them from a ``LISTEN`` connection, so writes made by any worker
+reach clients connected to every other worker.
+"""
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from urllib.parse import parse_qs
+from asgiref.sync import ThreadSensitiveContext
+from asgiref.wsgi import WsgiToAsgi
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.dispatch import receiver
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
+from .revocation import is_token_revoked
+from .signals import event_changed
+
+logger = logging.getLogger(__name__)
+
+STREAM_PATH = '/api/events/stream/'
+NOTIFY_CHANNEL = 'event_changes'
+
+
+class Subscription:
+    def __init__(self, event_ids=None, max_queue=None):
+        self.event_ids = event_ids
+        self.queue = asyncio.Queue(maxsize=max_queue or settings.EVENT_STREAM_QUEUE_SIZE)
+
+    def wants(self, message):
+        return not self.event_ids or message.get('event_id') in self.event_ids
+
+
+class Broker:
+    """In-process fan-out of change messages to stream subscribers."""
+
+    def __init__(self):
+        self._subscriptions = set()
+        self._loop = None
+        self._listener = None
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscriptions)
+
+    def subscribe(self, event_ids=None):
+        # Must be called from the event loop that serves the connections
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(event_ids)
+        self._subscriptions.add(subscription)
+        if settings.EVENT_STREAM_PG_NOTIFY:
+            self._ensure_listener()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self._subscriptions.discard(subscription)
+
+    def publish(self, message):
+        """Queue a message for every subscriber; safe to call from any thread."""
+        loop = self._loop
+        if loop is None or not self._subscriptions or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._fan_out, message)
+
+    def _fan_out(self, message):
+        for subscription in list(self._subscriptions):
+            if not subscription.wants(message):
+                continue
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A stalled client only misses messages; it refetches on reconnect
+                pass
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = PostgresNotifyListener(self)
+                self._listener.start()
+
+
+class PostgresNotifyListener(threading.Thread):
+    """Relay Postgres NOTIFY payloads on NOTIFY_CHANNEL into a broker."""
+
+    def __init__(self, broker, alias='default'):
+        super().__init__(name='event-stream-listener', daemon=True)
+        self.broker = broker
+        self.alias = alias
+
+    def run(self):
+        import psycopg2
+        import psycopg2.extensions
+        while True:
+            try:
+                params = connections[self.alias].get_connection_params()
+                conn = psycopg2.connect(**params)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN {NOTIFY_CHANNEL}')
+                while True:
+                    if select.select([conn], [], [], 5) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        self.broker.publish(json.loads(notify.payload))
+            except Exception:
+                logger.exception('Event stream listener lost its connection, reconnecting')
+                time.sleep(1)
+
+
+broker = Broker()
+
+
+def _notify_postgres(message):
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_notify(%s, %s)', [NOTIFY_CHANNEL, json.dumps(message)])
+
+
+@receiver(event_changed)
+def publish_event_change(sender, event_id, kind, **kwargs):
+    message = {'kind': kind, 'event_id': event_id}
+    # Publish after commit so clients never refetch data that is not visible yet
+    if settings.EVENT_STREAM_PG_NOTIFY:
+        transaction.on_commit(lambda: _notify_postgres(message))
+    else:
+        transaction.on_commit(lambda: broker.publish(message))
+
+
+def format_message(message):
+    return f"event: change\ndata: {json.dumps(message)}\n\n".encode()
+
+
+def _authenticate(scope, query):
+    token = (query.get('token') or [None])[0]
+    if token is None:
+        for name, value in scope.get('headers', []):
+            if name == b'authorization':
+                parts = value.decode('latin1').split()
+                if len(parts) == 2 and parts[0] in settings.SIMPLE_JWT['AUTH_HEADER_TYPES']:
+                    token = parts[1]
+    if token is None:
+        return False
+    try:
+        return not is_token_revoked(AccessToken(token))
+    except TokenError:
+        return False
+
+
+async def _send_status(send, status_code, body):
+    await send({
+        'type': 'http.response.start',
+        'status': status_code,
+        'headers': [(b'content-type', b'application/json')],
+    })
+    await send({'type': 'http.response.body', 'body': json.dumps({'detail': body}).encode()})
+
+
+async def event_stream(scope, receive, send, heartbeat=None):
+    """
+    ASGI application streaming change messages as Server-Sent Events.
+
+    Clients authenticate with an access token in ``?token=`` (EventSource
+    cannot set headers) or an ``Authorization`` header, and may limit the
+    stream to specific events with repeated ``?event=<id>`` parameters.
+    """
+    query = parse_qs(scope.get('query_string', b'').decode())
+    if not _authenticate(scope, query):
+        await _send_status(send, 401, 'Authentication credentials were not provided or are invalid.')
+        return
+    try:
+        event_ids = {int(value) for value in query.get('event', [])}
+    except ValueError:
+        await _send_status(send, 400, 'Event ids must be integers.')
+        return
+
+    heartbeat = heartbeat or settings.EVENT_STREAM_HEARTBEAT
+    subscription = broker.subscribe(event_ids)
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': b': connected\n\n', 'more_body': True})
+        while not disconnected.done():
+            next_message = asyncio.ensure_future(subscription.queue.get())
+            done, _ = await asyncio.wait(
+                {next_message, disconnected}, timeout=heartbeat, return_when=asyncio.FIRST_COMPLETED
+            )
+            if next_message in done:
+                await send({'type': 'http.response.body', 'body': format_message(next_message.result()), 'more_body': True})
+                continue
+            next_message.cancel()
+            if not disconnected.done():
+                # Comment line keeps proxies from closing idle connections
+                await send({'type': 'http.response.body', 'body': b': ping\n\n', 'more_body': True})
+    finally:
+        broker.unsubscribe(subscription)
+        disconnected.cancel()
+
+
+async def _wait_for_disconnect(receive):
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return
+
+
+class EventStreamRouter:
+    """
+    Serve STREAM_PATH with the event stream and everything else with the
+    Django WSGI application.
+
+    Django's ASGI handler reads a synchronous streaming response into memory
+    before sending any of it, which would break exports, calendar feeds and
+    streamed lists. Running the rest of the API as WSGI in a thread of its
+    own per request sends those bodies a chunk at a time.
+    """
+
+    def __init__(self, wsgi_application):
+        self.wsgi_application = wsgi_application
+        self.application = WsgiToAsgi(self.close_response)
+
+    def close_response(self, environ, start_response):
+        # WsgiToAsgi never closes the response, and Django only sends
+        # request_finished, which releases the database connection, on close
+        response = self.wsgi_application(environ, start_response)
+        try:
+            yield from response
+        finally:
+            response.close()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope['path'] == STREAM_PATH and scope['method'] == 'GET':
+            return await event_stream(scope, receive, send)
+        async with ThreadSensitiveContext():
+            return await self.application(scope, receive, send)
@@ -0,0 +1,50 @@
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+# Rows fetched per database round trip when streaming
+STREAM_CHUNK_SIZE = 500
+
+
+def wants_stream(request):
+    """Return whether the client asked for a streamed response with ``?stream=``."""
+    return request.query_params.get('stream') in ('1', 'true')
+
+
+def stream_json_array(queryset, serializer_class, context=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Serialize a queryset as a JSON array without materializing it.
+
+    Rows are pulled with ``.iterator(chunk_size=...)`` and rendered one at a
+    time, so peak memory is bounded by the chunk size rather than the result.
+    """
+    renderer = JSONRenderer()
+
+    def rows():
+        yield b'['
+        separator = b''
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            yield separator + renderer.render(serializer_class(obj, context=context).data)
+            separator = b','
+        yield b']'
+
+    return StreamingHttpResponse(rows(), content_type='application/json')
+
+
+class NestedListMixin:
+    """
+    Render nested list actions through the view's paginator, or as a
+    streamed JSON array when the client passes ``?stream=true``.
+    """
+    stream_chunk_size = STREAM_CHUNK_SIZE
+
+    def nested_list_response(self, queryset, serializer_class):
+        context = self.get_serializer_context()
+        if wants_stream(self.request):
+            return stream_json_array(queryset, serializer_class, context, self.stream_chunk_size)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = serializer_class(page, many=True, context=context)
+            return self.get_paginated_response(serializer.data)
+        serializer = serializer_class(queryset, many=True, context=context)
+        return Response(serializer.data)
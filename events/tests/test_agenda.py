@@ -0,0 +1,156 @@
+from django.core.cache import cache
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Track, Session, Registration, SessionRegistration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class AgendaAPITestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        # Create test users
+        self.organizer = User.objects.create_user(
+            username='agenda_organizer',
+            email='agenda_organizer@example.com',
+            password='password123'
+        )
+        self.attendee = User.objects.create_user(
+            username='agenda_attendee',
+            email='agenda_attendee@example.com',
+            password='password123'
+        )
+
+        # Create test events: one attended, one pending and one unrelated
+        self.start = timezone.now() + timedelta(days=10)
+        self.event, self.pending_event, self.other_event = [
+            Event.objects.create(
+                title=title,
+                description='A test conference for agenda testing',
+                start_date=self.start,
+                end_date=self.start + timedelta(days=1),
+                venue='Agenda Venue',
+                capacity=100,
+                organizer=self.organizer
+            )
+            for title in ('Agenda Conference', 'Pending Conference', 'Other Conference')
+        ]
+        Registration.objects.create(event=self.event, attendee=self.attendee, status='confirmed')
+        Registration.objects.create(event=self.pending_event, attendee=self.attendee, status='pending')
+
+        # Two parallel tracks so sessions can overlap
+        self.tracks = [Track.objects.create(event=self.event, name=f'Track {i}') for i in range(2)]
+        self.other_track = Track.objects.create(event=self.other_event, name='Other Track')
+        self.url = reverse('me-agenda')
+        self.client.force_authenticate(user=self.attendee)
+
+    def add_session(self, track, hour, length=1, register=True):
+        session = Session.objects.create(
+            track=track,
+            title=f'Session at {hour}',
+            description='A test session for agenda testing',
+            start_time=self.start + timedelta(hours=hour),
+            end_time=self.start + timedelta(hours=hour + length)
+        )
+        if register:
+            SessionRegistration.objects.create(session=session, attendee=self.attendee)
+        return session
+
+    def test_agenda(self):
+        """Test that the agenda lists confirmed events and registered sessions with conflicts"""
+        first = self.add_session(self.tracks[0], 1, length=2)
+        clash = self.add_session(self.tracks[1], 2)
+        later = self.add_session(self.tracks[0], 3)
+        self.add_session(self.tracks[1], 5, register=False)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([event['id'] for event in response.data['events']], [self.event.pk])
+        sessions = {session['id']: session for session in response.data['sessions']}
+        self.assertEqual(list(sessions), [first.pk, clash.pk, later.pk])
+        self.assertEqual(sessions[first.pk]['conflicts_with'], [clash.pk])
+        self.assertEqual(sessions[clash.pk]['conflicts_with'], [first.pk])
+        # Back-to-back sessions do not conflict
+        self.assertEqual(sessions[later.pk]['conflicts_with'], [])
+        self.assertEqual(sessions[later.pk]['track'], {'id': self.tracks[0].pk, 'name': 'Track 0'})
+        self.assertTrue(response.data['has_conflicts'])
+
+    def test_query_count_is_constant(self):
+        """Test that the agenda is built with the same number of queries for any size"""
+        self.add_session(self.tracks[0], 1)
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+        cache.clear()
+        for hour in range(2, 12):
+            self.add_session(self.tracks[hour % 2], hour, length=2)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['sessions']), 11)
+
+    def test_agenda_is_cached_per_user(self):
+        """Test that repeated requests are served from cache and validated with ETags"""
+        self.add_session(self.tracks[0], 1)
+        first = self.client.get(self.url)
+        self.assertEqual(first['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second['X-Cache'], 'HIT')
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['sessions'], [])
+
+    def test_session_registration_invalidates_agenda(self):
+        """Test that registering for a session refreshes the agenda"""
+        self.add_session(self.tracks[0], 1)
+        self.client.get(self.url)
+        self.add_session(self.tracks[0], 2)
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.data['sessions']), 2)
+
+    def test_attended_event_changes_invalidate_agenda(self):
+        """Test that changes to attended events refresh the agenda while others do not"""
+        session = self.add_session(self.tracks[0], 1)
+        self.client.get(self.url)
+
+        self.add_session(self.other_track, 1, register=False)
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'HIT')
+
+        session.title = 'Renamed Session'
+        session.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['sessions'][0]['title'], 'Renamed Session')
+
+    def test_bulk_approval_invalidates_agenda(self):
+        """Test that confirming registrations in bulk refreshes the agenda"""
+        self.client.get(self.url)
+        self.client.force_authenticate(user=self.organizer)
+        registration = Registration.objects.get(event=self.pending_event, attendee=self.attendee)
+        self.client.post(reverse('registration-bulk-approve'), {'ids': [registration.pk]}, format='json')
+
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.get(self.url)
+        self.assertEqual(
+            [event['id'] for event in response.data['events']],
+            sorted([self.event.pk, self.pending_event.pk])
+        )
+
+    def test_only_me_actions_are_routed(self):
+        """Test that /me/ has no list or detail route besides its actions"""
+        self.client.force_authenticate(user=self.attendee)
+        self.assertEqual(self.client.get('/api/me/').status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(f'/api/me/{self.attendee.pk}/').status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_agenda_requires_authentication(self):
+        """Test that anonymous users have no agenda"""
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,122 @@
+from unittest import skipUnless
+from django.core.cache import cache
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.db import connection
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Track, Session
+from datetime import timedelta
+from django.utils import timezone
+
+
+def pg_trgm_installed():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+class AutocompleteAPITestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.organizer = User.objects.create_user(
+            username='autocomplete_organizer',
+            email='autocomplete_organizer@example.com',
+            password='password123'
+        )
+        self.speaker = User.objects.create_user(username='pyconf_speaker', password='password123')
+        User.objects.create_user(username='pyconf_listener', password='password123')
+        start = timezone.now() + timedelta(days=10)
+        self.events = [
+            Event.objects.create(
+                title=title,
+                description='A test conference for autocomplete testing',
+                start_date=start,
+                end_date=start + timedelta(days=1),
+                venue=venue,
+                capacity=100,
+                organizer=self.organizer
+            )
+            for title, venue in [
+                ('Deep PyConf Workshop', 'Pyramid Hall'),
+                ('PyConf', 'Pyramid Hall'),
+                ('PyConf Europe', 'Harbour Center'),
+                ('Music Night', 'Harbour Center'),
+            ]
+        ]
+        track = Track.objects.create(event=self.events[0], name='Autocomplete Track')
+        Session.objects.create(
+            track=track,
+            title='Autocomplete Session',
+            description='A test session for autocomplete testing',
+            speaker=self.speaker,
+            start_time=start + timedelta(hours=1),
+            end_time=start + timedelta(hours=2)
+        )
+        self.url = reverse('autocomplete-list')
+        self.client.force_authenticate(user=self.organizer)
+
+    def test_suggestions_are_ranked_by_prefix(self):
+        """Test that prefix matches come first, in alphabetical order"""
+        response = self.client.get(self.url, {'q': 'pycon'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['label'] for item in response.data['events']],
+            ['PyConf', 'PyConf Europe', 'Deep PyConf Workshop']
+        )
+        self.assertEqual(response.data['events'][0], {'id': self.events[1].pk, 'label': 'PyConf'})
+
+    def test_venues_are_distinct(self):
+        """Test that each venue is suggested once"""
+        response = self.client.get(self.url, {'q': 'hall'})
+        self.assertEqual(response.data['venues'], [{'id': 'Pyramid Hall', 'label': 'Pyramid Hall'}])
+
+    def test_only_speakers_are_suggested(self):
+        """Test that users who do not speak at any session are not suggested"""
+        response = self.client.get(self.url, {'q': 'pyconf_'})
+        self.assertEqual(response.data['speakers'], [{'id': self.speaker.pk, 'label': 'pyconf_speaker'}])
+
+    def test_limit(self):
+        """Test that ?limit= caps every category"""
+        response = self.client.get(self.url, {'q': 'py', 'limit': 1})
+        self.assertEqual(len(response.data['events']), 1)
+        response = self.client.get(self.url, {'q': 'py', 'limit': 1000})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_short_query_is_rejected(self):
+        """Test that a single character is not enough to search"""
+        response = self.client.get(self.url, {'q': 'p'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_only_list_is_routed(self):
+        """Test that suggestions have no detail route"""
+        response = self.client.get(f'{self.url}1/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_responses_are_cached_per_prefix(self):
+        """Test that repeated prefixes are served from cache until events change"""
+        first = self.client.get(self.url, {'q': 'pycon'})
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertIn('max-age=', first['Cache-Control'])
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {'q': 'pycon'})
+        self.assertEqual(second['X-Cache'], 'HIT')
+
+        self.events[3].title = 'PyConf Asia'
+        self.events[3].save()
+        third = self.client.get(self.url, {'q': 'pycon'})
+        self.assertEqual(third['X-Cache'], 'MISS')
+        self.assertEqual(len(third.data['events']), 4)
+
+    @skipUnless(connection.vendor == 'postgresql', 'Requires PostgreSQL')
+    def test_title_search_uses_trigram_index(self):
+        """Test that substring matches on titles can use the trigram index"""
+        if not pg_trgm_installed():
+            self.skipTest('pg_trgm extension is not installed')
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                plan = Event.objects.filter(title__icontains='pycon').order_by().explain()
+            finally:
+                cursor.execute('SET enable_seqscan = on')
+        self.assertIn('event_title_upper_trgm_idx', plan)
@@ -0,0 +1,140 @@
+from unittest import mock
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events import bulk
+from events.models import Event, Registration, WaitlistEntry
+from datetime import timedelta
+from django.utils import timezone
+
+
+class BulkRegistrationAPITestCase(APITestCase):
+    def setUp(self):
+        # Create test users
+        self.organizer = User.objects.create_user(
+            username='bulk_organizer',
+            email='bulk_organizer@example.com',
+            password='password123'
+        )
+        self.outsider = User.objects.create_user(
+            username='bulk_outsider',
+            email='bulk_outsider@example.com',
+            password='password123'
+        )
+        self.attendees = User.objects.bulk_create([
+            User(username=f'bulk_attendee_{i}') for i in range(6)
+        ])
+
+        # Create test event
+        self.event = Event.objects.create(
+            title='Bulk Test Conference',
+            description='A test conference for bulk API testing',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='Bulk Test Venue',
+            capacity=4,
+            organizer=self.organizer
+        )
+        self.registrations = [
+            Registration.objects.create(event=self.event, attendee=attendee)
+            for attendee in self.attendees
+        ]
+
+        # URLs
+        self.bulk_approve_url = reverse('registration-bulk-approve')
+        self.bulk_cancel_url = reverse('registration-bulk-cancel')
+        self.bulk_register_url = reverse('event-registrations-bulk', kwargs={'pk': self.event.pk})
+
+    def confirmed_count(self):
+        return Event.objects.get(pk=self.event.pk).confirmed_count
+
+    def test_bulk_approve_respects_capacity(self):
+        """Test that bulk approval admits up to capacity and reports the rest as full"""
+        self.client.force_authenticate(user=self.organizer)
+        ids = [registration.pk for registration in self.registrations] + [999999]
+        response = self.client.post(self.bulk_approve_url, {'ids': ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = [item['result'] for item in response.data['results']]
+        self.assertEqual(results, ['approved'] * 4 + ['full'] * 2 + ['not_found'])
+        self.assertEqual(self.confirmed_count(), 4)
+        self.assertEqual(Registration.objects.filter(status='confirmed').count(), 4)
+
+    def test_bulk_approve_forbidden_for_non_organizer(self):
+        """Test that only the organizer can bulk approve"""
+        self.client.force_authenticate(user=self.outsider)
+        response = self.client.post(
+            self.bulk_approve_url, {'ids': [self.registrations[0].pk]}, format='json'
+        )
+        self.assertEqual(response.data['results'][0]['result'], 'forbidden')
+        self.assertEqual(self.confirmed_count(), 0)
+
+    def test_bulk_approve_requires_ids(self):
+        """Test that an empty id list is rejected"""
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.post(self.bulk_approve_url, {'ids': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_cancel_frees_seats_and_promotes_waitlist(self):
+        """Test that bulk cancellation decrements the counter and promotes the waitlist"""
+        for registration in self.registrations[:4]:
+            registration.confirm()
+        waiting = User.objects.create_user(username='bulk_waiting', password='password123')
+        WaitlistEntry.enqueue(event=self.event, attendee=waiting)
+
+        self.client.force_authenticate(user=self.organizer)
+        ids = [registration.pk for registration in self.registrations[:2]]
+        response = self.client.post(self.bulk_cancel_url, {'ids': ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['result'] for item in response.data['results']], ['cancelled'] * 2)
+        self.assertEqual(self.confirmed_count(), 3)
+        self.assertEqual(Registration.objects.get(attendee=waiting).status, 'confirmed')
+
+    def test_bulk_register(self):
+        """Test that organizers can register many users at once"""
+        new_users = User.objects.bulk_create([User(username=f'bulk_new_{i}') for i in range(3)])
+        self.client.force_authenticate(user=self.organizer)
+        data = {
+            'user_ids': [user.pk for user in new_users] + [self.attendees[0].pk],
+            'status': 'confirmed'
+        }
+        response = self.client.post(self.bulk_register_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = [item['result'] for item in response.data['results']]
+        self.assertEqual(results, ['registered'] * 3 + ['already_registered'])
+        self.assertEqual(self.confirmed_count(), 3)
+
+    def test_bulk_register_pending_when_full(self):
+        """Test that pending registrations are refused once the event is full, like single registrations"""
+        Event.objects.filter(pk=self.event.pk).update(confirmed_count=self.event.capacity)
+        new_user = User.objects.create_user(username='bulk_late')
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.post(self.bulk_register_url, {'user_ids': [new_user.pk]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['result'], 'full')
+        self.assertFalse(Registration.objects.filter(attendee=new_user).exists())
+
+    def test_bulk_register_concurrent_registration(self):
+        """Test that users who register between the check and the insert are reported, not a 500"""
+        new_users = User.objects.bulk_create([User(username=f'bulk_race_{i}') for i in range(2)])
+        # The first user registers after bulk_register has checked for existing registrations
+        Registration.objects.create(event=self.event, attendee=new_users[0])
+        taken = bulk._registered_attendees(self.event, [new_users[0].pk])
+        self.client.force_authenticate(user=self.organizer)
+        with mock.patch.object(bulk, '_registered_attendees', side_effect=[set(), taken]):
+            response = self.client.post(
+                self.bulk_register_url, {'user_ids': [user.pk for user in new_users]}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['result'] for item in response.data['results']], ['already_registered', 'registered']
+        )
+        self.assertTrue(Registration.objects.filter(event=self.event, attendee=new_users[1]).exists())
+
+    def test_bulk_register_forbidden_for_non_organizer(self):
+        """Test that non-organizers cannot bulk register"""
+        self.client.force_authenticate(user=self.outsider)
+        response = self.client.post(
+            self.bulk_register_url, {'user_ids': [self.outsider.pk]}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,136 @@
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.calendar import content_line, feed_token
+from events.models import Event, Track, Session, Registration, SessionRegistration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class CalendarFeedAPITestCase(APITestCase):
+    def setUp(self):
+        # Create test users
+        self.organizer = User.objects.create_user(
+            username='calendar_organizer',
+            email='calendar_organizer@example.com',
+            password='password123'
+        )
+        self.attendee = User.objects.create_user(
+            username='calendar_attendee',
+            email='calendar_attendee@example.com',
+            password='password123'
+        )
+
+        # Create test event, track and sessions
+        start = timezone.now() + timedelta(days=10)
+        self.event = Event.objects.create(
+            title='Calendar Test Conference',
+            description='A test conference for calendar feed testing',
+            start_date=start,
+            end_date=start + timedelta(days=1),
+            venue='Calendar Hall',
+            capacity=100,
+            organizer=self.organizer
+        )
+        self.track = Track.objects.create(event=self.event, name='Main Track')
+        self.sessions = [
+            Session.objects.create(
+                track=self.track,
+                title=f'Session {i}, part {i}',
+                description='Line one\nLine two; with a semicolon',
+                speaker=self.organizer,
+                start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=45)
+            )
+            for i in range(3)
+        ]
+        Registration.objects.create(event=self.event, attendee=self.attendee, status='confirmed')
+        SessionRegistration.objects.create(session=self.sessions[1], attendee=self.attendee)
+
+        self.event_url = reverse('event-calendar', kwargs={'pk': self.event.pk})
+        self.my_url = reverse('me-calendar')
+        self.client.force_authenticate(user=self.attendee)
+
+    def feed(self, url, **kwargs):
+        response = self.client.get(url, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_event_feed(self):
+        """Test that the event feed lists every session as an escaped VEVENT"""
+        self.assertEqual(self.event_url, f'/api/events/{self.event.pk}/calendar.ics')
+        response, body = self.feed(self.event_url)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        self.assertTrue(body.startswith('BEGIN:VCALENDAR\r\nVERSION:2.0\r\n'))
+        self.assertTrue(body.endswith('END:VCALENDAR\r\n'))
+        self.assertEqual(body.count('BEGIN:VEVENT'), 3)
+        self.assertIn(f'UID:session-{self.sessions[0].pk}@', body)
+        self.assertIn('SUMMARY:Session 0\\, part 0\r\n', body)
+        self.assertIn('Line one\\nLine two\\; with a semicolon', body)
+        self.assertIn('LOCATION:Calendar Hall (Main Track)\r\n', body)
+
+    def test_long_lines_are_folded(self):
+        """Test that content lines are folded at 75 octets without splitting characters"""
+        line = content_line('DESCRIPTION', 'é' * 100)
+        parts = line.rstrip(b'\r\n').split(b'\r\n ')
+        self.assertTrue(all(len(part) <= 75 for part in parts))
+        self.assertEqual(b''.join(parts).decode(), 'DESCRIPTION:' + 'é' * 100)
+
+    def test_my_feed_lists_registered_sessions(self):
+        """Test that the personal feed only lists the user's session registrations"""
+        response, body = self.feed(self.my_url)
+        self.assertEqual(body.count('BEGIN:VEVENT'), 1)
+        self.assertIn(f'UID:session-{self.sessions[1].pk}@', body)
+
+    def test_unchanged_feed_returns_304(self):
+        """Test that polling with the ETag returns 304 until a session changes"""
+        response, _ = self.feed(self.event_url)
+        etag = response['ETag']
+        # Only the event is loaded, so deleted events answer 404
+        with self.assertNumQueries(1):
+            response = self.client.get(self.event_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.sessions[0].title = 'Renamed Session'
+        self.sessions[0].save()
+        response, body = self.feed(self.event_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('SUMMARY:Renamed Session', body)
+
+    def test_my_feed_etag_changes_with_registrations(self):
+        """Test that registering for another session invalidates the personal feed ETag"""
+        response, _ = self.feed(self.my_url)
+        etag = response['ETag']
+        response = self.client.get(self.my_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        SessionRegistration.objects.create(session=self.sessions[2], attendee=self.attendee)
+        response, body = self.feed(self.my_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(body.count('BEGIN:VEVENT'), 2)
+
+    def test_feed_token_authentication(self):
+        """Test that calendar clients can authenticate with the feed URL token"""
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.my_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(user=self.attendee)
+        link = self.client.get(reverse('me-calendar-link')).data['url']
+        self.assertIn('/api/me/calendar.ics?token=', link)
+        self.client.force_authenticate(user=None)
+        _, body = self.feed(self.my_url, data={'token': feed_token(self.attendee)}, HTTP_ACCEPT='text/calendar')
+        self.assertEqual(body.count('BEGIN:VEVENT'), 1)
+
+        response = self.client.get(self.my_url, {'token': 'forged'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_revokes_feed_token(self):
+        """Test that changing the password invalidates issued feed URLs"""
+        token = feed_token(self.attendee)
+        self.attendee.set_password('new-password123')
+        self.attendee.save()
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.event_url, {'token': token})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
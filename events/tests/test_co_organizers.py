@@ -0,0 +1,215 @@
+from django.contrib.auth.models import Group, User
+from django.urls import reverse
+from guardian.shortcuts import assign_perm
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Track, Session, Registration, MANAGE_EVENT
+from datetime import timedelta
+from django.utils import timezone
+
+
+class CoOrganizerAPITestCase(APITestCase):
+    def setUp(self):
+        # Create test users
+        self.organizer = User.objects.create_user(
+            username='co_organizer_owner',
+            email='co_organizer_owner@example.com',
+            password='password123'
+        )
+        self.co_organizer = User.objects.create_user(username='co_organizer_helper', password='password123')
+        self.attendee = User.objects.create_user(username='co_organizer_attendee', password='password123')
+
+        self.start = timezone.now() + timedelta(days=10)
+        self.event = self.create_event('Shared Conference')
+        self.track = Track.objects.create(event=self.event, name='Main Track')
+        self.co_organizers_url = reverse('event-co-organizers', kwargs={'pk': self.event.pk})
+
+    def create_event(self, title, organizer=None):
+        return Event.objects.create(
+            title=title,
+            description='A test conference for co-organizer testing',
+            start_date=self.start,
+            end_date=self.start + timedelta(days=2),
+            venue='Shared Venue',
+            capacity=100,
+            organizer=organizer or self.organizer
+        )
+
+    def grant(self):
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.post(self.co_organizers_url, {'user_id': self.co_organizer.pk}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.client.force_authenticate(user=self.co_organizer)
+
+    def test_grant_and_list_co_organizers(self):
+        """Test that the organizer can add co-organizers and list them"""
+        self.grant()
+        response = self.client.get(self.co_organizers_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data], ['co_organizer_helper'])
+
+    def test_co_organizer_can_edit_but_not_delete_event(self):
+        """Test that co-organizers may update the event while only the organizer may delete it"""
+        url = reverse('event-detail', kwargs={'pk': self.event.pk})
+        self.client.force_authenticate(user=self.co_organizer)
+        response = self.client.patch(url, {'venue': 'Moved Venue'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.grant()
+        response = self.client.patch(url, {'venue': 'Moved Venue'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['venue'], 'Moved Venue')
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(Event.objects.filter(pk=self.event.pk).exists())
+
+    def test_co_organizer_can_manage_sessions_and_registrations(self):
+        """Test that organizer-only endpoints accept co-organizers"""
+        registration = Registration.objects.create(event=self.event, attendee=self.attendee, status='pending')
+        self.grant()
+
+        sessions_url = reverse('track-sessions-list', kwargs={'event_pk': self.event.pk, 'track_pk': self.track.pk})
+        response = self.client.post(sessions_url, {
+            'title': 'Co-organized Session',
+            'description': 'Added by a co-organizer',
+            'start_time': (self.start + timedelta(hours=1)).isoformat(),
+            'end_time': (self.start + timedelta(hours=2)).isoformat()
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get('/api/registrations/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data['results']], [registration.pk])
+
+        response = self.client.post(reverse('registration-approve', kwargs={'pk': registration.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        registration.refresh_from_db()
+        self.assertEqual(registration.status, 'confirmed')
+
+    def test_co_organizer_cannot_change_co_organizers(self):
+        """Test that only the organizer can grant or revoke co-organizer access"""
+        self.grant()
+        response = self.client.post(self.co_organizers_url, {'user_id': self.attendee.pk}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        url = reverse('event-co-organizer-detail', kwargs={'pk': self.event.pk, 'user_id': self.co_organizer.pk})
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_revoke_co_organizer(self):
+        """Test that revoked co-organizers lose access and no longer see the event's sessions"""
+        session = Session.objects.create(
+            track=self.track,
+            title='Private Session',
+            description='Only visible to organizers and attendees',
+            start_time=self.start,
+            end_time=self.start + timedelta(hours=1)
+        )
+        session_url = reverse('track-sessions-detail', kwargs={
+            'event_pk': self.event.pk, 'track_pk': self.track.pk, 'pk': session.pk
+        })
+        self.grant()
+        self.assertEqual(self.client.get(session_url).status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.organizer)
+        url = reverse('event-co-organizer-detail', kwargs={'pk': self.event.pk, 'user_id': self.co_organizer.pk})
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.client.force_authenticate(user=self.co_organizer)
+        response = self.client.get(reverse('event-speaker-conflicts', kwargs={'pk': self.event.pk}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.client.get(session_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_group_permission_grants_access(self):
+        """Test that manage_event granted to a group applies to its members"""
+        staff = Group.objects.create(name='Event staff')
+        self.co_organizer.groups.add(staff)
+        assign_perm(MANAGE_EVENT, staff, self.event)
+        self.client.force_authenticate(user=self.co_organizer)
+        response = self.client.get(reverse('event-speaker-conflicts', kwargs={'pk': self.event.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_bulk_approve_as_co_organizer(self):
+        """Test that bulk approval checks manage_event across several events"""
+        events = [self.create_event(f'Bulk Conference {i}', organizer=self.attendee) for i in range(3)]
+        registrations = []
+        for event in events:
+            assign_perm(MANAGE_EVENT, self.co_organizer, event)
+            registrations.append(Registration.objects.create(event=event, attendee=self.organizer))
+        foreign = Registration.objects.create(
+            event=self.create_event('Foreign Conference', organizer=self.attendee), attendee=self.organizer
+        )
+        self.client.force_authenticate(user=self.co_organizer)
+        response = self.client.post(
+            '/api/registrations/bulk-approve/',
+            {'ids': [registration.pk for registration in registrations] + [foreign.pk]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['result'] for item in response.data['results']],
+            ['approved', 'approved', 'approved', 'forbidden']
+        )
+
+
+class ManagedEventsAPITestCase(APITestCase):
+    """Test the events the requesting user manages, with per-object permissions"""
+
+    # pagination COUNT, events, user permissions, group permissions
+    PAGE_QUERIES = 4
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(username='managed_owner', password='password123')
+        self.user = User.objects.create_user(username='managed_user', password='password123')
+        self.staff = Group.objects.create(name='Managed staff')
+        self.user.groups.add(self.staff)
+        self.url = reverse('me-managed-events')
+        self.start = timezone.now() + timedelta(days=10)
+
+    def create_events(self, count, organizer):
+        return Event.objects.bulk_create([
+            Event(
+                title=f'Managed Conference {i}',
+                description='A test conference for managed event listing',
+                start_date=self.start + timedelta(days=i),
+                end_date=self.start + timedelta(days=i + 1),
+                venue='Managed Venue',
+                capacity=100,
+                organizer=organizer
+            )
+            for i in range(count)
+        ])
+
+    def test_lists_roles_and_permissions(self):
+        """Test that organized, co-organized and group-managed events are listed with their role"""
+        owned, = self.create_events(1, self.user)
+        granted, via_group, unrelated = self.create_events(3, self.organizer)
+        assign_perm(MANAGE_EVENT, self.user, granted)
+        assign_perm('view_event_details', self.user, granted)
+        assign_perm(MANAGE_EVENT, self.staff, via_group)
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        listed = {item['id']: item for item in response.data['results']}
+        self.assertEqual(set(listed), {owned.pk, granted.pk, via_group.pk})
+        self.assertEqual(listed[owned.pk]['role'], 'organizer')
+        self.assertEqual(listed[granted.pk]['role'], 'co_organizer')
+        self.assertEqual(listed[granted.pk]['permissions'], [MANAGE_EVENT, 'view_event_details'])
+        self.assertEqual(listed[via_group.pk]['permissions'], [MANAGE_EVENT])
+
+    def test_permission_checks_are_prefetched(self):
+        """Test that a 100-event page checks permissions with a fixed number of queries"""
+        events = self.create_events(100, self.organizer)
+        for event in events[:50]:
+            assign_perm(MANAGE_EVENT, self.user, event)
+        for event in events[50:]:
+            assign_perm(MANAGE_EVENT, self.staff, event)
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.url)
+
+        with self.assertNumQueries(self.PAGE_QUERIES):
+            response = self.client.get(self.url, {'page_size': 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 100)
+        self.assertTrue(all(item['permissions'] == [MANAGE_EVENT] for item in response.data['results']))
@@ -0,0 +1,158 @@
+import sys
+import threading
+import time
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework.test import APIClient
+from events.models import Event, Track, Session, Registration, SessionRegistration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class CapacityAdmissionConcurrencyTestCase(TransactionTestCase):
+    """Stress test for concurrent registration approvals"""
+
+    CAPACITY = 10
+    REGISTRATIONS = 60
+    THREADS = 12
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username='concurrency_organizer',
+            email='concurrency_organizer@example.com',
+            password='password123'
+        )
+        self.event = Event.objects.create(
+            title='Ticket Drop',
+            description='An event with far more demand than seats',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='Concurrency Venue',
+            capacity=self.CAPACITY,
+            organizer=self.organizer
+        )
+        self.registrations = [
+            Registration.objects.create(
+                event=self.event,
+                attendee=User.objects.create_user(username=f'rush_{i}', password='password123')
+            )
+            for i in range(self.REGISTRATIONS)
+        ]
+
+    def test_concurrent_approvals_never_oversell(self):
+        """Test that concurrent approvals confirm exactly `capacity` registrations"""
+        pending = list(self.registrations)
+        lock = threading.Lock()
+        results = []
+        start = threading.Barrier(self.THREADS)
+
+        def worker():
+            try:
+                start.wait()
+                while True:
+                    with lock:
+                        if not pending:
+                            return
+                        registration = pending.pop()
+                    confirmed = Registration.objects.get(pk=registration.pk).confirm()
+                    with lock:
+                        results.append(confirmed)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.THREADS)]
+        began = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - began
+
+        self.assertEqual(len(results), self.REGISTRATIONS)
+        self.assertEqual(results.count(True), self.CAPACITY)
+        self.assertEqual(
+            Registration.objects.filter(event=self.event, status='confirmed').count(),
+            self.CAPACITY
+        )
+        self.assertEqual(Event.objects.get(pk=self.event.pk).confirmed_count, self.CAPACITY)
+        sys.stderr.write(
+            f'\n{self.REGISTRATIONS} approvals over {self.THREADS} threads in '
+            f'{elapsed:.3f}s ({self.REGISTRATIONS / elapsed:.0f} approvals/s)\n'
+        )
+
+    def test_repeated_approval_is_idempotent(self):
+        """Test that approving the same registration concurrently takes one seat"""
+        registration = self.registrations[0]
+        start = threading.Barrier(self.THREADS)
+
+        def worker():
+            try:
+                start.wait()
+                Registration.objects.get(pk=registration.pk).confirm()
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(Event.objects.get(pk=self.event.pk).confirmed_count, 1)
+
+
+class DoubleBookingConcurrencyTestCase(TransactionTestCase):
+    """Concurrent sign-ups of one attendee for overlapping sessions"""
+
+    THREADS = 8
+
+    def setUp(self):
+        organizer = User.objects.create_user(username='booking_organizer', password='password123')
+        self.attendee = User.objects.create_user(username='booking_attendee', password='password123')
+        start = timezone.now() + timedelta(days=10)
+        self.event = Event.objects.create(
+            title='Parallel Tracks',
+            description='An event that forbids double booking',
+            start_date=start,
+            end_date=start + timedelta(days=1),
+            venue='Concurrency Venue',
+            capacity=100,
+            organizer=organizer,
+            prevent_double_booking=True
+        )
+        Registration.objects.create(event=self.event, attendee=self.attendee, status='confirmed')
+        self.sessions = [
+            Session.objects.create(
+                track=Track.objects.create(event=self.event, name=f'Track {i}'),
+                title=f'Parallel Session {i}',
+                description='Runs at the same time as every other session',
+                start_time=start + timedelta(hours=1),
+                end_time=start + timedelta(hours=2)
+            )
+            for i in range(self.THREADS)
+        ]
+
+    def test_concurrent_overlapping_signups_admit_one(self):
+        """Test that simultaneous overlapping sign-ups of one attendee register exactly one"""
+        start = threading.Barrier(self.THREADS)
+        statuses = []
+
+        def worker(session):
+            try:
+                client = APIClient()
+                client.force_authenticate(user=self.attendee)
+                start.wait()
+                response = client.post('/api/session-registrations/', {'session_id': session.pk}, format='json')
+                statuses.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(session,)) for session in self.sessions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(statuses), [201] + [400] * (self.THREADS - 1))
+        self.assertEqual(SessionRegistration.objects.filter(attendee=self.attendee).count(), 1)
@@ -0,0 +1,109 @@
+from django.core.cache import cache
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Registration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class ConditionalGetTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.organizer = User.objects.create_user(
+            username='etag_organizer',
+            email='etag_organizer@example.com',
+            password='password123'
+        )
+        self.attendee = User.objects.create_user(
+            username='etag_attendee',
+            email='etag_attendee@example.com',
+            password='password123'
+        )
+        self.event = Event.objects.create(
+            title='ETag Test Conference',
+            description='A test conference for conditional GET testing',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='ETag Test Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        self.registration = Registration.objects.create(event=self.event, attendee=self.attendee)
+        self.events_url = '/api/events/'
+        self.event_detail_url = reverse('event-detail', kwargs={'pk': self.event.pk})
+        self.registrations_url = reverse('registration-list')
+        self.client.force_authenticate(user=self.attendee)
+
+    def test_validators_are_returned(self):
+        """Test that read endpoints return ETag and Last-Modified headers"""
+        response = self.client.get(self.events_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertTrue(response.has_header('Last-Modified'))
+
+    def test_if_none_match_short_circuits(self):
+        """Test that a matching If-None-Match returns 304 without touching the database"""
+        etag = self.client.get(self.events_url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.events_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_if_modified_since_short_circuits(self):
+        """Test that a current If-Modified-Since returns 304"""
+        last_modified = self.client.get(self.event_detail_url)['Last-Modified']
+        response = self.client.get(self.event_detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_change_produces_new_etag(self):
+        """Test that a write changes the ETag and the full response is returned"""
+        etag = self.client.get(self.event_detail_url)['ETag']
+        self.event.venue = 'Moved Venue'
+        self.event.save()
+        response = self.client.get(self.event_detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['venue'], 'Moved Venue')
+
+    def test_registration_etags_are_per_user(self):
+        """Test that user-dependent endpoints do not share validators"""
+        etag = self.client.get(self.registrations_url)['ETag']
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(self.registrations_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_registration_change_produces_new_etag(self):
+        """Test that approving a registration invalidates the registration list"""
+        etag = self.client.get(self.registrations_url)['ETag']
+        self.registration.confirm()
+        response = self.client.get(self.registrations_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['status'], 'confirmed')
+
+    def test_missing_objects_are_not_reported_unmodified(self):
+        """Test that validators never turn a 404 into a 304"""
+        url = reverse('event-detail', kwargs={'pk': self.event.pk + 1000})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_hidden_objects_are_not_reported_unmodified(self):
+        """Test that objects outside the user's queryset answer 404 to If-None-Match: *"""
+        other = Registration.objects.create(event=self.event, attendee=self.organizer)
+        url = reverse('registration-detail', kwargs={'pk': other.pk})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        url = reverse('registration-detail', kwargs={'pk': self.registration.pk})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_cached_detail_short_circuits(self):
+        """Test that a detail response already cached for the request returns 304 without queries"""
+        etag = self.client.get(self.event_detail_url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.event_detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,130 @@
+from io import StringIO
+from django.core.management import call_command
+from django.contrib.auth.models import User
+from django.test import TestCase
+from events.models import Event, Track, Session, Registration, SessionRegistration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class RegistrationCounterTestCase(TestCase):
+    """Tests for the denormalized confirmed_count / attendee_count columns"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username='counter_organizer',
+            email='counter_organizer@example.com',
+            password='password123'
+        )
+        self.attendee = User.objects.create_user(
+            username='counter_attendee',
+            email='counter_attendee@example.com',
+            password='password123'
+        )
+        self.event = Event.objects.create(
+            title='Counter Test Conference',
+            description='A test conference for counter testing',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='Counter Test Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        self.track = Track.objects.create(event=self.event, name='Counter Track')
+        self.session = Session.objects.create(
+            track=self.track,
+            title='Counter Session',
+            description='A test session for counter testing',
+            start_time=self.event.start_date + timedelta(hours=1),
+            end_time=self.event.start_date + timedelta(hours=2),
+            capacity=10
+        )
+
+    def confirmed_count(self):
+        return Event.objects.get(pk=self.event.pk).confirmed_count
+
+    def test_confirm_and_cancel_registration(self):
+        """Test that the counter follows status transitions"""
+        registration = Registration.objects.create(event=self.event, attendee=self.attendee)
+        self.assertEqual(self.confirmed_count(), 0)
+
+        registration.status = 'confirmed'
+        registration.save()
+        self.assertEqual(self.confirmed_count(), 1)
+
+        # Saving again without a status change must not double count
+        registration.notes = 'Updated'
+        registration.save()
+        self.assertEqual(self.confirmed_count(), 1)
+
+        registration = Registration.objects.get(pk=registration.pk)
+        registration.status = 'cancelled'
+        registration.save()
+        self.assertEqual(self.confirmed_count(), 0)
+
+    def test_delete_confirmed_registration(self):
+        """Test that deleting a confirmed registration decrements the counter"""
+        Registration.objects.create(event=self.event, attendee=self.attendee, status='confirmed')
+        self.assertEqual(self.confirmed_count(), 1)
+        Registration.objects.filter(event=self.event).delete()
+        self.assertEqual(self.confirmed_count(), 0)
+
+    def test_session_attendee_count(self):
+        """Test that session registrations maintain attendee_count"""
+        session_registration = SessionRegistration.objects.create(
+            session=self.session, attendee=self.attendee
+        )
+        self.assertEqual(Session.objects.get(pk=self.session.pk).attendee_count, 1)
+        session_registration.delete()
+        self.assertEqual(Session.objects.get(pk=self.session.pk).attendee_count, 0)
+
+    def test_moving_registrations_moves_the_counts(self):
+        """Test that moving a registration to another event or session updates both counters"""
+        other_event = Event.objects.create(
+            title='Other Counter Conference',
+            description='Another conference for counter testing',
+            start_date=self.event.start_date,
+            end_date=self.event.end_date,
+            venue='Counter Test Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        registration = Registration.objects.create(event=self.event, attendee=self.attendee, status='confirmed')
+        registration = Registration.objects.get(pk=registration.pk)
+        registration.event = other_event
+        registration.save()
+        self.assertEqual(self.confirmed_count(), 0)
+        self.assertEqual(Event.objects.get(pk=other_event.pk).confirmed_count, 1)
+        registration.delete()
+        self.assertEqual(Event.objects.get(pk=other_event.pk).confirmed_count, 0)
+
+        other_session = Session.objects.create(
+            track=self.track,
+            title='Other Counter Session',
+            description='Another session for counter testing',
+            start_time=self.session.end_time,
+            end_time=self.session.end_time + timedelta(hours=1)
+        )
+        SessionRegistration.objects.create(session=self.session, attendee=self.attendee)
+        session_registration = SessionRegistration.objects.get(attendee=self.attendee)
+        session_registration.session = other_session
+        session_registration.save()
+        self.assertEqual(Session.objects.get(pk=self.session.pk).attendee_count, 0)
+        self.assertEqual(Session.objects.get(pk=other_session.pk).attendee_count, 1)
+        session_registration.save()
+        self.assertEqual(Session.objects.get(pk=other_session.pk).attendee_count, 1)
+
+    def test_reconcile_counters_command(self):
+        """Test that the reconcile command repairs drifted counters"""
+        Registration.objects.create(event=self.event, attendee=self.attendee, status='confirmed')
+        SessionRegistration.objects.create(session=self.session, attendee=self.attendee)
+        Event.objects.filter(pk=self.event.pk).update(confirmed_count=7)
+        Session.objects.filter(pk=self.session.pk).update(attendee_count=0)
+
+        out = StringIO()
+        call_command('reconcile_counters', '--dry-run', stdout=out)
+        self.assertEqual(self.confirmed_count(), 7)
+
+        call_command('reconcile_counters', stdout=out)
+        self.assertEqual(self.confirmed_count(), 1)
+        self.assertEqual(Session.objects.get(pk=self.session.pk).attendee_count, 1)
@@ -0,0 +1,203 @@
+import asyncio
+import json
+import time
+import tracemalloc
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from events import stream
+from events.models import Event, Track, Session, Registration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class StreamClient:
+    """Minimal in-process ASGI client holding one stream connection open"""
+
+    def __init__(self, query_string=b'', headers=()):
+        self.scope = {
+            'type': 'http',
+            'method': 'GET',
+            'path': stream.STREAM_PATH,
+            'query_string': query_string,
+            'headers': list(headers),
+        }
+        self.incoming = asyncio.Queue()
+        self.sent = []
+        self.received = asyncio.Event()
+
+    async def receive(self):
+        return await self.incoming.get()
+
+    async def send(self, message):
+        self.sent.append(message)
+        if b'event: change' in message.get('body', b''):
+            self.received.set()
+
+    def connect(self, heartbeat=None):
+        return asyncio.ensure_future(stream.event_stream(self.scope, self.receive, self.send, heartbeat))
+
+    async def disconnect(self):
+        await self.incoming.put({'type': 'http.disconnect'})
+
+    @property
+    def status(self):
+        return self.sent[0]['status']
+
+    def changes(self):
+        return [
+            json.loads(message['body'].decode().split('data: ', 1)[1])
+            for message in self.sent
+            if b'event: change' in message.get('body', b'')
+        ]
+
+
+class EventStreamTestCase(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username='stream_organizer',
+            email='stream_organizer@example.com',
+            password='password123'
+        )
+        self.event = Event.objects.create(
+            title='Stream Test Conference',
+            description='A test conference for event stream testing',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='Stream Test Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        self.token = str(AccessToken.for_user(self.organizer))
+        self.broker = stream.Broker()
+        patcher = mock.patch.object(stream, 'broker', self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def query(self, **params):
+        params.setdefault('token', self.token)
+        return '&'.join(f'{key}={value}' for key, value in params.items()).encode()
+
+    def test_model_changes_publish_after_commit(self):
+        """Test that event, session and capacity changes are published on commit"""
+        published = []
+        with mock.patch.object(self.broker, 'publish', published.append):
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                self.event.title = 'Renamed Conference'
+                self.event.save()
+                track = Track.objects.create(event=self.event, name='Stream Track')
+                Session.objects.create(
+                    track=track,
+                    title='Stream Session',
+                    description='A test session for event stream testing',
+                    start_time=self.event.start_date + timedelta(hours=1),
+                    end_time=self.event.start_date + timedelta(hours=2)
+                )
+                Registration.objects.create(event=self.event, attendee=self.organizer)
+            self.assertEqual(published, [])
+            for callback in callbacks:
+                callback()
+        self.assertEqual(
+            [message['kind'] for message in published],
+            ['event', 'track', 'session', 'capacity']
+        )
+        self.assertTrue(all(message['event_id'] == self.event.pk for message in published))
+
+    def test_invalid_token_is_rejected(self):
+        """Test that the stream requires a valid access token"""
+        async def run():
+            client = StreamClient(self.query(token='not-a-token'))
+            await client.connect()
+            return client
+        client = asyncio.run(run())
+        self.assertEqual(client.status, 401)
+        self.assertEqual(self.broker.subscriber_count, 0)
+
+    def test_authorization_header_is_accepted(self):
+        """Test that clients may send the token in an Authorization header"""
+        async def run():
+            client = StreamClient(headers=[(b'authorization', f'Bearer {self.token}'.encode())])
+            task = client.connect()
+            await asyncio.sleep(0)
+            await client.disconnect()
+            await task
+            return client
+        client = asyncio.run(run())
+        self.assertEqual(client.status, 200)
+        self.assertIn((b'content-type', b'text/event-stream'), client.sent[0]['headers'])
+
+    def test_stream_delivers_filtered_changes(self):
+        """Test that subscribers only receive changes for the events they asked for"""
+        async def run():
+            everything = StreamClient(self.query())
+            filtered = StreamClient(self.query(event=self.event.pk))
+            tasks = [everything.connect(), filtered.connect()]
+            await asyncio.sleep(0)
+            self.broker.publish({'kind': 'event', 'event_id': self.event.pk + 1})
+            self.broker.publish({'kind': 'capacity', 'event_id': self.event.pk})
+            await asyncio.wait_for(filtered.received.wait(), 1)
+            await asyncio.sleep(0)
+            for client in (everything, filtered):
+                await client.disconnect()
+            await asyncio.gather(*tasks)
+            return everything, filtered
+        everything, filtered = asyncio.run(run())
+        self.assertEqual(len(everything.changes()), 2)
+        self.assertEqual(filtered.changes(), [{'kind': 'capacity', 'event_id': self.event.pk}])
+        self.assertEqual(self.broker.subscriber_count, 0)
+
+    def test_idle_connections_receive_heartbeats(self):
+        """Test that an idle stream sends comment lines to keep the connection open"""
+        async def run():
+            client = StreamClient(self.query())
+            task = client.connect(heartbeat=0.01)
+            await asyncio.sleep(0.05)
+            await client.disconnect()
+            await task
+            return client
+        client = asyncio.run(run())
+        self.assertIn(b': ping\n\n', [message.get('body') for message in client.sent])
+
+    @override_settings(EVENT_STREAM_QUEUE_SIZE=2)
+    def test_slow_subscriber_drops_messages(self):
+        """Test that a full subscriber queue drops messages instead of blocking fan-out"""
+        async def run():
+            subscription = self.broker.subscribe()
+            for i in range(5):
+                self.broker.publish({'kind': 'event', 'event_id': i})
+            await asyncio.sleep(0)
+            return subscription
+        subscription = asyncio.run(run())
+        self.assertEqual(subscription.queue.qsize(), 2)
+
+    def test_idle_connection_load(self):
+        """Test that one worker holds thousands of idle connections and fans out to all"""
+        connection_count = 2000
+
+        async def run():
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            clients = [StreamClient(self.query()) for _ in range(connection_count)]
+            tasks = [client.connect() for client in clients]
+            await asyncio.sleep(0)
+            per_connection = (tracemalloc.get_traced_memory()[0] - baseline) / connection_count
+            tracemalloc.stop()
+            self.assertEqual(self.broker.subscriber_count, connection_count)
+
+            started = time.perf_counter()
+            self.broker.publish({'kind': 'capacity', 'event_id': self.event.pk})
+            await asyncio.wait_for(
+                asyncio.gather(*(client.received.wait() for client in clients)), 10
+            )
+            fan_out = time.perf_counter() - started
+
+            for client in clients:
+                await client.disconnect()
+            await asyncio.gather(*tasks)
+            return per_connection, fan_out
+
+        per_connection, fan_out = asyncio.run(run())
+        self.assertLess(per_connection, 64 * 1024)
+        self.assertLess(fan_out, 5)
+        self.assertEqual(self.broker.subscriber_count, 0)
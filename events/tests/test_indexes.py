@@ -0,0 +1,119 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from events.schedule import speaker_conflicts
+from events.models import Event, Track, Session, Registration, SessionRegistration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class QueryPlanTestCase(TestCase):
+    """Assert that the hot queries are answered from the indexes added for them."""
+
+    @classmethod
+    def setUpTestData(cls):
+        organizer = User.objects.create_user(username='index_organizer', password='password123')
+        start = timezone.now() + timedelta(days=10)
+        cls.events = Event.objects.bulk_create([
+            Event(
+                title=f'Index Conference {i}',
+                description='A test conference for index testing',
+                start_date=start + timedelta(days=i),
+                end_date=start + timedelta(days=i + 1),
+                venue='Index Venue',
+                capacity=1000,
+                organizer=organizer
+            )
+            for i in range(20)
+        ])
+        attendees = User.objects.bulk_create([User(username=f'index_attendee_{i}') for i in range(100)])
+        Registration.objects.bulk_create([
+            Registration(event=event, attendee=attendee, status='confirmed' if i % 10 == 0 else 'pending')
+            for event in cls.events
+            for i, attendee in enumerate(attendees)
+        ])
+        tracks = Track.objects.bulk_create([
+            Track(event=event, name=f'Track {i}') for event in cls.events for i in range(5)
+        ])
+        Session.objects.bulk_create([
+            Session(
+                track=track,
+                title=f'Session {i}',
+                description='A test session for index testing',
+                start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=45)
+            )
+            for track in tracks
+            for i in range(20)
+        ])
+        cls.track = tracks[0]
+        cls.attendee = attendees[0]
+        SessionRegistration.objects.bulk_create([
+            SessionRegistration(session=session, attendee=attendee)
+            for session in Session.objects.filter(track__in=tracks[:5])
+            for attendee in attendees[:10]
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE events_registration')
+            cursor.execute('ANALYZE events_session')
+            cursor.execute('ANALYZE events_sessionregistration')
+
+    def explain(self, run_query):
+        """Return the plan of the query issued by ``run_query``"""
+        with CaptureQueriesContext(connection) as queries:
+            run_query()
+        # Table sizes in tests are tiny; rule out sequential scans so the
+        # plan shows which index the query can use.
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                cursor.execute('EXPLAIN ' + queries[-1]['sql'])
+                return '\n'.join(row[0] for row in cursor.fetchall())
+            finally:
+                cursor.execute('SET enable_seqscan = on')
+
+    def test_capacity_count_uses_partial_index(self):
+        """Test that counting confirmed registrations reads the partial index"""
+        plan = self.explain(
+            lambda: Registration.objects.filter(event=self.events[0], status='confirmed').count()
+        )
+        self.assertIn('registration_confirmed_idx', plan)
+
+    def test_session_overlap_check_uses_composite_index(self):
+        """Test that the overlap check in Session.clean reads the track/time index"""
+        session = Session.objects.filter(track=self.track).first()
+        overlapping = Session.objects.filter(
+            track=self.track,
+            start_time__lt=session.end_time,
+            end_time__gt=session.start_time
+        ).exclude(pk=session.pk)
+        plan = self.explain(overlapping.exists)
+        self.assertIn('session_track_time_idx', plan)
+        self.assertIn('start_time <', plan)
+
+    def test_attendee_registrations_use_composite_index(self):
+        """Test that an attendee's registrations are read from the attendee/date index"""
+        plan = self.explain(
+            lambda: list(Registration.objects.filter(attendee=self.attendee).order_by('-registration_date'))
+        )
+        self.assertIn('registration_attendee_date_idx', plan)
+
+    def test_double_booking_check_uses_attendee_index(self):
+        """Test that the double-booking check is an index range query, whichever side drives it"""
+        event = self.events[0]
+        event.prevent_double_booking = True
+        session = Session.objects.select_related('track__event').filter(track=self.track).first()
+        session.track.event = event
+        plan = self.explain(lambda: session.double_booking_for(self.attendee, lock=False))
+        self.assertRegex(plan, r'session_track_time_idx|events_sessionregistration_attendee_id')
+        self.assertNotIn('Seq Scan', plan)
+
+    def test_speaker_sweep_uses_speaker_index(self):
+        """Test that the speaker conflict report reads sessions presorted from the speaker index"""
+        speaker = self.attendee
+        Session.objects.filter(track=self.track).update(speaker=speaker)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE events_session')
+        plan = self.explain(lambda: speaker_conflicts(self.events[0]))
+        self.assertIn('session_speaker_time_idx', plan)
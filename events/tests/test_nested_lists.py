@@ -0,0 +1,84 @@
+import json
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Track, Session
+from datetime import timedelta
+from django.utils import timezone
+
+
+class NestedListActionTestCase(APITestCase):
+    """Tests for pagination and streaming of the nested tracks/sessions actions"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username='nested_organizer',
+            email='nested_organizer@example.com',
+            password='password123'
+        )
+        self.event = Event.objects.create(
+            title='Nested List Conference',
+            description='A multi-day conference with many tracks',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=14),
+            venue='Nested Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        self.tracks = [Track.objects.create(event=self.event, name=f'Track {i}') for i in range(15)]
+        for i in range(25):
+            Session.objects.create(
+                track=self.tracks[0],
+                title=f'Session {i}',
+                description='A test session',
+                start_time=self.event.start_date + timedelta(hours=i),
+                end_time=self.event.start_date + timedelta(hours=i, minutes=45)
+            )
+        self.event_tracks_url = reverse('event-tracks', kwargs={'pk': self.event.pk})
+        self.track_sessions_url = reverse(
+            'event-tracks-sessions', kwargs={'event_pk': self.event.pk, 'pk': self.tracks[0].pk}
+        )
+
+    def test_event_tracks_paginated(self):
+        """Test that the tracks action honours the pagination class"""
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(self.event_tracks_url, {'page_size': 10})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 15)
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_event_tracks_streamed(self):
+        """Test that ?stream=true returns every track as a streamed JSON array"""
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(self.event_tracks_url, {'stream': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([track['id'] for track in data], [track.pk for track in self.tracks])
+        self.assertEqual(len(data[0]['sessions']), 25)
+
+    def test_stream_disabled_is_paginated_and_validated(self):
+        """Test that ?stream=false returns a normal page with validators"""
+        self.client.force_authenticate(user=self.organizer)
+        for value in ('false', '0'):
+            response = self.client.get(self.event_tracks_url, {'stream': value})
+            self.assertFalse(response.streaming)
+            self.assertEqual(response.data['count'], 15)
+            self.assertTrue(response.has_header('ETag'), value)
+
+    def test_track_sessions_paginated(self):
+        """Test that the sessions action honours the pagination class"""
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(self.track_sessions_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 25)
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_track_sessions_streamed(self):
+        """Test that streamed sessions are ordered by start time"""
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(self.track_sessions_url, {'stream': '1'})
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([session['title'] for session in data], [f'Session {i}' for i in range(25)])
@@ -0,0 +1,125 @@
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Registration
+from events.pagination import StandardPagination
+from datetime import timedelta
+from django.utils import timezone
+
+
+class KeysetPaginationTestCase(APITestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username='pagination_organizer',
+            email='pagination_organizer@example.com',
+            password='password123'
+        )
+        start = timezone.now() + timedelta(days=10)
+        self.events = [
+            Event.objects.create(
+                title=f'Pagination Conference {i}',
+                description='A test conference for pagination testing',
+                start_date=start + timedelta(days=i),
+                end_date=start + timedelta(days=i + 1),
+                venue='Pagination Venue',
+                capacity=100,
+                organizer=self.organizer
+            )
+            for i in range(5)
+        ]
+        attendees = User.objects.bulk_create([User(username=f'page_attendee_{i}') for i in range(25)])
+        for attendee in attendees:
+            Registration.objects.create(event=self.events[0], attendee=attendee)
+        self.events_url = '/api/events/'
+        self.registrations_url = reverse('registration-list')
+
+    def collect(self, url, params):
+        """Follow `next` links and return every row id, page by page"""
+        pages = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            pages.append([row['id'] for row in response.data['results']])
+            if not response.data['next']:
+                return pages
+            response = self.client.get(response.data['next'])
+
+    def test_registration_cursor_pagination(self):
+        """Test walking registrations with a cursor returns every row once"""
+        self.client.force_authenticate(user=self.organizer)
+        pages = self.collect(self.registrations_url, {'pagination': 'cursor', 'page_size': 10})
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        ids = [pk for page in pages for pk in page]
+        self.assertEqual(
+            ids,
+            list(Registration.objects.order_by('-registration_date', '-id').values_list('id', flat=True))
+        )
+
+    def test_event_cursor_pagination(self):
+        """Test walking events with a cursor in start date order"""
+        self.client.force_authenticate(user=self.organizer)
+        pages = self.collect(self.events_url, {'pagination': 'cursor', 'page_size': 2})
+        ids = [pk for page in pages for pk in page]
+        self.assertEqual(ids, [event.pk for event in reversed(self.events)])
+
+    def test_cursor_pagination_seeks_past_ties(self):
+        """Test that rows sharing the ordering column are each returned once, in both directions"""
+        for i in range(5):
+            Event.objects.create(
+                title=f'Tied Conference {i}',
+                description='A conference starting with the others',
+                start_date=self.events[2].start_date,
+                end_date=self.events[2].end_date,
+                venue='Pagination Venue',
+                capacity=100,
+                organizer=self.organizer
+            )
+        expected = list(Event.objects.order_by('-start_date', '-id').values_list('id', flat=True))
+        self.client.force_authenticate(user=self.organizer)
+        pages = self.collect(self.events_url, {'pagination': 'cursor', 'page_size': 2})
+        self.assertEqual([pk for page in pages for pk in page], expected)
+
+        response = self.client.get(self.events_url, {'pagination': 'cursor', 'page_size': 2})
+        for _ in range(3):
+            response = self.client.get(response.data['next'])
+        response = self.client.get(response.data['previous'])
+        self.assertEqual([row['id'] for row in response.data['results']], expected[4:6])
+
+        pages = self.collect(self.events_url, {'pagination': 'cursor', 'page_size': 3, 'ordering': 'start_date'})
+        self.assertEqual([pk for page in pages for pk in page], expected[::-1])
+
+    def test_invalid_cursor_is_rejected(self):
+        """Test that malformed cursors return 404 instead of an error"""
+        self.client.force_authenticate(user=self.organizer)
+        for cursor in ('garbage', 'cD0yMDI0LTAxLTAx', 'cD1ub3QtYS1kYXRlJnA9MQ=='):
+            response = self.client.get(self.events_url, {'cursor': cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, cursor)
+
+    def test_cursor_pagination_skips_count_query(self):
+        """Test that cursor pages do not issue a COUNT query"""
+        self.client.force_authenticate(user=self.organizer)
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse('session-registration-list'), {'pagination': 'cursor'}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_default_pagination_unchanged(self):
+        """Test that page-number pagination remains the default"""
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(self.registrations_url)
+        self.assertEqual(response.data['count'], 25)
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_page_size_is_capped(self):
+        """Test that page_size cannot exceed the configured maximum"""
+        self.client.force_authenticate(user=self.organizer)
+        max_page_size = StandardPagination.max_page_size
+        StandardPagination.max_page_size = 20
+        try:
+            response = self.client.get(self.registrations_url, {'page_size': 1000})
+        finally:
+            StandardPagination.max_page_size = max_page_size
+        self.assertEqual(len(response.data['results']), 20)
@@ -0,0 +1,177 @@
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Track, Session, Registration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class EventQueryCountTestCase(APITestCase):
+    """Query budget regression tests for the event list and detail endpoints"""
+
+    # pagination COUNT, events, tracks, sessions (with speakers)
+    LIST_QUERIES = 4
+    # event, tracks, sessions (with speakers)
+    DETAIL_QUERIES = 3
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username='query_organizer',
+            email='query_organizer@example.com',
+            password='password123'
+        )
+        self.attendee = User.objects.create_user(
+            username='query_attendee',
+            email='query_attendee@example.com',
+            password='password123'
+        )
+        self.events_url = '/api/events/'
+
+    def create_event(self, index, tracks=2, sessions=2):
+        start = timezone.now() + timedelta(days=10)
+        event = Event.objects.create(
+            title=f'Query Conference {index}',
+            description='A test conference for query counting',
+            start_date=start,
+            end_date=start + timedelta(days=2),
+            venue='Query Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        for t in range(tracks):
+            track = Track.objects.create(event=event, name=f'Track {t}')
+            for s in range(sessions):
+                speaker = User.objects.create_user(
+                    username=f'speaker_{index}_{t}_{s}', password='password123'
+                )
+                Session.objects.create(
+                    track=track,
+                    title=f'Session {s}',
+                    description='A test session',
+                    speaker=speaker,
+                    start_time=start + timedelta(hours=s),
+                    end_time=start + timedelta(hours=s, minutes=50)
+                )
+        Registration.objects.create(event=event, attendee=self.attendee, status='confirmed')
+        return event
+
+    def test_event_list_query_count(self):
+        """Test that listing events runs a fixed number of queries"""
+        for i in range(3):
+            self.create_event(i)
+        self.client.force_authenticate(user=self.attendee)
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.client.get(self.events_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['registration_count'], 1)
+
+    def test_event_list_query_count_independent_of_page_size(self):
+        """Test that a full page with deeper trees costs the same number of queries"""
+        for i in range(10):
+            self.create_event(i, tracks=3, sessions=3)
+        self.client.force_authenticate(user=self.attendee)
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.client.get(self.events_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_event_detail_query_count(self):
+        """Test that retrieving an event runs a fixed number of queries"""
+        event = self.create_event(0, tracks=4, sessions=3)
+        self.client.force_authenticate(user=self.attendee)
+        with self.assertNumQueries(self.DETAIL_QUERIES):
+            response = self.client.get(reverse('event-detail', kwargs={'pk': event.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['tracks']), 4)
+        self.assertEqual(response.data['registration_count'], 1)
+
+
+class NestedWriteQueryCountTestCase(APITestCase):
+    """Query budget regression tests for writes under /events/{id}/tracks/"""
+
+    # track with its event, then the INSERT inside a savepoint
+    CREATE_SESSION_QUERIES = 4
+    # session, track with its event, then the UPDATE inside a savepoint
+    UPDATE_SESSION_QUERIES = 5
+    # track, track with its event, UPDATE, sessions for the response
+    UPDATE_TRACK_QUERIES = 4
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(username='nested_organizer', password='password123')
+        self.other_user = User.objects.create_user(username='nested_other', password='password123')
+        self.start = timezone.now() + timedelta(days=10)
+        self.event = self.create_event('Nested Write Conference')
+        self.track = Track.objects.create(event=self.event, name='Main Track')
+        self.session = Session.objects.create(
+            track=self.track,
+            title='Opening',
+            description='Opening session',
+            start_time=self.start,
+            end_time=self.start + timedelta(hours=1)
+        )
+        self.sessions_url = reverse('track-sessions-list', kwargs={
+            'event_pk': self.event.pk, 'track_pk': self.track.pk
+        })
+        self.session_data = {
+            'title': 'Second Session',
+            'description': 'After the opening',
+            'start_time': (self.start + timedelta(hours=2)).isoformat(),
+            'end_time': (self.start + timedelta(hours=3)).isoformat()
+        }
+
+    def create_event(self, title):
+        return Event.objects.create(
+            title=title,
+            description='A test conference for nested writes',
+            start_date=self.start,
+            end_date=self.start + timedelta(days=2),
+            venue='Nested Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+
+    def test_create_session_query_count(self):
+        """Test that creating a session resolves the track and event once"""
+        self.client.force_authenticate(user=self.organizer)
+        with self.assertNumQueries(self.CREATE_SESSION_QUERIES):
+            response = self.client.post(self.sessions_url, self.session_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['track'], self.track.pk)
+
+    def test_update_session_query_count(self):
+        """Test that updating a session does not reload its track, event or organizer"""
+        url = reverse('track-sessions-detail', kwargs={
+            'event_pk': self.event.pk, 'track_pk': self.track.pk, 'pk': self.session.pk
+        })
+        self.client.force_authenticate(user=self.organizer)
+        with self.assertNumQueries(self.UPDATE_SESSION_QUERIES):
+            response = self.client.patch(url, {'title': 'Keynote'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.title, 'Keynote')
+
+    def test_update_track_query_count(self):
+        """Test that updating a track checks the organizer without loading it"""
+        url = reverse('event-tracks-detail', kwargs={'event_pk': self.event.pk, 'pk': self.track.pk})
+        self.client.force_authenticate(user=self.organizer)
+        with self.assertNumQueries(self.UPDATE_TRACK_QUERIES):
+            response = self.client.patch(url, {'name': 'Renamed Track'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['sessions']), 1)
+
+    def test_non_organizer_cannot_create_session(self):
+        """Test that the shared resolver still enforces the organizer check"""
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.post(self.sessions_url, self.session_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Session.objects.count(), 1)
+
+    def test_track_of_another_event_is_not_found(self):
+        """Test that a track is only resolved under its own event"""
+        other_track = Track.objects.create(event=self.create_event('Other Conference'), name='Other Track')
+        url = reverse('track-sessions-list', kwargs={'event_pk': self.event.pk, 'track_pk': other_track.pk})
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.post(url, self.session_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(other_track.sessions.exists())
@@ -94,6 +94,24 @@ class RegistrationAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Registration.objects.get(pk=self.registration.pk).notes, 'Updated registration notes')
     
+    def test_moving_registration_moves_confirmed_count(self):
+        """Test that changing event_id moves a confirmed seat to the new event"""
+        other_event = Event.objects.create(
+            title='Other Registration Conference',
+            description='Another conference for registration API testing',
+            start_date=self.event.start_date,
+            end_date=self.event.end_date,
+            venue='Registration Test Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        self.registration.confirm()
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.patch(self.registration_detail_url, {'event_id': other_event.pk}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Event.objects.get(pk=self.event.pk).confirmed_count, 0)
+        self.assertEqual(Event.objects.get(pk=other_event.pk).confirmed_count, 1)
+
     def test_approve_registration(self):
         """Test approving a registration"""
         self.client.force_authenticate(user=self.organizer)
@@ -0,0 +1,169 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.wsgi import get_wsgi_application
+from rest_framework import status
+from rest_framework.test import APITestCase, APITransactionTestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from events.export import stream_registrations
+from events.stream import EventStreamRouter
+from events.models import Event, Registration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class RegistrationExportAPITestCase(APITestCase):
+    def setUp(self):
+        # Create test users
+        self.organizer = User.objects.create_user(
+            username='export_organizer',
+            email='export_organizer@example.com',
+            password='password123'
+        )
+        self.attendees = User.objects.bulk_create([
+            User(username=f'export_attendee_{i}', email=f'export_{i}@example.com', first_name=f'Ann, {i}')
+            for i in range(5)
+        ])
+
+        # Create test event with registrations
+        self.event = Event.objects.create(
+            title='Export Test Conference',
+            description='A test conference for export testing',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='Export Test Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        Registration.objects.bulk_create([
+            Registration(event=self.event, attendee=attendee, status='confirmed' if i < 3 else 'pending')
+            for i, attendee in enumerate(self.attendees)
+        ])
+
+        self.url = f'/api/events/{self.event.pk}/registrations/export/'
+        self.client.force_authenticate(user=self.organizer)
+
+    def export(self, params=None, **headers):
+        response = self.client.get(self.url, params or {}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content)
+
+    def test_csv_export(self):
+        """Test that registrations are exported as CSV with a header row"""
+        response, body = self.export()
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('attachment;', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['username'], 'export_attendee_0')
+        self.assertEqual(rows[0]['first_name'], 'Ann, 0')
+        self.assertEqual(rows[0]['status'], 'confirmed')
+
+    def test_jsonl_export(self):
+        """Test that ?format=jsonl returns one JSON object per line"""
+        response, body = self.export({'format': 'jsonl'})
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[4]['email'], 'export_4@example.com')
+        self.assertEqual(rows[4]['attendee_id'], self.attendees[4].pk)
+
+    def test_status_filter(self):
+        """Test that ?status= limits the export"""
+        _, body = self.export({'format': 'jsonl', 'status': 'confirmed'})
+        self.assertEqual(len(body.decode().splitlines()), 3)
+
+    def test_gzip_export(self):
+        """Test that the export is gzip-encoded for clients that accept it"""
+        response, body = self.export(HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        rows = list(csv.reader(io.StringIO(gzip.decompress(body).decode())))
+        self.assertEqual(len(rows), 6)
+
+    def test_gzip_refused_by_qvalue(self):
+        """Test that q-values are honoured and only the gzip coding itself counts"""
+        for accept_encoding in ('gzip;q=0, deflate', 'br, x-gzipped', 'gzip;q=0, *', 'identity'):
+            response, body = self.export(HTTP_ACCEPT_ENCODING=accept_encoding)
+            self.assertFalse(response.has_header('Content-Encoding'), accept_encoding)
+            self.assertIn('Accept-Encoding', response['Vary'])
+            self.assertEqual(len(body.decode().splitlines()), 6)
+        for accept_encoding in ('GZIP;q=0.5', 'deflate;q=1, *;q=0.1'):
+            response, _ = self.export(HTTP_ACCEPT_ENCODING=accept_encoding)
+            self.assertEqual(response['Content-Encoding'], 'gzip', accept_encoding)
+
+    def test_export_is_written_in_chunks(self):
+        """Test that rows are streamed a chunk at a time rather than as one body"""
+        response = stream_registrations(self.event, 'jsonl', chunk_size=2)
+        chunks = list(response.streaming_content)
+        self.assertEqual([chunk.count(b'\n') for chunk in chunks], [2, 2, 1])
+
+    def test_invalid_format(self):
+        """Test that unknown formats are rejected"""
+        response = self.client.get(self.url, {'format': 'xml'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(self.url, {'status': 'unknown'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_forbidden_for_non_organizer(self):
+        """Test that only the organizer can export registrations"""
+        self.client.force_authenticate(user=self.attendees[0])
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class RegistrationExportASGITestCase(APITransactionTestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(username='asgi_export_organizer', password='password123')
+        self.event = Event.objects.create(
+            title='ASGI Export Conference',
+            description='A test conference for exports served over ASGI',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='ASGI Export Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        attendees = User.objects.bulk_create([User(username=f'asgi_export_attendee_{i}') for i in range(5)])
+        Registration.objects.bulk_create([
+            Registration(event=self.event, attendee=attendee, status='confirmed') for attendee in attendees
+        ])
+
+    def test_export_is_streamed_through_asgi(self):
+        """Test that the ASGI application sends an export in several body chunks"""
+        application = EventStreamRouter(get_wsgi_application())
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': f'/api/events/{self.event.pk}/registrations/export/',
+            'raw_path': f'/api/events/{self.event.pk}/registrations/export/'.encode(),
+            'query_string': b'format=jsonl',
+            'root_path': '',
+            'headers': [
+                (b'host', b'testserver'),
+                (b'authorization', f'Bearer {AccessToken.for_user(self.organizer)}'.encode()),
+            ],
+            'client': ('127.0.0.1', 50000),
+            'server': ('testserver', 80),
+        }
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message):
+            messages.append(message)
+
+        with mock.patch('events.export.EXPORT_CHUNK_SIZE', 2):
+            asyncio.run(application(scope, receive, send))
+        self.assertEqual(messages[0]['status'], status.HTTP_200_OK)
+        chunks = [message['body'] for message in messages[1:] if message.get('body')]
+        self.assertEqual([chunk.count(b'\n') for chunk in chunks], [2, 2, 1])
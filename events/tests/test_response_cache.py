@@ -0,0 +1,148 @@
+import tempfile
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.cache import cache_stats, reset_cache_stats
+from events.models import Event, Track, Session, Registration
+from datetime import timedelta
+from django.utils import timezone
+
+
+class ResponseCacheTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.organizer = User.objects.create_user(
+            username='cache_organizer',
+            email='cache_organizer@example.com',
+            password='password123'
+        )
+        self.attendee = User.objects.create_user(
+            username='cache_attendee',
+            email='cache_attendee@example.com',
+            password='password123'
+        )
+        self.event = Event.objects.create(
+            title='Cache Test Conference',
+            description='A test conference for response cache testing',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='Cache Test Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        self.track = Track.objects.create(event=self.event, name='Cache Track')
+        self.session = Session.objects.create(
+            track=self.track,
+            title='Cache Session',
+            description='A test session for response cache testing',
+            start_time=self.event.start_date + timedelta(hours=1),
+            end_time=self.event.start_date + timedelta(hours=2)
+        )
+        self.events_url = '/api/events/'
+        self.event_detail_url = reverse('event-detail', kwargs={'pk': self.event.pk})
+        self.sessions_url = reverse('track-sessions-list', kwargs={
+            'event_pk': self.event.pk, 'track_pk': self.track.pk
+        })
+        self.client.force_authenticate(user=self.attendee)
+
+    def test_repeated_get_is_served_from_cache(self):
+        """Test that a repeated GET is a cache hit that runs no queries"""
+        reset_cache_stats()
+        first = self.client.get(self.event_detail_url)
+        self.assertEqual(first['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            second = self.client.get(self.event_detail_url)
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(cache_stats(), {'hits': 1, 'misses': 1})
+
+    def test_query_parameters_are_part_of_the_key(self):
+        """Test that different query strings are cached separately"""
+        self.client.get(self.events_url)
+        response = self.client.get(self.events_url, {'venue': 'Elsewhere'})
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_event_update_invalidates_detail_and_list(self):
+        """Test that saving an event bumps its version"""
+        self.client.get(self.event_detail_url)
+        self.client.get(self.events_url)
+        self.event.title = 'Renamed Conference'
+        self.event.save()
+        detail = self.client.get(self.event_detail_url)
+        self.assertEqual(detail['X-Cache'], 'MISS')
+        self.assertEqual(detail.data['title'], 'Renamed Conference')
+        listing = self.client.get(self.events_url)
+        self.assertEqual(listing.data['results'][0]['title'], 'Renamed Conference')
+
+    def test_reads_during_a_write_are_invalidated_on_commit(self):
+        """Test that responses cached before a write commits are not served afterwards"""
+        self.client.get(self.event_detail_url)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.event.title = 'Renamed Conference'
+            self.event.save()
+            # Stands in for a concurrent read of the pre-commit row
+            self.assertEqual(self.client.get(self.event_detail_url)['X-Cache'], 'MISS')
+            self.assertEqual(self.client.get(self.event_detail_url)['X-Cache'], 'HIT')
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.client.get(self.event_detail_url)['X-Cache'], 'MISS')
+
+    def test_registration_change_invalidates_event(self):
+        """Test that confirming a registration refreshes the cached count"""
+        self.client.get(self.event_detail_url)
+        registration = Registration.objects.create(event=self.event, attendee=self.attendee)
+        registration.confirm()
+        response = self.client.get(self.event_detail_url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['registration_count'], 1)
+
+    def test_session_change_invalidates_event(self):
+        """Test that saving a session invalidates responses of its event"""
+        self.client.force_authenticate(user=self.organizer)
+        self.client.get(self.sessions_url)
+        self.session.title = 'Renamed Session'
+        self.session.save()
+        response = self.client.get(self.sessions_url)
+        self.assertEqual(response.data['results'][0]['title'], 'Renamed Session')
+
+    def test_user_dependent_responses_are_not_shared(self):
+        """Test that session lists are cached per user"""
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(reverse('track-sessions-detail', kwargs={
+            'event_pk': self.event.pk, 'track_pk': self.track.pk, 'pk': self.session.pk
+        }))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # The attendee has no confirmed registration and must not see the session
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.get(reverse('track-sessions-detail', kwargs={
+            'event_pk': self.event.pk, 'track_pk': self.track.pk, 'pk': self.session.pk
+        }))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(API_RESPONSE_CACHE_ENABLED=False)
+    def test_cache_can_be_disabled(self):
+        """Test that responses are not cached when the cache is disabled"""
+        self.client.get(self.event_detail_url)
+        response = self.client.get(self.event_detail_url)
+        self.assertFalse(response.has_header('X-Cache'))
+
+    def test_stats_command_requires_a_shared_cache(self):
+        """Test that the stats command refuses a per-process cache and reads a shared one"""
+        with self.assertRaisesMessage(CommandError, 'CACHE_URL'):
+            call_command('response_cache_stats', stdout=StringIO())
+
+        with tempfile.TemporaryDirectory() as location:
+            with override_settings(CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location
+            }}):
+                self.client.get(self.event_detail_url)
+                self.client.get(self.event_detail_url)
+                out = StringIO()
+                call_command('response_cache_stats', stdout=out)
+        self.assertIn('hits: 1  misses: 1', out.getvalue())
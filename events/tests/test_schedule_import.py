@@ -0,0 +1,249 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Track, Session
+from datetime import timedelta
+from django.utils import timezone
+
+
+class ScheduleImportAPITestCase(APITestCase):
+    def setUp(self):
+        # Create test users
+        self.organizer = User.objects.create_user(
+            username='schedule_organizer',
+            email='schedule_organizer@example.com',
+            password='password123'
+        )
+        self.outsider = User.objects.create_user(
+            username='schedule_outsider',
+            email='schedule_outsider@example.com',
+            password='password123'
+        )
+        self.speaker = User.objects.create_user(username='schedule_speaker', password='password123')
+
+        # Create test event with one scheduled session
+        self.start = (timezone.now() + timedelta(days=10)).replace(microsecond=0)
+        self.event = Event.objects.create(
+            title='Schedule Test Conference',
+            description='A test conference for schedule import testing',
+            start_date=self.start,
+            end_date=self.start + timedelta(days=1),
+            venue='Schedule Test Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        self.track = Track.objects.create(event=self.event, name='Main')
+        self.existing = Session.objects.create(
+            track=self.track,
+            title='Keynote',
+            description='Opening keynote',
+            start_time=self.start,
+            end_time=self.start + timedelta(hours=1)
+        )
+
+        self.url = f'/api/events/{self.event.pk}/sessions/import/'
+        self.client.force_authenticate(user=self.organizer)
+
+    def row(self, title, hour, track='Main', length=1, **extra):
+        start = self.start + timedelta(hours=hour)
+        return {
+            'track': track,
+            'title': title,
+            'start_time': start.isoformat(),
+            'end_time': (start + timedelta(hours=length)).isoformat(),
+            **extra
+        }
+
+    def test_import_creates_tracks_and_sessions(self):
+        """Test that a JSON schedule is imported and missing tracks are created"""
+        rows = [
+            self.row('Talk A', 1, speaker='schedule_speaker'),
+            self.row('Talk B', 2),
+            self.row('Workshop', 1, track='Workshops', length=3, capacity=20),
+        ]
+        response = self.client.post(self.url, {'sessions': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['sessions_created'], 3)
+        self.assertEqual(response.data['tracks_created'], ['Workshops'])
+        self.assertEqual(Session.objects.filter(track__event=self.event).count(), 4)
+        workshop = Session.objects.get(title='Workshop')
+        self.assertEqual(workshop.track.name, 'Workshops')
+        self.assertEqual(workshop.capacity, 20)
+        self.assertEqual(Session.objects.get(title='Talk A').speaker, self.speaker)
+
+    def test_csv_upload(self):
+        """Test that a schedule can be uploaded as a CSV file"""
+        rows = [self.row('CSV Talk', 1, description='From a spreadsheet'), self.row('CSV Talk 2', 2)]
+        lines = ['track,title,description,speaker,start_time,end_time,capacity'] + [
+            f"{row['track']},{row['title']},{row.get('description', '')},,{row['start_time']},{row['end_time']},"
+            for row in rows
+        ]
+        upload = SimpleUploadedFile('schedule.csv', '\n'.join(lines).encode(), content_type='text/csv')
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        session = Session.objects.get(title='CSV Talk')
+        self.assertEqual(session.description, 'From a spreadsheet')
+        self.assertIsNone(session.speaker)
+        self.assertIsNone(session.capacity)
+
+    def test_malformed_json_upload_is_rejected(self):
+        """Test that JSON files that are not a list of sessions are rejected"""
+        for content in ['5', '"schedule"', '{"sessions": {"title": "Talk"}}', '[1, 2]']:
+            upload = SimpleUploadedFile('schedule.json', content.encode(), content_type='application/json')
+            response = self.client.post(self.url, {'file': upload}, format='multipart')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, content)
+            self.assertIn('Could not parse schedule', response.data['detail'])
+
+    def test_overlap_with_existing_session_is_rejected(self):
+        """Test that a row overlapping a scheduled session fails the whole import"""
+        rows = [self.row('Fine', 2), self.row('Clash', 0, length=2)]
+        response = self.client.post(self.url, {'sessions': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error['row'] for error in response.data['errors']], [2])
+        self.assertIn(f'existing session {self.existing.pk}', response.data['errors'][0]['errors']['detail'])
+        self.assertFalse(Session.objects.filter(title='Fine').exists())
+
+    def test_overlap_between_rows_is_rejected(self):
+        """Test that two imported rows may not overlap in the same track"""
+        rows = [self.row('First', 1, length=2), self.row('Second', 2), self.row('Elsewhere', 2, track='Other')]
+        response = self.client.post(self.url, {'sessions': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error['row'] for error in response.data['errors']], [2])
+        self.assertIn('row 1 ("First")', response.data['errors'][0]['errors']['detail'])
+
+    def test_back_to_back_rows_are_allowed(self):
+        """Test that a session may start when the previous one ends"""
+        rows = [self.row('First', 1), self.row('Second', 2)]
+        response = self.client.post(self.url, {'sessions': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_invalid_rows_are_all_reported(self):
+        """Test that every invalid row is reported and nothing is written"""
+        rows = [
+            self.row('Too Late', 30),
+            self.row('Unknown Speaker', 3, speaker='nobody'),
+            {'track': 'Main', 'title': 'No Times'},
+            self.row('Valid', 4),
+        ]
+        response = self.client.post(self.url, {'sessions': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # Field errors are reported before the schedule is checked
+        self.assertEqual([error['row'] for error in response.data['errors']], [3])
+
+        del rows[2]
+        response = self.client.post(self.url, {'sessions': rows}, format='json')
+        errors = {error['row']: error['errors'] for error in response.data['errors']}
+        self.assertEqual(set(errors), {1, 2})
+        self.assertIn('detail', errors[1])
+        self.assertIn('speaker', errors[2])
+        self.assertEqual(Session.objects.filter(track__event=self.event).count(), 1)
+
+    def test_speaker_conflicts_are_rejected(self):
+        """Test that a speaker cannot be imported into two overlapping sessions"""
+        Session.objects.filter(pk=self.existing.pk).update(speaker=self.speaker)
+        rows = [
+            self.row('Parallel', 0, track='Side', speaker='schedule_speaker'),
+            self.row('Fine', 1, track='Side', speaker='schedule_speaker'),
+            self.row('Also Busy', 1, track='Other', speaker='schedule_speaker'),
+        ]
+        response = self.client.post(self.url, {'sessions': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = {error['row']: error['errors'] for error in response.data['errors']}
+        self.assertEqual(set(errors), {1, 3})
+        self.assertIn(f'existing session {self.existing.pk}', errors[1]['speaker'])
+        self.assertIn('row 2 ("Fine")', errors[3]['speaker'])
+
+    def test_dry_run_writes_nothing(self):
+        """Test that a dry run validates without importing"""
+        response = self.client.post(
+            self.url, {'sessions': [self.row('Dry', 1)], 'dry_run': True}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['dry_run'])
+        self.assertFalse(Session.objects.filter(title='Dry').exists())
+
+    def test_requires_sessions_or_file(self):
+        """Test that the request must carry exactly one schedule"""
+        response = self.client.post(self.url, {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_forbidden_for_non_organizer(self):
+        """Test that only the organizer can import a schedule"""
+        self.client.force_authenticate(user=self.outsider)
+        response = self.client.post(self.url, {'sessions': [self.row('Talk', 1)]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Session.objects.filter(title='Talk').exists())
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """Test that importing more rows issues the same number of queries"""
+        def import_queries(rows):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, {'sessions': rows}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return len(queries)
+
+        small = import_queries([self.row(f'Small {i}', 1 + i, track='Small') for i in range(2)])
+        large = import_queries([self.row(f'Large {i}', i * 0.25, track='Large', length=0.25) for i in range(40)])
+        self.assertEqual(small, large)
+
+
+class ImportScheduleCommandTestCase(APITestCase):
+    def setUp(self):
+        organizer = User.objects.create_user(username='command_organizer', password='password123')
+        self.start = (timezone.now() + timedelta(days=10)).replace(microsecond=0)
+        self.event = Event.objects.create(
+            title='Command Test Conference',
+            description='A test conference for the import_schedule command',
+            start_date=self.start,
+            end_date=self.start + timedelta(days=1),
+            venue='Command Test Venue',
+            capacity=100,
+            organizer=organizer
+        )
+
+    def write_schedule(self, rows):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as schedule_file:
+            json.dump(rows, schedule_file)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def rows(self, *hours):
+        return [
+            {
+                'track': 'Main',
+                'title': f'Session {hour}',
+                'start_time': (self.start + timedelta(hours=hour)).isoformat(),
+                'end_time': (self.start + timedelta(hours=hour + 1)).isoformat(),
+            }
+            for hour in hours
+        ]
+
+    def test_command_imports_schedule(self):
+        """Test that the command imports a JSON file and supports --dry-run"""
+        path = self.write_schedule(self.rows(1, 2))
+        out = StringIO()
+        call_command('import_schedule', self.event.pk, path, '--dry-run', stdout=out)
+        self.assertIn('Validated 2 session(s)', out.getvalue())
+        self.assertFalse(Session.objects.exists())
+
+        call_command('import_schedule', self.event.pk, path, stdout=out)
+        self.assertEqual(Session.objects.filter(track__event=self.event).count(), 2)
+
+    def test_command_reports_invalid_rows(self):
+        """Test that the command fails with the row errors and imports nothing"""
+        path = self.write_schedule(self.rows(1, 1))
+        err = StringIO()
+        with self.assertRaises(CommandError):
+            call_command('import_schedule', self.event.pk, path, stdout=StringIO(), stderr=err)
+        self.assertIn('row 2', err.getvalue())
+        self.assertFalse(Session.objects.exists())
@@ -0,0 +1,96 @@
+from io import StringIO
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.test import APITestCase
+from events.models import Event
+from datetime import timedelta
+from django.utils import timezone
+
+
+class EventSearchTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.organizer = User.objects.create_user(
+            username='search_organizer',
+            email='search_organizer@example.com',
+            password='password123'
+        )
+        start = timezone.now() + timedelta(days=10)
+
+        def create_event(title, description, venue, days):
+            return Event.objects.create(
+                title=title,
+                description=description,
+                start_date=start + timedelta(days=days),
+                end_date=start + timedelta(days=days + 1),
+                venue=venue,
+                capacity=100,
+                organizer=self.organizer
+            )
+
+        self.title_match = create_event('Robotics Summit', 'Machines and more', 'Main Hall', 1)
+        self.description_match = create_event('Tech Days', 'Talks about robotics', 'Side Hall', 2)
+        self.other = create_event('Music Festival', 'Live bands', 'Open Air Stage', 3)
+        self.events_url = '/api/events/'
+        self.client.force_authenticate(user=self.organizer)
+
+    def search(self, term, **params):
+        response = self.client.get(self.events_url, {'search': term, **params})
+        return [event['id'] for event in response.data['results']]
+
+    def test_search_ranks_title_matches_first(self):
+        """Test that full-text matches are ranked by field weight"""
+        self.assertEqual(
+            self.search('robotics'),
+            [self.title_match.pk, self.description_match.pk]
+        )
+
+    def test_search_matches_word_prefixes(self):
+        """Test that partial words match while typing"""
+        self.assertEqual(self.search('festi'), [self.other.pk])
+        self.assertEqual(self.search('open stag'), [self.other.pk])
+
+    def test_search_vector_follows_updates(self):
+        """Test that the trigger refreshes the search vector on update"""
+        self.other.title = 'Robotics Afterparty'
+        self.other.save()
+        self.assertIn(self.other.pk, self.search('robotics'))
+        self.assertEqual(self.search('festival'), [])
+
+    def test_explicit_ordering_overrides_rank(self):
+        """Test that ?ordering= takes precedence over the search rank"""
+        self.assertEqual(
+            self.search('robotics', ordering='-start_date'),
+            [self.description_match.pk, self.title_match.pk]
+        )
+
+    def test_search_uses_gin_index(self):
+        """Test that the search query can use the GIN index instead of a sequential scan"""
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                plan = Event.objects.filter(search_vector='robotics').explain()
+            finally:
+                cursor.execute('SET enable_seqscan = on')
+        self.assertIn('event_search_vector_idx', plan)
+
+    def test_non_postgres_falls_back_to_ilike(self):
+        """Test that other databases use the plain SearchFilter"""
+        # Full-text search matches word prefixes only; ILIKE matches substrings
+        self.assertEqual(self.search('obotic'), [])
+        cache.clear()
+        with mock.patch.object(connection, 'vendor', 'sqlite'):
+            self.assertEqual(
+                sorted(self.search('obotic')),
+                [self.title_match.pk, self.description_match.pk]
+            )
+
+    def test_benchmark_command(self):
+        """Test that the search benchmark runs and rolls back its rows"""
+        out = StringIO()
+        call_command('benchmark_search', rows=500, runs=1, terms=['python'], stdout=out)
+        self.assertIn('tsvector', out.getvalue())
+        self.assertEqual(Event.objects.count(), 3)
@@ -1,5 +1,8 @@
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 from events.models import Event, Track, Session, Registration, SessionRegistration
@@ -90,12 +93,126 @@ class SessionAPITestCase(APITestCase):
         self.assertEqual(Session.objects.count(), 2)
         self.assertEqual(Session.objects.get(title='New Test Session').track, self.track)
     
+    def test_create_overlapping_session(self):
+        """Test that the database rejects a session overlapping another in the track"""
+        self.client.force_authenticate(user=self.organizer)
+        data = {
+            'title': 'Overlapping Session',
+            'description': 'This session overlaps the existing one',
+            'start_time': (self.event.start_date + timedelta(hours=1, minutes=30)).isoformat(),
+            'end_time': (self.event.start_date + timedelta(hours=3)).isoformat()
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.sessions_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('conflicts', response.data['detail'])
+        # The INSERT itself is validated; no overlap pre-check query runs
+        self.assertFalse(any('"events_session"."end_time" >' in query['sql'] for query in queries))
+        self.assertEqual(Session.objects.count(), 1)
+
+    def test_back_to_back_sessions_are_allowed(self):
+        """Test that a session may start when the previous one ends"""
+        self.client.force_authenticate(user=self.organizer)
+        data = {
+            'title': 'Back To Back Session',
+            'description': 'Starts exactly when the existing session ends',
+            'start_time': self.session.end_time.isoformat(),
+            'end_time': (self.session.end_time + timedelta(hours=1)).isoformat()
+        }
+        response = self.client.post(self.sessions_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update_into_overlap(self):
+        """Test that moving a session onto another one is rejected"""
+        other = Session.objects.create(
+            track=self.track,
+            title='Later Session',
+            description='A later session',
+            start_time=self.event.start_date + timedelta(hours=3),
+            end_time=self.event.start_date + timedelta(hours=4)
+        )
+        self.client.force_authenticate(user=self.organizer)
+        url = reverse('track-sessions-detail', kwargs={
+            'event_pk': self.event.pk, 'track_pk': self.track.pk, 'pk': other.pk
+        })
+        response = self.client.patch(url, {'start_time': self.session.start_time.isoformat()}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_full_clean_reports_overlap(self):
+        """Test that model validation reports the constraint as a validation error"""
+        overlapping = Session(
+            track=self.track,
+            title='Overlapping Session',
+            description='This session overlaps the existing one',
+            start_time=self.session.start_time,
+            end_time=self.session.end_time
+        )
+        with self.assertRaisesMessage(ValidationError, 'conflicts with another session'):
+            overlapping.full_clean()
+
+    def test_speaker_conflict_across_tracks(self):
+        """Test that a speaker cannot be booked in two tracks at once"""
+        other_track = Track.objects.create(event=self.event, name='Other Track')
+        url = reverse('track-sessions-list', kwargs={'event_pk': self.event.pk, 'track_pk': other_track.pk})
+        self.client.force_authenticate(user=self.organizer)
+        data = {
+            'title': 'Double Booked Talk',
+            'description': 'Same speaker, same time, another track',
+            'speaker_id': self.speaker.id,
+            'start_time': (self.session.start_time + timedelta(minutes=30)).isoformat(),
+            'end_time': (self.session.end_time + timedelta(minutes=30)).isoformat()
+        }
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('Test Session', str(response.data['speaker_id']))
+
+        data['start_time'] = self.session.end_time.isoformat()
+        data['end_time'] = (self.session.end_time + timedelta(hours=1)).isoformat()
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update_into_speaker_conflict(self):
+        """Test that assigning a busy speaker to an overlapping session is rejected"""
+        other_track = Track.objects.create(event=self.event, name='Other Track')
+        other = Session.objects.create(
+            track=other_track,
+            title='Parallel Session',
+            description='Runs at the same time in another track',
+            start_time=self.session.start_time,
+            end_time=self.session.end_time
+        )
+        self.client.force_authenticate(user=self.organizer)
+        url = reverse('track-sessions-detail', kwargs={
+            'event_pk': self.event.pk, 'track_pk': other_track.pk, 'pk': other.pk
+        })
+        response = self.client.patch(url, {'speaker_id': self.speaker.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(Session.objects.get(pk=other.pk).speaker)
+
+        # Updating the speaker's own session does not conflict with itself
+        response = self.client.patch(self.session_detail_url, {'title': 'Renamed Session'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_full_clean_reports_speaker_conflict(self):
+        """Test that model validation reports speaker conflicts"""
+        other_track = Track.objects.create(event=self.event, name='Other Track')
+        parallel = Session(
+            track=other_track,
+            title='Parallel Session',
+            description='Runs at the same time in another track',
+            speaker=self.speaker,
+            start_time=self.session.start_time,
+            end_time=self.session.end_time
+        )
+        with self.assertRaisesMessage(ValidationError, 'Speaker is already presenting'):
+            parallel.full_clean()
+
     def test_get_sessions_list(self):
         """Test retrieving a list of sessions"""
         self.client.force_authenticate(user=self.attendee)
         response = self.client.get(self.sessions_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
     
     def test_get_session_detail(self):
         """Test retrieving a specific session"""
@@ -104,6 +221,30 @@ class SessionAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], 'Test Session')
     
+    def test_session_visibility(self):
+        """Test that only the organizer and confirmed attendees can see sessions"""
+        pending = User.objects.create_user(username='session_pending', password='password123')
+        Registration.objects.create(event=self.event, attendee=pending, status='pending')
+        self.client.force_authenticate(user=pending)
+        response = self.client.get(self.session_detail_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.client.force_authenticate(user=self.organizer)
+        response = self.client.get(self.session_detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_visible_sessions_are_not_duplicated(self):
+        """Test that visibility is a semi-join, so sessions are neither repeated nor DISTINCTed"""
+        others = User.objects.bulk_create([User(username=f'session_other_{i}') for i in range(5)])
+        Registration.objects.bulk_create([
+            Registration(event=self.event, attendee=other, status='confirmed') for other in others
+        ])
+        visible = Session.objects.visible_to(self.attendee)
+        self.assertEqual(list(visible), [self.session])
+        self.assertNotIn('DISTINCT', str(visible.query))
+        self.assertEqual(list(Session.objects.visible_to(self.organizer)), [self.session])
+        self.assertEqual(list(Session.objects.visible_to(self.speaker)), [])
+
     def test_update_session(self):
         """Test updating a session"""
         self.client.force_authenticate(user=self.organizer)
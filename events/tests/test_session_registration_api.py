@@ -1,4 +1,5 @@
 from django.urls import reverse
+from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -169,4 +170,55 @@ class SessionRegistrationAPITestCase(APITestCase):
         }
         response = self.client.post(self.session_registrations_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(SessionRegistration.objects.count(), 1)
\ No newline at end of file
+        self.assertEqual(SessionRegistration.objects.count(), 1)
+
+    def overlapping_session(self, offset=timedelta(minutes=30)):
+        other_track = Track.objects.create(event=self.event, name='Parallel Track')
+        return Session.objects.create(
+            track=other_track,
+            title='Parallel Session',
+            description='Runs alongside the test session',
+            start_time=self.session.start_time + offset,
+            end_time=self.session.end_time + offset
+        )
+
+    def test_double_booking_allowed_by_default(self):
+        """Test that overlapping session registrations are allowed unless the event prevents them"""
+        parallel = self.overlapping_session()
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.post(self.session_registrations_url, {'session_id': parallel.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_double_booking_prevented(self):
+        """Test that the event policy rejects overlapping session registrations"""
+        self.event.prevent_double_booking = True
+        self.event.save()
+        parallel = self.overlapping_session()
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.post(self.session_registrations_url, {'session_id': parallel.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('Session Registration Test Session', response.data['detail'])
+        self.assertFalse(SessionRegistration.objects.filter(session=parallel).exists())
+
+        # Other attendees are not affected
+        self.client.force_authenticate(user=self.other_attendee)
+        response = self.client.post(self.session_registrations_url, {'session_id': parallel.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_back_to_back_sessions_are_not_double_booked(self):
+        """Test that a session starting when another ends does not count as overlapping"""
+        self.event.prevent_double_booking = True
+        self.event.save()
+        following = self.overlapping_session(offset=self.session.end_time - self.session.start_time)
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.post(self.session_registrations_url, {'session_id': following.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_full_clean_reports_double_booking(self):
+        """Test that model validation applies the double-booking policy"""
+        self.event.prevent_double_booking = True
+        self.event.save()
+        parallel = self.overlapping_session()
+        registration = SessionRegistration(session=parallel, attendee=self.attendee)
+        with self.assertRaisesMessage(ValidationError, 'overlapping session'):
+            registration.full_clean()
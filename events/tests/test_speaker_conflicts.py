@@ -0,0 +1,87 @@
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Track, Session
+from datetime import timedelta
+from django.utils import timezone
+
+
+class SpeakerConflictsAPITestCase(APITestCase):
+    def setUp(self):
+        # Create test users
+        self.organizer = User.objects.create_user(
+            username='conflict_organizer',
+            email='conflict_organizer@example.com',
+            password='password123'
+        )
+        self.speaker = User.objects.create_user(username='conflict_speaker', password='password123')
+        self.other_speaker = User.objects.create_user(username='conflict_other_speaker', password='password123')
+
+        # Create two overlapping events
+        self.start = timezone.now() + timedelta(days=10)
+        self.event, self.other_event = [
+            Event.objects.create(
+                title=title,
+                description='A test conference for speaker conflict testing',
+                start_date=self.start,
+                end_date=self.start + timedelta(days=1),
+                venue='Conflict Venue',
+                capacity=100,
+                organizer=self.organizer
+            )
+            for title in ('Conflict Conference', 'Other Conference')
+        ]
+        self.tracks = [Track.objects.create(event=self.event, name=f'Track {i}') for i in range(3)]
+        self.other_track = Track.objects.create(event=self.other_event, name='Other Track')
+        self.url = f'/api/events/{self.event.pk}/speaker-conflicts/'
+        self.client.force_authenticate(user=self.organizer)
+
+    def add_session(self, track, speaker, hour, length=1):
+        # Bypass the serializer check to set up conflicts that predate it
+        return Session.objects.bulk_create([Session(
+            track=track,
+            title=f'{speaker.username} at {hour}',
+            description='A test session for speaker conflict testing',
+            speaker=speaker,
+            start_time=self.start + timedelta(hours=hour),
+            end_time=self.start + timedelta(hours=hour + length)
+        )])[0]
+
+    def test_report_lists_overlapping_pairs(self):
+        """Test that every overlapping pair of a speaker's sessions is reported"""
+        long_talk = self.add_session(self.tracks[0], self.speaker, 1, length=3)
+        clash = self.add_session(self.tracks[1], self.speaker, 2)
+        second_clash = self.add_session(self.tracks[2], self.speaker, 3)
+        self.add_session(self.tracks[1], self.speaker, 4)
+        self.add_session(self.tracks[1], self.other_speaker, 1)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        pairs = [[session['id'] for session in conflict['sessions']] for conflict in response.data['conflicts']]
+        self.assertEqual(pairs, [[long_talk.pk, clash.pk], [long_talk.pk, second_clash.pk]])
+        self.assertEqual(response.data['conflicts'][0]['speaker'], {'id': self.speaker.pk, 'username': 'conflict_speaker'})
+        self.assertEqual(response.data['conflicts'][0]['sessions'][1]['track'], {'id': self.tracks[1].pk, 'name': 'Track 1'})
+
+    def test_conflicts_with_other_events(self):
+        """Test that a speaker booked at another event at the same time is reported"""
+        talk = self.add_session(self.tracks[0], self.speaker, 1)
+        elsewhere = self.add_session(self.other_track, self.speaker, 1)
+        response = self.client.get(self.url)
+        sessions = response.data['conflicts'][0]['sessions']
+        self.assertEqual({session['id'] for session in sessions}, {talk.pk, elsewhere.pk})
+        self.assertEqual({session['event'] for session in sessions}, {self.event.pk, self.other_event.pk})
+
+    def test_report_query_count_is_constant(self):
+        """Test that the report reads all sessions in one query"""
+        for hour in range(10):
+            self.add_session(self.tracks[hour % 3], self.speaker, hour / 2)
+        # The event and one sweep over the sessions
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['conflicts']), 9)
+
+    def test_report_forbidden_for_non_organizer(self):
+        """Test that only the organizer can see speaker conflicts"""
+        self.client.force_authenticate(user=self.speaker)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,143 @@
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from events.authentication import StatelessJWTAuthentication
+from events.models import Event, ClaimsUser
+from events.views import EventViewSet
+from datetime import timedelta
+from django.utils import timezone
+
+
+class StatelessJWTAuthenticationTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='stateless_user',
+            email='stateless_user@example.com',
+            password='password123',
+            first_name='Stateless'
+        )
+        self.factory = APIRequestFactory()
+
+    def obtain(self, username='stateless_user', password='password123'):
+        response = self.client.post(reverse('token_obtain_pair'), {'username': username, 'password': password})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def authenticate(self, token):
+        request = self.factory.get('/api/events/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        return StatelessJWTAuthentication().authenticate(request)[0]
+
+    def test_tokens_carry_user_claims(self):
+        """Test that issued tokens carry the claims and the access token lifetime"""
+        data = self.obtain()
+        access = AccessToken(data['access'])
+        self.assertEqual(access['username'], 'stateless_user')
+        self.assertFalse(access['is_staff'])
+        self.assertFalse(access['is_superuser'])
+        self.assertEqual(data['expires_in'], int(access.lifetime.total_seconds()))
+
+    def test_authenticate_without_query(self):
+        """Test that the user is built from the claims alone"""
+        token = self.obtain()['access']
+        with self.assertNumQueries(0):
+            user = self.authenticate(token)
+            self.assertEqual(user, self.user)
+            self.assertEqual(user.username, 'stateless_user')
+            self.assertTrue(user.is_authenticated)
+            self.assertTrue(user.is_active)
+            self.assertFalse(user.is_staff)
+        self.assertIsInstance(user, User)
+
+    def test_other_fields_load_once_and_are_cached(self):
+        """Test that reading unclaimed fields loads them together, then from the cache"""
+        token = self.obtain()['access']
+        user = self.authenticate(token)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, 'stateless_user@example.com')
+            self.assertEqual(user.first_name, 'Stateless')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate(token).email, 'stateless_user@example.com')
+
+        self.user.email = 'changed@example.com'
+        self.user.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authenticate(token).email, 'changed@example.com')
+
+    def test_tokens_without_claims_load_the_user(self):
+        """Test that tokens issued before the claims existed still authenticate"""
+        user = self.authenticate(str(AccessToken.for_user(self.user)))
+        self.assertNotIsInstance(user, ClaimsUser)
+        self.assertEqual(user, self.user)
+
+    def test_refresh_reissues_claims_and_rotates(self):
+        """Test that refreshing picks up role changes and returns a new refresh token"""
+        data = self.obtain()
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.post(reverse('token_refresh'), {'refresh': data['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(AccessToken(response.data['access'])['is_staff'])
+        self.assertNotEqual(response.data['refresh'], data['refresh'])
+        self.assertIn('expires_in', response.data)
+
+    def test_refresh_rejects_inactive_user(self):
+        """Test that deactivated users cannot refresh their tokens"""
+        refresh = str(RefreshToken.for_user(self.user))
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.post(reverse('token_refresh'), {'refresh': refresh})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class StatelessReadRequestTestCase(APITestCase):
+    """Test that cached reads skip the user query with stateless authentication"""
+
+    def setUp(self):
+        cache.clear()
+        self.organizer = User.objects.create_user(
+            username='stateless_organizer',
+            email='stateless_organizer@example.com',
+            password='password123'
+        )
+        start = timezone.now() + timedelta(days=10)
+        self.event = Event.objects.create(
+            title='Stateless Conference',
+            description='A test conference for stateless authentication',
+            start_date=start,
+            end_date=start + timedelta(days=2),
+            venue='Stateless Venue',
+            capacity=100,
+            organizer=self.organizer
+        )
+        response = self.client.post(
+            reverse('token_obtain_pair'), {'username': 'stateless_organizer', 'password': 'password123'}
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        self.url = reverse('event-detail', kwargs={'pk': self.event.pk})
+
+    def assertCachedReadQueries(self, authentication_class, queries):
+        with mock.patch.object(EventViewSet, 'authentication_classes', [authentication_class]):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+            with self.assertNumQueries(queries):
+                response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_cached_read_runs_no_queries(self):
+        """Test that a cached read costs the user query only with JWTAuthentication"""
+        self.assertCachedReadQueries(JWTAuthentication, 1)
+        self.assertCachedReadQueries(StatelessJWTAuthentication, 0)
+
+    def test_write_with_claims_user(self):
+        """Test that writes accept the claims user and serialize it in full"""
+        url = reverse('event-register', kwargs={'pk': self.event.pk})
+        with mock.patch.object(EventViewSet, 'authentication_classes', [StatelessJWTAuthentication]):
+            response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['attendee']['email'], 'stateless_organizer@example.com')
+        self.assertTrue(self.event.registrations.filter(attendee=self.organizer).exists())
@@ -0,0 +1,141 @@
+import asyncio
+from unittest import mock
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from events import stream
+from events.models import Event, RevokedToken
+from events.revocation import RevocationSyncThread, revocation_index
+from events.tests.test_event_stream import StreamClient
+from datetime import timedelta
+from django.utils import timezone
+
+
+class TokenRevocationTestCase(APITestCase):
+    def setUp(self):
+        revocation_index.reset()
+        self.addCleanup(revocation_index.reset)
+        self.user = User.objects.create_user(
+            username='revocation_user',
+            email='revocation_user@example.com',
+            password='password123'
+        )
+        start = timezone.now() + timedelta(days=10)
+        self.event = Event.objects.create(
+            title='Revocation Conference',
+            description='A test conference for token revocation',
+            start_date=start,
+            end_date=start + timedelta(days=2),
+            venue='Revocation Venue',
+            capacity=100,
+            organizer=self.user
+        )
+        self.url = reverse('event-register', kwargs={'pk': self.event.pk})
+
+    def obtain(self):
+        response = self.client.post(
+            reverse('token_obtain_pair'), {'username': 'revocation_user', 'password': 'password123'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def post_with(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+        return self.client.post(self.url)
+
+    def test_logout_revokes_both_tokens(self):
+        """Test that the revoke endpoint rejects the access and refresh tokens afterwards"""
+        data = self.obtain()
+        response = self.client.post(reverse('token_revoke'), {'refresh': data['refresh'], 'access': data['access']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(RevokedToken.objects.count(), 2)
+
+        self.assertEqual(self.post_with(data['access']).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials()
+        response = self.client.post(reverse('token_refresh'), {'refresh': data['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse('token_verify'), {'token': data['access']})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rotation_revokes_the_old_refresh_token(self):
+        """Test that a refresh token cannot be used again once rotated"""
+        data = self.obtain()
+        response = self.client.post(reverse('token_refresh'), {'refresh': data['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.post(reverse('token_refresh'), {'refresh': data['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertTrue(RevokedToken.objects.filter(jti=RefreshToken(data['refresh'])['jti']).exists())
+
+    def test_authentication_runs_no_revocation_query(self):
+        """Test that revocation is checked in memory, without syncing on the request path"""
+        access = AccessToken(self.obtain()['access'])
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation_index.is_revoked(access['jti']))
+        RevokedToken.objects.create(jti=access['jti'], expires_at=timezone.now() + timedelta(minutes=5))
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation_index.is_revoked(access['jti']))
+
+    def test_revocations_by_other_workers_are_synced(self):
+        """Test that a sync picks up rows written elsewhere"""
+        access = self.obtain()['access']
+        RevokedToken.objects.create(jti=AccessToken(access)['jti'], expires_at=timezone.now() + timedelta(minutes=5))
+        revocation_index.sync()
+        self.assertEqual(self.post_with(access).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        RevokedToken.objects.create(jti='later', expires_at=timezone.now() + timedelta(minutes=5))
+        with self.assertNumQueries(1):
+            revocation_index.sync()
+        self.assertTrue(revocation_index.is_revoked('later'))
+
+    def test_sync_drops_expired_tokens(self):
+        """Test that syncing skips and forgets revocations of tokens that have expired"""
+        RevokedToken.objects.create(jti='expired', expires_at=timezone.now() - timedelta(minutes=1))
+        RevokedToken.objects.create(jti='current', expires_at=timezone.now() + timedelta(minutes=5))
+        revocation_index.add('lapsed', timezone.now() - timedelta(seconds=1))
+        revocation_index.sync()
+        self.assertTrue(revocation_index.is_revoked('current'))
+        self.assertFalse(revocation_index.is_revoked('expired'))
+        self.assertFalse(revocation_index.is_revoked('lapsed'))
+        self.assertEqual(len(revocation_index), 1)
+
+    def test_start_loads_and_syncs_in_background(self):
+        """Test that starting a server process loads the index and starts one sync thread"""
+        RevokedToken.objects.create(jti='current', expires_at=timezone.now() + timedelta(minutes=5))
+        with mock.patch.object(RevocationSyncThread, 'start') as start:
+            revocation_index.start()
+        self.assertTrue(revocation_index.is_revoked('current'))
+        start.assert_called_once_with()
+        self.addCleanup(setattr, revocation_index, '_syncer', None)
+
+        with override_settings(REVOKED_TOKEN_SYNC_INTERVAL=0):
+            revocation_index._syncer = None
+            with mock.patch.object(RevocationSyncThread, 'start') as start:
+                revocation_index.start()
+            start.assert_not_called()
+
+    def test_stream_rejects_revoked_tokens(self):
+        """Test that the event stream refuses revoked access tokens"""
+        data = self.obtain()
+        self.client.post(reverse('token_revoke'), {'refresh': data['refresh'], 'access': data['access']})
+
+        async def run():
+            client = StreamClient(f"token={data['access']}".encode())
+            await client.connect()
+            return client
+        client = asyncio.run(run())
+        self.assertEqual(client.status, 401)
+        self.assertEqual(stream.broker.subscriber_count, 0)
+
+    def test_prune_revoked_tokens(self):
+        """Test that the prune command deletes only expired revocations"""
+        RevokedToken.objects.create(jti='expired', expires_at=timezone.now() - timedelta(minutes=1))
+        RevokedToken.objects.create(jti='current', expires_at=timezone.now() + timedelta(minutes=5))
+        out = StringIO()
+        call_command('prune_revoked_tokens', stdout=out)
+        self.assertIn('Pruned 1 expired revoked token(s)', out.getvalue())
+        self.assertEqual(list(RevokedToken.objects.values_list('jti', flat=True)), ['current'])
@@ -63,7 +63,7 @@ class TrackAPITestCase(APITestCase):
         self.client.force_authenticate(user=self.attendee)
         response = self.client.get(self.tracks_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
     
     def test_get_track_detail(self):
         """Test retrieving a specific track"""
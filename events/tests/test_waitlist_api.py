@@ -0,0 +1,240 @@
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from events.models import Event, Track, Session, Registration, SessionRegistration, WaitlistEntry
+from datetime import timedelta
+from django.utils import timezone
+
+
+class WaitlistAPITestCase(APITestCase):
+    def setUp(self):
+        # Create test users
+        self.organizer = User.objects.create_user(
+            username='waitlist_organizer',
+            email='waitlist_organizer@example.com',
+            password='password123'
+        )
+        self.attendee = User.objects.create_user(
+            username='waitlist_attendee',
+            email='waitlist_attendee@example.com',
+            password='password123'
+        )
+        self.waiting = [
+            User.objects.create_user(username=f'waiting_{i}', password='password123')
+            for i in range(3)
+        ]
+
+        # Create a full test event
+        self.event = Event.objects.create(
+            title='Waitlist Test Conference',
+            description='A test conference for waitlist API testing',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='Waitlist Test Venue',
+            capacity=1,
+            organizer=self.organizer
+        )
+        self.registration = Registration.objects.create(
+            event=self.event,
+            attendee=self.attendee,
+            status='confirmed'
+        )
+
+        # URLs
+        self.event_waitlist_url = reverse('event-waitlist', kwargs={'pk': self.event.pk})
+        self.registration_cancel_url = reverse('registration-cancel', kwargs={'pk': self.registration.pk})
+
+    def test_join_waitlist_for_full_event(self):
+        """Test joining the waitlist of a full event assigns FIFO positions"""
+        for expected_position, user in enumerate(self.waiting, start=1):
+            self.client.force_authenticate(user=user)
+            response = self.client.post(self.event_waitlist_url)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(response.data['position'], expected_position)
+
+    def test_join_waitlist_twice(self):
+        """Test that an attendee cannot join the same waitlist twice"""
+        self.client.force_authenticate(user=self.waiting[0])
+        self.client.post(self.event_waitlist_url)
+        response = self.client.post(self.event_waitlist_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(WaitlistEntry.objects.count(), 1)
+
+    def test_join_waitlist_with_available_seats(self):
+        """Test that the waitlist is rejected while seats are available"""
+        self.event.capacity = 5
+        self.event.save()
+        self.client.force_authenticate(user=self.waiting[0])
+        response = self.client.post(self.event_waitlist_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cancel_promotes_first_waitlisted_attendee(self):
+        """Test that cancelling a confirmed registration promotes the head of the waitlist"""
+        for user in self.waiting:
+            WaitlistEntry.enqueue(event=self.event, attendee=user)
+        # A pending registration is confirmed in place on promotion
+        Registration.objects.create(event=self.event, attendee=self.waiting[0], status='pending')
+
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.post(self.registration_cancel_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(
+            Registration.objects.get(event=self.event, attendee=self.waiting[0]).status,
+            'confirmed'
+        )
+        self.assertFalse(Registration.objects.filter(attendee=self.waiting[1]).exists())
+        self.assertEqual(
+            list(WaitlistEntry.objects.values_list('attendee', flat=True)),
+            [self.waiting[1].pk, self.waiting[2].pk]
+        )
+        self.assertEqual(Event.objects.get(pk=self.event.pk).confirmed_count, 1)
+
+    def test_promotion_drops_entries_of_confirmed_attendees(self):
+        """Test that entries of attendees confirmed by another route are deleted, not kept at the head"""
+        for user in self.waiting[:2]:
+            WaitlistEntry.enqueue(event=self.event, attendee=user)
+        self.event.capacity = 3
+        self.event.save()
+        Registration.objects.create(event=self.event, attendee=self.waiting[0], status='pending').confirm()
+
+        promoted = Event.objects.get(pk=self.event.pk).promote_waitlist()
+        self.assertEqual([entry.attendee_id for entry in promoted], [self.waiting[1].pk])
+        self.assertFalse(WaitlistEntry.objects.exists())
+
+    def test_batch_promotion_query_count(self):
+        """Test that promoting many attendees costs a constant number of queries"""
+        self.event.capacity = 200
+        self.event.save()
+        users = User.objects.bulk_create([User(username=f'batch_{i}') for i in range(150)])
+        WaitlistEntry.objects.bulk_create([
+            WaitlistEntry(event=self.event, attendee=user, position=i)
+            for i, user in enumerate(users, start=1)
+        ])
+        # savepoint, lock, select entries, existing registrations, update,
+        # bulk insert, counter, delete, release
+        with self.assertNumQueries(9):
+            promoted = self.event.promote_waitlist()
+        self.assertEqual(len(promoted), 150)
+        self.assertEqual(Event.objects.get(pk=self.event.pk).confirmed_count, 151)
+        self.assertEqual(WaitlistEntry.objects.count(), 0)
+
+
+class SessionWaitlistAPITestCase(APITestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username='session_waitlist_organizer',
+            password='password123'
+        )
+        self.attendee = User.objects.create_user(
+            username='session_waitlist_attendee',
+            password='password123'
+        )
+        self.waiting = User.objects.create_user(
+            username='session_waitlist_waiting',
+            password='password123'
+        )
+        self.event = Event.objects.create(
+            title='Session Waitlist Conference',
+            description='A test conference for session waitlist testing',
+            start_date=timezone.now() + timedelta(days=10),
+            end_date=timezone.now() + timedelta(days=12),
+            venue='Session Waitlist Venue',
+            capacity=10,
+            organizer=self.organizer
+        )
+        self.track = Track.objects.create(event=self.event, name='Session Waitlist Track')
+        self.session = Session.objects.create(
+            track=self.track,
+            title='Full Session',
+            description='A session with a single seat',
+            start_time=self.event.start_date + timedelta(hours=1),
+            end_time=self.event.start_date + timedelta(hours=2),
+            capacity=1
+        )
+        for user in (self.attendee, self.waiting):
+            Registration.objects.create(event=self.event, attendee=user, status='confirmed')
+        self.session_registration = SessionRegistration.objects.create(
+            session=self.session, attendee=self.attendee
+        )
+        self.session_waitlist_url = reverse('track-sessions-waitlist', kwargs={
+            'event_pk': self.event.pk, 'track_pk': self.track.pk, 'pk': self.session.pk
+        })
+
+    def test_waitlist_is_scoped_to_the_url(self):
+        """Test that a session cannot be waitlisted through another event's URL"""
+        other = Event.objects.create(
+            title='Other Waitlist Conference',
+            description='Another conference',
+            start_date=self.event.start_date,
+            end_date=self.event.end_date,
+            venue='Elsewhere',
+            capacity=10,
+            organizer=self.organizer
+        )
+        other_track = Track.objects.create(event=other, name='Other Track')
+        url = reverse('track-sessions-waitlist', kwargs={
+            'event_pk': other.pk, 'track_pk': other_track.pk, 'pk': self.session.pk
+        })
+        self.client.force_authenticate(user=self.waiting)
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(WaitlistEntry.objects.exists())
+
+    def test_promotion_drops_entries_of_registered_attendees(self):
+        """Test that entries of attendees registered for the session by another route are deleted"""
+        self.client.force_authenticate(user=self.waiting)
+        self.client.post(self.session_waitlist_url)
+        self.session.capacity = 3
+        self.session.save()
+        SessionRegistration.objects.create(session=self.session, attendee=self.waiting)
+
+        self.assertEqual(Session.objects.get(pk=self.session.pk).promote_waitlist(), [])
+        self.assertFalse(WaitlistEntry.objects.exists())
+
+    def test_session_cancel_promotes_waitlisted_attendee(self):
+        """Test that cancelling a session registration promotes the waitlisted attendee"""
+        self.client.force_authenticate(user=self.waiting)
+        response = self.client.post(self.session_waitlist_url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['session'], self.session.pk)
+
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.post(
+            reverse('session-registration-cancel', kwargs={'pk': self.session_registration.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(SessionRegistration.objects.filter(
+            session=self.session, attendee=self.waiting).exists())
+        self.assertEqual(Session.objects.get(pk=self.session.pk).attendee_count, 1)
+        self.assertFalse(WaitlistEntry.objects.exists())
+
+    def test_promotion_skips_double_booked_attendees(self):
+        """Test that promotion drops attendees holding an overlapping session when the event prevents it"""
+        self.event.prevent_double_booking = True
+        self.event.save()
+        next_waiting = User.objects.create_user(username='session_waitlist_next', password='password123')
+        Registration.objects.create(event=self.event, attendee=next_waiting, status='confirmed')
+        for user in (self.waiting, next_waiting):
+            self.client.force_authenticate(user=user)
+            self.client.post(self.session_waitlist_url)
+        parallel = Session.objects.create(
+            track=Track.objects.create(event=self.event, name='Parallel Track'),
+            title='Parallel Session',
+            description='A session overlapping the full one',
+            start_time=self.session.start_time,
+            end_time=self.session.end_time
+        )
+        SessionRegistration.objects.create(session=parallel, attendee=self.waiting)
+
+        self.client.force_authenticate(user=self.attendee)
+        response = self.client.post(
+            reverse('session-registration-cancel', kwargs={'pk': self.session_registration.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(
+            list(SessionRegistration.objects.filter(session=self.session).values_list('attendee', flat=True)),
+            [next_waiting.pk]
+        )
+        self.assertFalse(WaitlistEntry.objects.exists())
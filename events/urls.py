@@ -3,13 +3,16 @@ from rest_framework.routers import DefaultRouter
 from rest_framework_nested import routers
 from .views import (
     EventViewSet, TrackViewSet, SessionViewSet,
-    RegistrationViewSet, SessionRegistrationViewSet
+    RegistrationViewSet, SessionRegistrationViewSet, AutocompleteViewSet, MeViewSet,
+    CALENDAR_FEED_OPTIONS
 )
 
 router = DefaultRouter()
 router.register(r'events', EventViewSet)
 router.register(r'registrations', RegistrationViewSet)
 router.register(r'session-registrations', SessionRegistrationViewSet, basename='session-registration')
+router.register(r'autocomplete', AutocompleteViewSet, basename='autocomplete')
+router.register(r'me', MeViewSet, basename='me')
 
 # Nested routes for tracks under events
 event_router = routers.NestedDefaultRouter(router, r'events', lookup='event')
@@ -19,7 +22,22 @@ event_router.register(r'tracks', TrackViewSet, basename='event-tracks')
 track_router = routers.NestedDefaultRouter(event_router, r'tracks', lookup='track')
 track_router.register(r'sessions', SessionViewSet, basename='track-sessions')
 
+# Calendar clients expect file-like feed URLs without a trailing slash
+calendar_urls = [
+    path(
+        'events/<int:pk>/calendar.ics',
+        EventViewSet.as_view({'get': 'calendar'}, basename='event', detail=True, **CALENDAR_FEED_OPTIONS),
+        name='event-calendar'
+    ),
+    path(
+        'me/calendar.ics',
+        MeViewSet.as_view({'get': 'calendar'}, basename='me', detail=False, **CALENDAR_FEED_OPTIONS),
+        name='me-calendar'
+    ),
+]
+
 urlpatterns = [
+    *calendar_urls,
     path('', include(router.urls)),
     path('', include(event_router.urls)),
     path('', include(track_router.urls)),
@@ -1,28 +1,78 @@
-from rest_framework import viewsets, permissions, status, filters
+from rest_framework import viewsets, permissions, status, filters, serializers
 from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.http import urlencode
+from django.utils.cache import patch_cache_control
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
-from .models import Event, Track, Session, Registration, SessionRegistration
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Prefetch
+from .models import (
+    Event, Track, Session, Registration, SessionRegistration, WaitlistEntry,
+    DOUBLE_BOOKING_MESSAGE, MANAGE_EVENT, managed_by_filter
+)
 from .serializers import (
     EventSerializer, TrackSerializer, SessionSerializer,
-    RegistrationSerializer, SessionRegistrationSerializer
+    RegistrationSerializer, SessionRegistrationSerializer, WaitlistEntrySerializer,
+    BulkRegistrationActionSerializer, BulkRegistrationCreateSerializer, AutocompleteQuerySerializer,
+    ScheduleImportSerializer, RegistrationExportQuerySerializer,
+    UserSerializer, ManagedEventSerializer, CoOrganizerSerializer
+)
+from . import bulk, schedule
+from .permissions import (
+    IsOrganizerOrReadOnly, IsEventOrganizerOrReadOnly, NestedParentMixin,
+    can_manage_event, get_permission_checker, prefetch_event_permissions
 )
-from .permissions import IsOrganizerOrReadOnly, IsEventOrganizerOrReadOnly
+from .pagination import KeysetPaginationMixin, EventKeysetPagination, RegistrationKeysetPagination
+from .streaming import NestedListMixin
+from .cache import (
+    CachedResponseMixin, ConditionalGetMixin, ResponseCacheMixin, get_version, user_scope
+)
+from .search import FullTextSearchFilter
+from .autocomplete import autocomplete
+from .agenda import agenda_event_ids, build_agenda
+from .calendar import CalendarFeedAuthentication, ICalendarRenderer, feed_token, stream_calendar
+from .export import CSVRenderer, JSONLinesRenderer, accepts_gzip, stream_registrations
 from rest_framework.exceptions import PermissionDenied
 from drf_spectacular.utils import extend_schema
+from rest_framework_simplejwt.views import TokenViewBase
+from .authentication import TokenRevokeSerializer
+from guardian.shortcuts import assign_perm, remove_perm
+
 
+# Initkwargs of the calendar feed views. Calendar clients poll a fixed URL,
+# so feeds also accept the signed token handed out by /api/me/calendar/.
+CALENDAR_FEED_OPTIONS = {
+    'authentication_classes': [*api_settings.DEFAULT_AUTHENTICATION_CLASSES, CalendarFeedAuthentication],
+    'permission_classes': [permissions.IsAuthenticated],
+    'renderer_classes': [JSONRenderer, ICalendarRenderer],
+}
 
-class EventViewSet(viewsets.ModelViewSet):
+
+class EventViewSet(CachedResponseMixin, KeysetPaginationMixin, NestedListMixin, viewsets.ModelViewSet):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
+    keyset_pagination_class = EventKeysetPagination
+    cache_event_kwarg = 'pk'
     permission_classes = [IsOrganizerOrReadOnly, permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, filters.OrderingFilter]
     filterset_fields = ['venue', 'start_date', 'end_date']
     search_fields = ['title', 'description', 'venue']
+    search_vector_field = 'search_vector'
     ordering_fields = ['start_date', 'end_date', 'created_at']
     
+    def get_queryset(self):
+        if self.action in ('list', 'retrieve'):
+            return Event.objects.with_details()
+        return Event.objects.all()
+    
     def perform_create(self, serializer):
         serializer.save(organizer=self.request.user)
     
@@ -38,67 +88,244 @@ class EventViewSet(viewsets.ModelViewSet):
             )
         
         # Check if event is full
-        if event.registrations.filter(status='confirmed').count() >= event.capacity:
+        if event.confirmed_count >= event.capacity:
             return Response(
                 {'detail': 'Event has reached maximum capacity.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        registration = Registration.objects.create(
-            event=event,
-            attendee=request.user,
-            status='pending'
-        )
+        try:
+            with transaction.atomic():
+                registration = Registration.objects.create(
+                    event=event,
+                    attendee=request.user,
+                    status='pending'
+                )
+        except IntegrityError:
+            # Lost a race against a concurrent registration by the same user
+            return Response(
+                {'detail': 'You are already registered for this event.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         serializer = RegistrationSerializer(registration)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     
+    @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
+    def waitlist(self, request, pk=None):
+        event = self.get_object()
+        
+        if Registration.objects.filter(event=event, attendee=request.user, status='confirmed').exists():
+            return Response(
+                {'detail': 'You are already registered for this event.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if event.confirmed_count < event.capacity:
+            return Response(
+                {'detail': 'Event still has available seats.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            entry = WaitlistEntry.enqueue(event=event, attendee=request.user)
+        except IntegrityError:
+            return Response(
+                {'detail': 'You are already on the waitlist for this event.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = WaitlistEntrySerializer(entry)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+    
+    @action(detail=True, methods=['post'], url_path='registrations/bulk', url_name='registrations-bulk',
+            permission_classes=[permissions.IsAuthenticated])
+    def bulk_register(self, request, pk=None):
+        event = self.get_object()
+        if not can_manage_event(request, event):
+            return Response(
+                {'detail': 'You are not the organizer of this event.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        serializer = BulkRegistrationCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk.bulk_register(
+            event,
+            serializer.validated_data['user_ids'],
+            status=serializer.validated_data['status']
+        )
+        return Response({'results': results})
+    
+    @action(detail=True, methods=['post'], url_path='sessions/import', url_name='sessions-import',
+            permission_classes=[permissions.IsAuthenticated],
+            parser_classes=[JSONParser, MultiPartParser])
+    def import_sessions(self, request, pk=None):
+        event = self.get_object()
+        if not can_manage_event(request, event):
+            return Response(
+                {'detail': 'You are not the organizer of this event.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        serializer = ScheduleImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        rows = serializer.validated_data.get('sessions')
+        if rows is None:
+            upload = serializer.validated_data['file']
+            fmt = 'json' if upload.name.lower().endswith('.json') else 'csv'
+            try:
+                rows = schedule.parse_schedule(upload.read().decode('utf-8-sig'), fmt)
+            except (ValueError, UnicodeDecodeError) as exc:
+                return Response({'detail': f'Could not parse schedule: {exc}'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            summary = schedule.import_schedule(event, rows, dry_run=serializer.validated_data['dry_run'])
+        except schedule.ScheduleImportError as exc:
+            return Response({'errors': exc.errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(summary, status=status.HTTP_200_OK if summary['dry_run'] else status.HTTP_201_CREATED)
+    
+    @action(detail=True, methods=['get'], url_path='speaker-conflicts', url_name='speaker-conflicts',
+            permission_classes=[permissions.IsAuthenticated])
+    def speaker_conflicts(self, request, pk=None):
+        event = self.get_object()
+        if not can_manage_event(request, event):
+            return Response(
+                {'detail': 'You are not the organizer of this event.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return Response({'conflicts': schedule.speaker_conflicts(event)})
+    
+    @extend_schema(parameters=[RegistrationExportQuerySerializer])
+    @action(detail=True, methods=['get'], url_path='registrations/export', url_name='registrations-export',
+            permission_classes=[permissions.IsAuthenticated],
+            renderer_classes=[JSONRenderer, CSVRenderer, JSONLinesRenderer])
+    def export_registrations(self, request, pk=None):
+        event = self.get_object()
+        if not can_manage_event(request, event):
+            return Response(
+                {'detail': 'You are not the organizer of this event.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        params = RegistrationExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        return stream_registrations(
+            event,
+            params.validated_data['format'],
+            status=params.validated_data.get('status'),
+            compress=accepts_gzip(request)
+        )
+    
+    @action(detail=True, methods=['get', 'post'], url_path='co-organizers', url_name='co-organizers',
+            permission_classes=[permissions.IsAuthenticated])
+    def co_organizers(self, request, pk=None):
+        event = self.get_object()
+        if request.method == 'GET':
+            if not can_manage_event(request, event):
+                return Response(
+                    {'detail': 'You are not the organizer of this event.'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            users = User.objects.filter(
+                eventuserobjectpermission__content_object=event,
+                eventuserobjectpermission__permission__codename=MANAGE_EVENT
+            ).order_by('username')
+            return Response(UserSerializer(users, many=True).data)
+        if event.organizer_id != request.user.pk:
+            return Response(
+                {'detail': 'Only the organizer can change co-organizers.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        serializer = CoOrganizerSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data['user']
+        if user.pk == event.organizer_id:
+            return Response(
+                {'detail': 'The organizer already manages this event.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        assign_perm(MANAGE_EVENT, user, event)
+        return Response(UserSerializer(user).data, status=status.HTTP_201_CREATED)
+    
+    @action(detail=True, methods=['delete'], url_path=r'co-organizers/(?P<user_id>\d+)',
+            url_name='co-organizer-detail', permission_classes=[permissions.IsAuthenticated])
+    def remove_co_organizer(self, request, pk=None, user_id=None):
+        event = self.get_object()
+        if event.organizer_id != request.user.pk:
+            return Response(
+                {'detail': 'Only the organizer can change co-organizers.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        remove_perm(MANAGE_EVENT, get_object_or_404(User, pk=user_id), event)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    
+    def calendar(self, request, pk=None):
+        """iCalendar feed of the event's sessions, routed in urls.py as ``calendar.ics``."""
+        def build():
+            event = self.get_object()
+            sessions = Session.objects.filter(track__event=event).order_by('start_time', 'pk')
+            return stream_calendar(sessions, event.title, request.get_host())
+        # Streamed feeds cannot be stored in the response cache; they only get validators
+        return self.conditional_response(build)
+    
     @action(detail=True, methods=['get'])
     def tracks(self, request, pk=None):
-        event = self.get_object()
-        tracks = event.tracks.all()
-        serializer = TrackSerializer(tracks, many=True)
-        return Response(serializer.data)
+        return self.conditional_response(lambda: self.nested_list_response(
+            self.get_object().tracks.prefetch_related(
+                Prefetch('sessions', queryset=Session.objects.select_related('speaker'))
+            ).order_by('id'),
+            TrackSerializer
+        ))
 
 
-class TrackViewSet(viewsets.ModelViewSet):
+class TrackViewSet(CachedResponseMixin, NestedParentMixin, NestedListMixin, viewsets.ModelViewSet):
     queryset = Track.objects.all()
     serializer_class = TrackSerializer
     permission_classes = [permissions.IsAuthenticated, IsEventOrganizerOrReadOnly]
+    # The sessions action creates sessions in the track of the detail route
+    parent_track_kwarg = 'pk'
     
     def get_queryset(self):
         event_pk = self.kwargs.get('event_pk')
         queryset = Track.objects.all()
+        # Saving a track discards its prefetched sessions, so only reads prefetch them
+        if self.request.method in permissions.SAFE_METHODS:
+            queryset = queryset.prefetch_related(
+                Prefetch('sessions', queryset=Session.objects.select_related('speaker'))
+            )
         if event_pk:
             queryset = queryset.filter(event__pk=event_pk)
         return queryset
     
     def perform_create(self, serializer):
-        event = get_object_or_404(Event, pk=self.kwargs.get('event_pk'))
-        if event.organizer != self.request.user:
+        event = self.get_parent_event()
+        if event is None:
+            raise Http404
+        if not can_manage_event(self.request, event):
             raise PermissionDenied('You are not the organizer of this event')
         serializer.save(event=event)
     
     @action(detail=True, methods=['get', 'post'])
     def sessions(self, request, pk=None, event_pk=None):
-        track = self.get_object()
         if request.method == 'GET':
-            sessions = track.sessions.all()
-            serializer = SessionSerializer(sessions, many=True)
-            return Response(serializer.data)
-        elif request.method == 'POST':
-            if track.event.organizer != request.user:
-                return Response({'detail': 'You are not the organizer of this event.'}, status=status.HTTP_403_FORBIDDEN)
-            serializer = SessionSerializer(data=request.data)
-            if serializer.is_valid():
-                serializer.save(track=track)
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            return self.conditional_response(lambda: self.nested_list_response(
+                self.get_object().sessions.select_related('speaker').order_by('start_time', 'id'),
+                SessionSerializer
+            ))
+        track = self.get_parent_track()
+        if track is None:
+            raise Http404
+        if not can_manage_event(request, track.event):
+            return Response({'detail': 'You are not the organizer of this event.'}, status=status.HTTP_403_FORBIDDEN)
+        serializer = SessionSerializer(data=request.data)
+        if serializer.is_valid():
+            serializer.save(track=track)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class SessionViewSet(viewsets.ModelViewSet):
+class SessionViewSet(CachedResponseMixin, NestedParentMixin, viewsets.ModelViewSet):
     queryset = Session.objects.all()
     serializer_class = SessionSerializer
+    # Visible sessions depend on the user's registrations
+    cache_vary_on_user = True
     permission_classes = [permissions.IsAuthenticated, IsEventOrganizerOrReadOnly]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['start_time', 'end_time']
@@ -114,20 +341,23 @@ class SessionViewSet(viewsets.ModelViewSet):
             if event_pk:
                 queryset = queryset.filter(track__event__pk=event_pk)
         
-        return queryset.filter(
-            Q(track__event__organizer=self.request.user) | 
-            Q(track__event__registrations__attendee=self.request.user, 
-              track__event__registrations__status='confirmed')
-        ).distinct()
+        return queryset.visible_to(self.request.user)
     
+    def get_object(self):
+        session = super().get_object()
+        # Reuse the track resolved for the permission check, so saves and
+        # signals do not load it again
+        track = self.get_parent_track()
+        if track is not None and track.pk == session.track_id:
+            session.track = track
+        return session
+
     def perform_create(self, serializer):
-        track_pk = self.kwargs.get('track_pk')
-        track = get_object_or_404(Track, pk=track_pk)
-        
-        if not track:
-            self.permission_denied(self.request, message='Invalid track')
+        track = self.get_parent_track()
+        if track is None:
+            raise Http404
         
-        if track.event.organizer != self.request.user:
+        if not can_manage_event(self.request, track.event):
             self.permission_denied(self.request, message='You are not the organizer of this event')
             
         serializer.save(track=track)
@@ -148,7 +378,7 @@ class SessionViewSet(viewsets.ModelViewSet):
             )
         
         # Check if session is full
-        if session.capacity and session.attendees.count() >= session.capacity:
+        if session.capacity and session.attendee_count >= session.capacity:
             return Response(
                 {'detail': 'Session has reached maximum capacity.'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -161,18 +391,65 @@ class SessionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        session_registration = SessionRegistration.objects.create(
-            session=session,
-            attendee=request.user
-        )
+        with transaction.atomic():
+            clash = session.double_booking_for(request.user)
+            if clash is not None:
+                return Response(
+                    {'detail': f'{DOUBLE_BOOKING_MESSAGE}: "{clash.title}".'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            session_registration = SessionRegistration.objects.create(
+                session=session,
+                attendee=request.user
+            )
         
         serializer = SessionRegistrationSerializer(session_registration)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
+    
+    @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
+    def waitlist(self, request, pk=None, event_pk=None, track_pk=None):
+        # Scoped to the event and track of the URL; the track comes with its event
+        session = self.get_object()
+        
+        if not Registration.objects.filter(
+            event_id=session.track.event_id,
+            attendee=request.user,
+            status='confirmed'
+        ).exists():
+            return Response(
+                {'detail': 'You must be registered for the event first.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if SessionRegistration.objects.filter(session=session, attendee=request.user).exists():
+            return Response(
+                {'detail': 'You are already registered for this session.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if not session.capacity or session.attendee_count < session.capacity:
+            return Response(
+                {'detail': 'Session still has available seats.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            entry = WaitlistEntry.enqueue(event=session.track.event, attendee=request.user, session=session)
+        except IntegrityError:
+            return Response(
+                {'detail': 'You are already on the waitlist for this session.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = WaitlistEntrySerializer(entry)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class RegistrationViewSet(viewsets.ModelViewSet):
+class RegistrationViewSet(ConditionalGetMixin, KeysetPaginationMixin, viewsets.ModelViewSet):
     queryset = Registration.objects.all()
     serializer_class = RegistrationSerializer
+    keyset_pagination_class = RegistrationKeysetPagination
+    cache_vary_on_user = True
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['status', 'event']
@@ -184,7 +461,7 @@ class RegistrationViewSet(viewsets.ModelViewSet):
         if user.is_staff:
             return Registration.objects.all()
         queryset = Registration.objects.filter(
-            Q(attendee=user) | Q(event__organizer=user)
+            Q(attendee=user) | managed_by_filter(user, 'event')
         )
         return queryset.order_by('-registration_date')
     
@@ -202,7 +479,7 @@ class RegistrationViewSet(viewsets.ModelViewSet):
             )
         
         # Check if session is full
-        if session.capacity and session.attendees.count() >= session.capacity:
+        if session.capacity and session.attendee_count >= session.capacity:
             raise serializers.ValidationError(
                 {'detail': 'Session has reached maximum capacity.'}
             )
@@ -219,48 +496,69 @@ class RegistrationViewSet(viewsets.ModelViewSet):
     def approve(self, request, pk=None):
         registration = self.get_object()
         
-        # Check if user is the event organizer
-        if registration.event.organizer != request.user:
+        # Check if user is an event organizer
+        if not can_manage_event(request, registration.event):
             return Response(
                 {'detail': 'You are not authorized to approve registrations for this event.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Check if event is full
-        if registration.event.registrations.filter(status='confirmed').count() >= registration.event.capacity:
+        # Claim a seat atomically; fails if the event is full
+        if not registration.confirm():
             return Response(
                 {'detail': 'Event has reached maximum capacity.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        registration.status = 'confirmed'
-        registration.save()
-        
         serializer = self.get_serializer(registration)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['post'], url_path='bulk-approve')
+    def bulk_approve(self, request):
+        serializer = BulkRegistrationActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk.bulk_approve(
+            serializer.validated_data['ids'], request.user, get_permission_checker(request)
+        )
+        return Response({'results': results})
+    
+    @action(detail=False, methods=['post'], url_path='bulk-cancel')
+    def bulk_cancel(self, request):
+        serializer = BulkRegistrationActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk.bulk_cancel(
+            serializer.validated_data['ids'], request.user, get_permission_checker(request)
+        )
+        return Response({'results': results})
+    
     @action(detail=True, methods=['post'])
     def cancel(self, request, pk=None):
         # Get registration without checking permissions first
         registration = Registration.objects.get(pk=pk)
         
-        # Check if user is the attendee or event organizer
-        if registration.attendee != request.user and registration.event.organizer != request.user:
+        # Check if user is the attendee or an event organizer
+        if registration.attendee != request.user and not can_manage_event(request, registration.event):
             return Response(
                 {'detail': 'You are not authorized to cancel this registration.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        registration.status = 'cancelled'
-        registration.save()
+        with transaction.atomic():
+            freed_seat = registration.status == 'confirmed'
+            registration.status = 'cancelled'
+            registration.save()
+            if freed_seat:
+                registration.event.promote_waitlist()
         
         serializer = self.get_serializer(registration)
         return Response(serializer.data)
 
 
-class SessionRegistrationViewSet(viewsets.ModelViewSet):
+class SessionRegistrationViewSet(ConditionalGetMixin, KeysetPaginationMixin, viewsets.ModelViewSet):
     queryset = SessionRegistration.objects.all()
     serializer_class = SessionRegistrationSerializer
+    keyset_pagination_class = RegistrationKeysetPagination
+    cache_vary_on_user = True
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
@@ -268,7 +566,7 @@ class SessionRegistrationViewSet(viewsets.ModelViewSet):
         if user.is_staff:
             return SessionRegistration.objects.all()
         return SessionRegistration.objects.filter(
-            Q(attendee=user) | Q(session__track__event__organizer=user)
+            Q(attendee=user) | managed_by_filter(user, 'session__track__event')
         )
     
     def perform_create(self, serializer):
@@ -285,7 +583,7 @@ class SessionRegistrationViewSet(viewsets.ModelViewSet):
             )
         
         # Check if session is full
-        if session.capacity and session.attendees.count() >= session.capacity:
+        if session.capacity and session.attendee_count >= session.capacity:
             raise serializers.ValidationError(
                 {'detail': 'Session has reached maximum capacity.'}
             )
@@ -296,19 +594,92 @@ class SessionRegistrationViewSet(viewsets.ModelViewSet):
                 {'detail': 'You are already registered for this session.'}
             )
         
-        serializer.save(attendee=self.request.user)
+        with transaction.atomic():
+            clash = session.double_booking_for(self.request.user)
+            if clash is not None:
+                raise serializers.ValidationError(
+                    {'detail': f'{DOUBLE_BOOKING_MESSAGE}: "{clash.title}".'}
+                )
+            serializer.save(attendee=self.request.user)
     
     @action(detail=True, methods=['post'])
     def cancel(self, request, pk=None):
         session_registration = self.get_object()
         
-        # Check if user is the attendee or event organizer
+        # Check if user is the attendee or an event organizer
         if (session_registration.attendee != request.user and 
-                session_registration.session.track.event.organizer != request.user):
+                not can_manage_event(request, session_registration.session.track.event)):
             return Response(
                 {'detail': 'You are not authorized to cancel this registration.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        session_registration.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        with transaction.atomic():
+            session_registration.delete()
+            session_registration.session.promote_waitlist()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+class AutocompleteViewSet(ResponseCacheMixin, viewsets.ViewSet):
+    """Typeahead suggestions for event titles, venues and speaker usernames."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(parameters=[AutocompleteQuerySerializer])
+    def list(self, request):
+        params = AutocompleteQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        response = self.conditional_response(
+            lambda: Response(autocomplete(params.validated_data['q'], params.validated_data['limit']))
+        )
+        # Suggestions only change with event data, so clients may reuse them per prefix
+        patch_cache_control(response, private=True, max_age=settings.AUTOCOMPLETE_MAX_AGE)
+        return response
+
+
+class MeViewSet(ResponseCacheMixin, viewsets.GenericViewSet):
+    """Resources belonging to the requesting user."""
+    permission_classes = [permissions.IsAuthenticated]
+    cache_vary_on_user = True
+
+    def get_cache_scope(self):
+        return user_scope(self.request.user.pk)
+
+    def get_cache_scopes(self):
+        # Responses change with the user's own registrations and with the
+        # events they attend, but not with unrelated events
+        scope = self.get_cache_scope()
+        return [scope, *agenda_event_ids(self.request.user, get_version(scope))]
+
+    @action(detail=False, methods=['get'])
+    def agenda(self, request):
+        return self.conditional_response(lambda: Response(build_agenda(request.user)))
+
+    @action(detail=False, methods=['get'], url_path='managed-events', url_name='managed-events')
+    def managed_events(self, request):
+        events = Event.objects.managed_by(request.user).order_by('start_date', 'pk')
+        page = self.paginate_queryset(events)
+        # Two queries load the user's permissions on the whole page
+        prefetch_event_permissions(get_permission_checker(request), page)
+        serializer = ManagedEventSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'], url_path='calendar', url_name='calendar-link')
+    def calendar_link(self, request):
+        url = request.build_absolute_uri(reverse('me-calendar'))
+        return Response({'url': f"{url}?{urlencode({'token': feed_token(request.user)})}"})
+
+    def calendar(self, request):
+        """iCalendar feed of the sessions the user registered for, routed in urls.py."""
+        sessions = Session.objects.filter(attendees__attendee=request.user).order_by('start_time', 'pk')
+        return self.conditional_response(
+            lambda: stream_calendar(sessions, f'{request.user.username} sessions', request.get_host())
+        )
+
+
+class TokenRevokeView(TokenViewBase):
+    """
+    Log out by revoking a refresh token, and the current access token if given.
+
+    The tokens stop working on every worker within
+    REVOKED_TOKEN_SYNC_INTERVAL seconds, and on this one immediately.
+    """
+    serializer_class = TokenRevokeSerializer